@@ -0,0 +1,106 @@
+"""Зберігає результати pytest-benchmark як JSON-базу та порівнює з нею нові.
+
+    python -m text_editor.benchmarks.baseline save bench.json
+    python -m text_editor.benchmarks.baseline compare bench.json --threshold mean:10% --threshold min:25%
+"""
+import argparse
+import json
+import os
+import sys
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(__file__), "baselines", "core.json")
+DEFAULT_THRESHOLDS = ["mean:10%"]
+STAT_FIELDS = ("min", "max", "mean", "median", "stddev")
+
+
+def bench_name(fullname: str) -> str:
+    """Назва без каталогу: fullname залежить від rootdir, з якого запущено pytest."""
+    path, sep, test = fullname.partition("::")
+    return os.path.basename(path.replace("\\", "/")) + sep + test
+
+
+def load_stats(path: str) -> dict:
+    """Читає JSON pytest-benchmark (або збережену базу) як {назва: статистика}."""
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    return {
+        bench_name(bench["fullname"]): {field: bench["stats"][field] for field in STAT_FIELDS if field in bench["stats"]}
+        for bench in data.get("benchmarks", [])
+    }
+
+
+def save_baseline(results_path: str, baseline_path: str = DEFAULT_BASELINE) -> int:
+    """Зберігає базу разом з версією pytest-benchmark, якою її виміряно."""
+    stats = load_stats(results_path)
+    with open(results_path, 'r', encoding='utf-8') as f:
+        version = json.load(f).get("version")
+    os.makedirs(os.path.dirname(baseline_path) or ".", exist_ok=True)
+    benchmarks = [{"fullname": name, "stats": values} for name, values in sorted(stats.items())]
+    with open(baseline_path, 'w', encoding='utf-8') as f:
+        json.dump({"version": version, "benchmarks": benchmarks}, f, indent=2)
+    return len(benchmarks)
+
+
+def parse_threshold(text: str) -> tuple:
+    """"mean:10%" -> ("mean", 0.1)."""
+    field, _, value = text.partition(":")
+    if field not in STAT_FIELDS or not value:
+        raise ValueError(f"Invalid threshold: {text}")
+    try:
+        limit = float(value.rstrip("%")) / 100
+    except ValueError:
+        raise ValueError(f"Invalid threshold: {text}")
+    return field, limit
+
+
+def compare(baseline: dict, current: dict, thresholds: list) -> list:
+    """Повертає регресії: бенчмарки, що сповільнились понад поріг."""
+    regressions = []
+    for name, stats in sorted(current.items()):
+        base = baseline.get(name)
+        if base is None:
+            continue
+        for field, limit in thresholds:
+            if not base.get(field) or field not in stats:
+                continue
+            change = stats[field] / base[field] - 1
+            if change > limit:
+                regressions.append({
+                    "name": name, "field": field,
+                    "baseline": base[field], "current": stats[field], "change": change,
+                })
+    return regressions
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("action", choices=("save", "compare"))
+    parser.add_argument("results", help="JSON written by pytest --benchmark-json")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument("--threshold", action="append",
+                        help="field:percent allowed slowdown, e.g. mean:10%% (repeatable)")
+    args = parser.parse_args(argv)
+    if args.action == "save":
+        count = save_baseline(args.results, args.baseline)
+        print(f"Saved {count} benchmarks to {args.baseline}")
+        return 0
+    try:
+        thresholds = [parse_threshold(text) for text in args.threshold or DEFAULT_THRESHOLDS]
+    except ValueError as e:
+        print(e, file=sys.stderr)
+        return 2
+    baseline = load_stats(args.baseline)
+    current = load_stats(args.results)
+    regressions = compare(baseline, current, thresholds)
+    for regression in regressions:
+        print(f"{regression['name']}: {regression['field']} {regression['baseline'] * 1e6:.1f} us -> "
+              f"{regression['current'] * 1e6:.1f} us ({regression['change']:+.1%})")
+    missing = sorted(set(baseline) - set(current))
+    if missing:
+        print(f"{len(missing)} baseline benchmarks were not run", file=sys.stderr)
+    print(f"{len(current)} compared, {len(regressions)} regressions")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
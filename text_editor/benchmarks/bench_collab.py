@@ -0,0 +1,82 @@
+"""Пропускна здатність і збіжність спільного редагування в одному процесі.
+
+    python -m text_editor.benchmarks.bench_collab --clients 32 --edits 200
+
+Кожен симульований клієнт — окремий EditorFacade, підключений до
+CollabServer через локальний TCP; правки робляться у випадкових місцях
+між тактами. Після зупинки всі копії мають збігтися з текстом сервера.
+"""
+import argparse
+import asyncio
+import random
+import sys
+import time
+from text_editor.commands.command import EditCommand
+from text_editor.facade.editor_facade import EditorFacade
+from text_editor.services.collab import CollabClient, CollabServer
+
+
+def random_edit(facade: EditorFacade, rng: random.Random):
+    content = facade.get_content()
+    start = rng.randint(0, len(content))
+    end = min(len(content), start + rng.choice((0, 0, 1, 4)))
+    text = rng.choice(("", "a", "bc", "word ", "\n"))
+    if start != end or text:
+        facade.undo_redo.execute(EditCommand(facade.document, start, end, text))
+
+
+async def simulate(clients: int, edits: int, seed: int = 0, tick: float = 0.005, text: str = "") -> dict:
+    rng = random.Random(seed)
+    server = CollabServer(text, tick=tick)
+    host, port = await server.start()
+    peers = []
+    for _ in range(clients):
+        client = CollabClient(EditorFacade(), tick=tick)
+        await client.connect(host, port)
+        peers.append(client)
+    started = time.perf_counter()
+    for _ in range(edits):
+        for client in peers:
+            random_edit(client.facade, rng)
+        await asyncio.sleep(rng.choice((0, tick)))
+    for client in peers:
+        await client.wait_synced()
+    revision = server.revision
+    for client in peers:
+        await client.wait_synced(revision)
+    elapsed = time.perf_counter() - started
+    contents = {client.facade.get_content() for client in peers}
+    result = {
+        "clients": clients,
+        "edits": clients * edits,
+        "revisions": revision,
+        "seconds": elapsed,
+        "ops_per_second": clients * edits / elapsed if elapsed else 0.0,
+        "converged": contents == {server.text},
+        "length": len(server.text),
+    }
+    for client in peers:
+        await client.close()
+    await server.close()
+    return result
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--clients", type=int, nargs="+", default=[4, 16, 64])
+    parser.add_argument("--edits", type=int, default=100, help="edits per client")
+    parser.add_argument("--tick", type=float, default=0.005)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+    failed = False
+    print(f"{'clients':>8} {'edits':>8} {'revisions':>10} {'seconds':>8} {'ops/s':>10}  converged")
+    for clients in args.clients:
+        result = asyncio.run(simulate(clients, args.edits, args.seed, args.tick))
+        print(f"{result['clients']:>8} {result['edits']:>8} {result['revisions']:>10} "
+              f"{result['seconds']:>8.2f} {result['ops_per_second']:>10.0f}  {result['converged']}")
+        failed = failed or not result["converged"]
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,124 @@
+"""Бенчмарки гарячих шляхів ядра документа (pytest-benchmark).
+
+Файл не має префікса test_, тож звичайний запуск pytest його не збирає:
+
+    pytest text_editor/benchmarks/bench_core.py --benchmark-json bench.json
+    python -m text_editor.benchmarks.baseline compare bench.json --threshold mean:10%
+"""
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from text_editor.document.document import Document
+from text_editor.document.decorators import (
+    AutoSaveDecorator, ValidationDecorator, EncryptionDecorator,
+    StatisticsDecorator, create_decorator_chain
+)
+from text_editor.document.key_derivation import make_key_check
+from text_editor.commands.command import SetTextCommand
+from text_editor.commands.undo_redo import UndoRedoManager
+from text_editor.facade.editor_facade import EditorFacade
+
+SIZES = {"1KB": 1024, "1MB": 1024 ** 2, "50MB": 50 * 1024 ** 2}
+# Великі входи міряються меншою кількістю раундів
+ROUNDS = {"1KB": None, "1MB": 20, "50MB": 3}
+
+DECORATORS = {
+    "autosave": lambda doc: AutoSaveDecorator(doc, lambda content: None),
+    "validation": lambda doc: ValidationDecorator(doc, max(SIZES.values()) + 1),
+    "encryption": lambda doc: EncryptionDecorator(doc, "benchmark_key"),
+    "statistics": lambda doc: StatisticsDecorator(doc),
+}
+
+
+class _Observer:
+    def update(self, content: str):
+        pass
+
+
+def make_text(size: int) -> str:
+    line = "lorem ipsum dolor sit amet\n"
+    return (line * (size // len(line) + 1))[:size]
+
+
+@pytest.fixture(scope="module", params=list(SIZES))
+def sized_text(request):
+    return request.param, make_text(SIZES[request.param])
+
+
+def run(benchmark, label, func):
+    rounds = ROUNDS[label]
+    if rounds is None:
+        return benchmark(func)
+    return benchmark.pedantic(func, rounds=rounds, iterations=1, warmup_rounds=1)
+
+
+@pytest.mark.parametrize("observers", [0, 1, 10, 100])
+def test_document_set_with_observers(benchmark, observers):
+    document = Document()
+    for _ in range(observers):
+        document.attach(_Observer())
+    text = make_text(SIZES["1KB"])
+
+    def set_content():
+        document.content = text
+    benchmark(set_content)
+
+
+@pytest.mark.parametrize("step", ["execute", "undo", "redo"])
+def test_set_text_command(benchmark, step):
+    document = Document(make_text(SIZES["1KB"]))
+    manager = UndoRedoManager()
+    text = make_text(SIZES["1KB"] // 2)
+
+    def prepare():
+        command = SetTextCommand(document, text)
+        if step != "execute":
+            manager.execute(command)
+        if step == "redo":
+            manager.undo()
+        return (command,), {}
+
+    actions = {"execute": manager.execute, "undo": lambda command: manager.undo(),
+               "redo": lambda command: manager.redo()}
+    benchmark.pedantic(actions[step], setup=prepare, rounds=1000)
+
+
+@pytest.mark.parametrize("decorator", list(DECORATORS))
+def test_decorator_set(benchmark, decorator, sized_text):
+    label, text = sized_text
+    document = DECORATORS[decorator](Document())
+
+    def set_content():
+        document.content = text
+    run(benchmark, label, set_content)
+
+
+@pytest.mark.parametrize("decorator", list(DECORATORS))
+def test_decorator_get(benchmark, decorator, sized_text):
+    label, text = sized_text
+    document = DECORATORS[decorator](Document())
+    document.content = text
+    run(benchmark, label, lambda: document.content)
+
+
+def test_create_decorator_chain(benchmark):
+    metadata = [
+        {"type": "AutoSave", "enabled": True},
+        {"type": "Validation", "enabled": True, "max_length": 10000},
+        {"type": "Encryption", "enabled": True, "key_check": make_key_check("k")},
+        {"type": "Statistics", "enabled": True},
+    ]
+    benchmark(lambda: create_decorator_chain(Document(), metadata, lambda content: None, "k"))
+
+
+def test_facade_file_round_trip(benchmark, tmp_path, sized_text):
+    label, text = sized_text
+    facade = EditorFacade()
+    facade.set_content(text)
+    path = str(tmp_path / "bench.txt")
+
+    def round_trip():
+        facade.save_to_file(path)
+        facade.open_from_file(path)
+    run(benchmark, label, round_trip)
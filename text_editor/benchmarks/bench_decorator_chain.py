@@ -0,0 +1,51 @@
+"""Порівнює затримку set/get звичайного та скомпільованого ланцюжка декораторів.
+
+    python -m text_editor.benchmarks.bench_decorator_chain --depth 4 --size 10000
+"""
+import argparse
+import timeit
+from text_editor.document.document import Document
+from text_editor.document.decorators import (
+    AutoSaveDecorator, ValidationDecorator, EncryptionDecorator,
+    StatisticsDecorator, compile_decorator_chain
+)
+
+
+def build_chain(depth: int, max_length: int) -> Document:
+    document = Document()
+    layers = [
+        lambda doc: ValidationDecorator(doc, max_length),
+        lambda doc: EncryptionDecorator(doc, "benchmark_key"),
+        lambda doc: StatisticsDecorator(doc),
+        lambda doc: AutoSaveDecorator(doc, lambda content: None),
+    ]
+    for i in range(depth):
+        document = layers[i % len(layers)](document)
+    return document
+
+
+def measure(document: Document, text: str, number: int) -> dict:
+    def set_content():
+        document.content = text
+    set_time = timeit.timeit(set_content, number=number) / number
+    get_time = timeit.timeit(lambda: document.content, number=number) / number
+    return {"set_us": set_time * 1e6, "get_us": get_time * 1e6}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--depth", type=int, nargs="+", default=[4, 8, 16])
+    parser.add_argument("--size", type=int, default=10000)
+    parser.add_argument("--number", type=int, default=200)
+    args = parser.parse_args(argv)
+    text = ("lorem ipsum " * (args.size // 12 + 1))[:args.size]
+    print(f"{'depth':>5} {'mode':>9} {'set, us':>10} {'get, us':>10}")
+    for depth in args.depth:
+        chain = build_chain(depth, args.size * 2)
+        for mode, document in (("nested", chain), ("compiled", compile_decorator_chain(chain))):
+            result = measure(document, text, args.number)
+            print(f"{depth:>5} {mode:>9} {result['set_us']:>10.1f} {result['get_us']:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""Вимірює час імпорту модулів редактора через python -X importtime.
+
+    python -m text_editor.benchmarks.bench_startup --repeat 5 --max-ms 25
+
+Безголові модулі (фасад, документ, команди) не мають тягнути tkinter
+і рідко потрібні модулі; порушення завершує скрипт з кодом 1.
+"""
+import argparse
+import subprocess
+import sys
+
+HEADLESS_MODULES = (
+    "text_editor.facade.editor_facade",
+    "text_editor.document.decorators",
+    "text_editor.commands.undo_redo",
+)
+GUI_MODULES = ("text_editor.ui.editor_window",)
+# Модулі, які безголовий імпорт не повинен завантажувати
+DEFERRED = ("tkinter", "json", "datetime", "re", "typing", "hashlib", "concurrent.futures", "tracemalloc",
+            "html", "text_editor.document.formatters", "text_editor.document.html_format",
+            "text_editor.document.rtf_format", "difflib", "text_editor.services.file_watcher",
+            "text_editor.services.log_follower")
+
+_PROBE = "import sys; before = set(sys.modules); import {0}; print('\\n'.join(sorted(set(sys.modules) - before)))"
+
+
+def measure_import(module: str) -> tuple:
+    """Повертає (кумулятивний час імпорту в мс, множина нових модулів) у свіжому процесі."""
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _PROBE.format(module)],
+        capture_output=True, text=True, check=True,
+    )
+    cumulative = None
+    for line in completed.stderr.splitlines():
+        parts = line.split("|")
+        if len(parts) == 3 and parts[2].strip() == module:
+            cumulative = int(parts[1]) / 1000
+    return cumulative, set(completed.stdout.split())
+
+
+def deferred_violations(loaded: set) -> list:
+    return sorted(name for name in DEFERRED if name in loaded)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=3, help="runs per module; the best is reported")
+    parser.add_argument("--max-ms", type=float, help="fail if a headless module imports slower than this")
+    args = parser.parse_args(argv)
+    failed = False
+    print(f"{'module':<40} {'best, ms':>9} {'modules':>8}  deferred modules loaded")
+    for module in HEADLESS_MODULES + GUI_MODULES:
+        runs = [measure_import(module) for _ in range(max(args.repeat, 1))]
+        best = min(run[0] for run in runs)
+        loaded = runs[0][1]
+        headless = module in HEADLESS_MODULES
+        violations = deferred_violations(loaded) if headless else []
+        print(f"{module:<40} {best:>9.1f} {len(loaded):>8}  {', '.join(violations) or '-'}")
+        if violations or (headless and args.max_ms is not None and best > args.max_ms):
+            failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,199 @@
+import argparse
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import json
+import os
+import sys
+import time
+from text_editor.facade.editor_facade import EditorFacade
+from text_editor.document.document_factory import DocumentFactory
+from text_editor.document.decorators import (
+    StatisticsDecorator, create_decorator_chain,
+    collect_decorators_metadata, save_decorators_metadata
+)
+from text_editor.document.formatters import MarkdownFormatter
+from text_editor.document.key_derivation import make_key_check
+
+DECORATOR_NAMES = {
+    "validation": "Validation",
+    "encryption": "Encryption",
+    "statistics": "Statistics",
+}
+
+
+def build_decorators_metadata(names: list, max_length: int = 10000, key: str = "default_key", encryption_mode: str = "xor") -> list:
+    metadata = []
+    for name in names:
+        decorator_type = DECORATOR_NAMES.get(name)
+        if decorator_type is None:
+            raise ValueError(f"Unknown decorator: {name}")
+        info = {"type": decorator_type, "enabled": True}
+        if decorator_type == "Validation":
+            info["max_length"] = max_length
+        elif decorator_type == "Encryption":
+            info["mode"] = encryption_mode
+            # Один верифікатор на весь пакет: PBKDF2 не повторюється для кожного файлу
+            info["key_check"] = make_key_check(key)
+        metadata.append(info)
+    return metadata
+
+
+def collect_files(paths: list, extensions: tuple) -> list:
+    files = []
+    for path in paths:
+        if os.path.isfile(path):
+            files.append(path)
+            continue
+        for root, _, filenames in os.walk(path):
+            for name in sorted(filenames):
+                if name.lower().endswith(extensions):
+                    files.append(os.path.join(root, name))
+    return files
+
+
+def _innermost(document):
+    while hasattr(document, '_document'):
+        document = document._document
+    return document
+
+
+def _find_decorator(document, decorator_class):
+    while document is not None:
+        if isinstance(document, decorator_class):
+            return document
+        document = getattr(document, '_document', None)
+    return None
+
+
+def process_file(path: str, options: dict, base_dir: str = None) -> dict:
+    """Пропускає один файл через ланцюжок декораторів."""
+    result = {"path": path, "status": "ok"}
+    try:
+        facade = EditorFacade()
+        ext = os.path.splitext(path)[1].lower()
+        with open(path, 'r', encoding='utf-8') as f:
+            content = f.read()
+        if options.get("convert") and ext == ".md":
+            content = MarkdownFormatter().format(content)
+            ext = ".html"
+        doc = facade.factory.create_document("", filetype=ext)
+        facade.document = create_decorator_chain(
+            doc, options["decorators"], encryption_key=options.get("key")
+        )
+        facade.set_content(content)
+        result["chars"] = len(content)
+        statistics = _find_decorator(facade.document, StatisticsDecorator)
+        if statistics is not None:
+            result["statistics"] = statistics.get_statistics()
+        output_dir = options.get("output_dir")
+        if output_dir:
+            relative = os.path.relpath(path, base_dir or os.path.dirname(path))
+            output = os.path.join(output_dir, os.path.splitext(relative)[0] + ext)
+            os.makedirs(os.path.dirname(output) or ".", exist_ok=True)
+            with open(output, 'w', encoding='utf-8', newline='') as f:
+                f.write(_innermost(facade.document).content)
+            if options.get("save_metadata"):
+                save_decorators_metadata(output, collect_decorators_metadata(facade.document))
+            result["output"] = output
+    except (OSError, ValueError, UnicodeDecodeError) as e:
+        result["status"] = "error"
+        result["error"] = str(e)
+    return result
+
+
+def process_batch(tasks: list, options: dict) -> list:
+    return [process_file(path, options, base_dir) for path, base_dir in tasks]
+
+
+def run(files: list, options: dict, workers: int = None, chunk_size: int = 16, progress=None) -> dict:
+    """Обробляє файли пулом процесів, надсилаючи їх порціями по chunk_size.
+
+    files — список пар (шлях, базовий каталог для відносного шляху виводу).
+    """
+    start = time.perf_counter()
+    results = []
+    batches = [files[i:i + chunk_size] for i in range(0, len(files), chunk_size)]
+    if workers == 1:
+        for batch in batches:
+            results.extend(process_batch(batch, options))
+            if progress:
+                progress(len(results), len(files))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(process_batch, batch, options) for batch in batches]
+            for future in as_completed(futures):
+                results.extend(future.result())
+                if progress:
+                    progress(len(results), len(files))
+    elapsed = time.perf_counter() - start
+    results.sort(key=lambda r: r["path"])
+    failed = sum(1 for r in results if r["status"] != "ok")
+    return {
+        "total": len(results),
+        "succeeded": len(results) - failed,
+        "failed": failed,
+        "elapsed_seconds": round(elapsed, 3),
+        "files_per_second": round(len(results) / elapsed, 1) if elapsed else None,
+        "results": results,
+    }
+
+
+def _print_progress(done: int, total: int):
+    print(f"\r{done}/{total} files", end="" if done < total else "\n", file=sys.stderr, flush=True)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="text_editor.cli",
+        description="Headless batch processing of documents through decorator chains.",
+    )
+    parser.add_argument("paths", nargs="+", help="files or directories to process")
+    parser.add_argument("--decorators", default="",
+                        help="comma-separated list: validation,encryption,statistics")
+    parser.add_argument("--key", default="default_key", help="encryption key")
+    parser.add_argument("--encryption-mode", choices=("xor", "block"), default="xor",
+                        help="xor (legacy) or authenticated block cipher")
+    parser.add_argument("--max-length", type=int, default=10000, help="validation max length")
+    parser.add_argument("--convert", action="store_true", help="convert .md files to .html")
+    parser.add_argument("--output-dir", help="write processed documents here")
+    parser.add_argument("--save-metadata", action="store_true",
+                        help="store decorator metadata for written files")
+    parser.add_argument("--workers", type=int, default=None, help="process pool size")
+    parser.add_argument("--chunk-size", type=int, default=16, help="files per submitted task")
+    parser.add_argument("--summary", help="write JSON summary to this file instead of stdout")
+    parser.add_argument("--quiet", action="store_true", help="do not report progress")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    names = [name.strip().lower() for name in args.decorators.split(",") if name.strip()]
+    try:
+        decorators = build_decorators_metadata(names, args.max_length, args.key, args.encryption_mode)
+    except ValueError as e:
+        print(e, file=sys.stderr)
+        return 2
+    extensions = DocumentFactory().extensions()
+    files = []
+    for path in args.paths:
+        base_dir = path if os.path.isdir(path) else os.path.dirname(path)
+        files.extend((file_path, base_dir) for file_path in collect_files([path], extensions))
+    options = {
+        "decorators": decorators,
+        "key": args.key,
+        "convert": args.convert,
+        "output_dir": args.output_dir,
+        "save_metadata": args.save_metadata,
+    }
+    summary = run(files, options, args.workers, max(args.chunk_size, 1),
+                  None if args.quiet else _print_progress)
+    text = json.dumps(summary, indent=2, ensure_ascii=False)
+    if args.summary:
+        with open(args.summary, 'w', encoding='utf-8') as f:
+            f.write(text)
+    else:
+        print(text)
+    return 1 if summary["failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,6 +1,5 @@
-from typing import Protocol
-
-class Command(Protocol):
+class Command:
+    """Протокол команди (без typing.Protocol, щоб не сповільнювати імпорт)."""
     def execute(self):
         ...
     def undo(self):
@@ -14,4 +13,23 @@ class SetTextCommand:
     def execute(self):
         self.document.content = self.new_text
     def undo(self):
-        self.document.content = self.prev_text 
\ No newline at end of file
+        self.document.content = self.prev_text
+
+class EditCommand:
+    """Замінює ділянку [start:end] на text; зберігає лише змінені фрагменти."""
+    def __init__(self, document, start, end, text, removed=None):
+        self.document = document
+        self.start = start
+        self.end = end
+        self.text = text
+        self.removed = document.content[start:end] if removed is None else removed
+    def execute(self):
+        self.document.apply_edit(self.start, self.end, self.text)
+    def undo(self):
+        self.document.apply_edit(self.start, self.start + len(self.text), self.removed)
+
+class ReplaceAllCommand(SetTextCommand):
+    """Замінює всі збіги запиту одним присвоєнням і однією одиницею undo."""
+    def __init__(self, document, query, replacement):
+        super().__init__(document, None)
+        self.new_text, self.count = query.replace(self.prev_text, replacement)
@@ -16,6 +16,11 @@ class UndoRedoManager:
             command.undo()
             self._redo_stack.append(command)
 
+    def discard(self):
+        """Відкочує останню команду й прибирає її з історії (redo її не поверне)."""
+        if self._undo_stack:
+            self._undo_stack.pop().undo()
+
     def redo(self):
         if self._redo_stack:
             command = self._redo_stack.pop()
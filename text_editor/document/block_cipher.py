@@ -0,0 +1,194 @@
+import base64
+import hashlib
+import hmac
+import os
+from bisect import bisect_right
+
+HEADER = "AEAD1"
+NONCE_SIZE = 16
+
+
+class BlockCipher:
+    """Автентифіковане поблочне шифрування тексту лише засобами stdlib.
+
+    Текст ділиться на блоки до block_size символів. Кожен блок має власний
+    випадковий nonce, шифрується потоком SHAKE-256(ключ || nonce) і
+    захищається HMAC-SHA256 (encrypt-then-MAC). Порядок і кількість блоків
+    захищає HMAC заголовка над тегами всіх блоків.
+
+    Формат: рядок заголовка "AEAD1:<block_size>:<mac>", далі по рядку на
+    блок "<кількість символів>:<base64 тегу>:<base64(nonce + шифротекст)>".
+    Це дає змогу розшифрувати лише потрібні блоки й перешифрувати лише
+    змінені. Порожній збережений вміст вважається порожнім документом.
+    """
+
+    def __init__(self, key: str, block_size: int = 4096):
+        if block_size <= 0:
+            raise ValueError("Block size must be positive")
+        self.block_size = block_size
+        secret = key.encode('utf-8', 'surrogatepass')
+        self._enc_key = hmac.digest(secret, b"text_editor/encryption", 'sha256')
+        self._mac_key = hmac.digest(secret, b"text_editor/authentication", 'sha256')
+        self._parsed = None
+
+    # --- окремий блок ---
+
+    def _keystream_xor(self, nonce: bytes, data: bytes) -> bytes:
+        stream = hashlib.shake_256(self._enc_key + nonce).digest(len(data))
+        return (int.from_bytes(data, 'little') ^ int.from_bytes(stream, 'little')).to_bytes(len(data), 'little')
+
+    def _tag(self, nonce: bytes, length: int, ciphertext: bytes) -> bytes:
+        return hmac.digest(self._mac_key, nonce + length.to_bytes(8, 'big') + ciphertext, 'sha256')
+
+    def encrypt_block(self, text: str) -> str:
+        nonce = os.urandom(NONCE_SIZE)
+        ciphertext = self._keystream_xor(nonce, text.encode('utf-8', 'surrogatepass'))
+        tag = base64.b64encode(self._tag(nonce, len(text), ciphertext)).decode('ascii')
+        return f"{len(text)}:{tag}:{base64.b64encode(nonce + ciphertext).decode('ascii')}"
+
+    def decrypt_block(self, line: str) -> str:
+        length, tag, payload = line.split(":")
+        raw = base64.b64decode(payload)
+        nonce, ciphertext = raw[:NONCE_SIZE], raw[NONCE_SIZE:]
+        if not hmac.compare_digest(base64.b64decode(tag), self._tag(nonce, int(length), ciphertext)):
+            raise ValueError("Пошкоджений зашифрований блок")
+        return self._keystream_xor(nonce, ciphertext).decode('utf-8', 'surrogatepass')
+
+    # --- документ цілком ---
+
+    def _manifest_mac(self, lines, count: int = None) -> str:
+        count = len(lines) if count is None else count
+        mac = hmac.new(self._mac_key, f"{HEADER}:{self.block_size}:{count}".encode(), 'sha256')
+        for line in lines:
+            mac.update(line[:line.rindex(":")].encode('ascii'))
+        return mac.hexdigest()
+
+    def _build(self, lines: list) -> str:
+        header = f"{HEADER}:{self.block_size}:{self._manifest_mac(lines)}"
+        return "\n".join([header] + lines)
+
+    def split(self, text: str, even: bool = False) -> list:
+        """Ділить text на блоки; even=True робить їх рівними (після правок
+        блоки лишаються не меншими за половину block_size)."""
+        size = self.block_size
+        if even and text:
+            count = -(-len(text) // size)
+            size = -(-len(text) // count)
+        return [text[i:i + size] for i in range(0, len(text), size)]
+
+    def encrypt(self, text: str) -> str:
+        return self._build([self.encrypt_block(block) for block in self.split(text)])
+
+    def iter_encrypt(self, chunks):
+        """Потоковий encrypt: віддає той самий вміст порціями.
+
+        Заголовок з MAC над усіма блоками йде першим, тому зашифровані
+        рядки блоків спершу пишуться в тимчасовий файл, а не в пам'ять.
+        """
+        import tempfile
+        with tempfile.TemporaryFile('w+', encoding='ascii', newline='\n') as spool:
+            count = 0
+            for block in self._iter_blocks(chunks):
+                spool.write(self.encrypt_block(block) + "\n")
+                count += 1
+            spool.seek(0)
+            mac = self._manifest_mac((line.rstrip("\n") for line in spool), count)
+            yield f"{HEADER}:{self.block_size}:{mac}"
+            spool.seek(0)
+            for line in spool:
+                yield "\n" + line.rstrip("\n")
+
+    def _iter_blocks(self, chunks):
+        """Ріже порції на блоки по block_size символів, як split."""
+        size = self.block_size
+        pending = ""
+        for chunk in chunks:
+            pending += chunk
+            full = len(pending) - len(pending) % size
+            for start in range(0, full, size):
+                yield pending[start:start + size]
+            pending = pending[full:]
+        if pending:
+            yield pending
+
+    @staticmethod
+    def is_encrypted(content: str) -> bool:
+        return content.startswith(HEADER + ":")
+
+    def _parse(self, content: str):
+        """Розбирає і перевіряє заголовок; результат кешується за об'єктом рядка."""
+        if self._parsed is not None and self._parsed[0] is content:
+            return self._parsed[1], self._parsed[2]
+        header, _, body = content.partition("\n")
+        parts = header.split(":")
+        if len(parts) != 3 or parts[0] != HEADER:
+            raise ValueError("Неправильний пароль для розшифрування")
+        lines = body.split("\n") if body else []
+        if not hmac.compare_digest(parts[2], self._manifest_mac(lines)):
+            raise ValueError("Неправильний пароль для розшифрування")
+        offsets = [0]
+        for line in lines:
+            offsets.append(offsets[-1] + int(line[:line.index(":")]))
+        self._parsed = (content, lines, offsets)
+        return lines, offsets
+
+    def clear_cache(self):
+        self._parsed = None
+
+    def decrypt(self, content: str) -> str:
+        if not content:
+            return ""
+        lines, _ = self._parse(content)
+        return "".join(self.decrypt_block(line) for line in lines)
+
+    def iter_decrypt(self, content: str):
+        if not content:
+            return
+        lines, _ = self._parse(content)
+        for line in lines:
+            yield self.decrypt_block(line)
+
+    def length(self, content: str) -> int:
+        if not content:
+            return 0
+        return self._parse(content)[1][-1]
+
+    def read_range(self, content: str, start: int, end: int) -> str:
+        """Розшифровує лише блоки, що покривають символи [start, end)."""
+        if not content or start >= end:
+            return ""
+        lines, offsets = self._parse(content)
+        first = max(bisect_right(offsets, start) - 1, 0)
+        last = min(bisect_right(offsets, end - 1) - 1, len(lines) - 1)
+        text = "".join(self.decrypt_block(lines[i]) for i in range(first, last + 1))
+        return text[start - offsets[first]:end - offsets[first]]
+
+    def apply_edit(self, content: str, start: int, end: int, text: str) -> str:
+        """Замінює символи [start, end) і перешифровує лише зачеплені блоки."""
+        if not content:
+            lines, offsets = [], [0]
+        else:
+            lines, offsets = self._parse(content)
+        if not 0 <= start <= end <= offsets[-1]:
+            raise ValueError("Edit range is outside the document")
+        if not lines:
+            return self.encrypt(text)
+        first = min(bisect_right(offsets, start) - 1, len(lines) - 1)
+        last = max(min(bisect_right(offsets, end - 1) - 1, len(lines) - 1), first)
+        # Дрібні блоки після видалень зливаються з сусідом
+        if last + 1 < len(lines) and offsets[last + 1] - offsets[first] - (end - start) + len(text) < self.block_size // 2:
+            last += 1
+        old = "".join(self.decrypt_block(lines[i]) for i in range(first, last + 1))
+        base = offsets[first]
+        segment = old[:start - base] + text + old[end - base:]
+        new_lines = [self.encrypt_block(block) for block in self.split(segment, even=True)]
+        lines = lines[:first] + new_lines + lines[last + 1:]
+        shift = len(text) - (end - start)
+        offsets = offsets[:first + 1]
+        for line in new_lines:
+            offsets.append(offsets[-1] + int(line[:line.index(":")]))
+        offsets.extend(offset + shift for offset in self._parsed[2][last + 2:])
+        content = self._build(lines)
+        # Наступна правка не розбиратиме щойно зібраний вміст повторно
+        self._parsed = (content, lines, offsets)
+        return content
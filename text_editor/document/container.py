@@ -0,0 +1,197 @@
+"""Власний бінарний формат документа (.tedc).
+
+Файл складається із заголовка фіксованого розміру з таблицею секцій і
+чотирьох секцій:
+
+- descriptor — JSON: тип документа (розширення з DocumentFactory) і
+  метадані ланцюжка декораторів, тож окремий .meta-файл не потрібен;
+- stats — JSON зі статистикою, як у StatisticsDecorator, і розміром тексту;
+- index — кількість рядків, зсув початку кожного stride-го рядка в
+  тексті та зсуви стиснених блоків тіла;
+- body — UTF-8 текст, поділений на блоки по block_size байт, кожен
+  стиснений окремо (zlib, lzma або без стиснення).
+
+Заголовок, опис і статистика читаються без тіла; рядок n знаходиться
+через індекс, і розпаковуються лише блоки, де він лежить.
+"""
+import os
+import struct
+
+MAGIC = b"TEDC"
+FORMAT_VERSION = 1
+EXTENSION = ".tedc"
+COMPRESSIONS = ("none", "zlib", "lzma")
+# magic, версія, стиснення, резерв, stride, block_size, 4 x (зсув, довжина)
+_HEADER = struct.Struct("<4sHBBII8Q")
+_COUNTS = struct.Struct("<QQQ")
+
+
+def _compressor(compression: str):
+    """(compress, decompress, виняток пошкоджених даних) для назви стиснення."""
+    if compression == "zlib":
+        import zlib
+        return zlib.compress, zlib.decompress, zlib.error
+    if compression == "lzma":
+        import lzma
+        return lzma.compress, lzma.decompress, lzma.LZMAError
+    if compression == "none":
+        return bytes, bytes, ()
+    raise ValueError(f"Unknown compression: {compression}")
+
+
+def _statistics(content: str) -> dict:
+    return {
+        "char_count": len(content),
+        "word_count": len(content.split()) if content.strip() else 0,
+        "line_count": len(content.splitlines()) if content else 0,
+    }
+
+
+def write_container(path: str, content: str, filetype: str = ".txt", decorators: list = None,
+                    compression: str = "zlib", block_size: int = 65536, stride: int = 64):
+    """Записує content у контейнер; запис атомарний (через тимчасовий файл)."""
+    import json
+    from datetime import datetime
+    compress, _, _ = _compressor(compression)
+    if block_size <= 0 or stride <= 0:
+        raise ValueError("block_size and stride must be positive")
+    data = content.encode("utf-8")
+    descriptor = json.dumps({"filetype": filetype, "decorators": decorators or []}).encode("utf-8")
+    stats = _statistics(content)
+    stats["last_modified"] = datetime.now().isoformat()
+    stats["size"] = len(data)
+    stats = json.dumps(stats).encode("utf-8")
+
+    # Початки рядків: 0 і позиція після кожного \n; у індекс іде кожен stride-й
+    lines = data.split(b"\n")
+    line_count = len(lines) - (1 if not lines[-1] else 0)
+    starts = [0]
+    position = 0
+    for index in range(stride, line_count, stride):
+        position += sum(map(len, lines[index - stride:index])) + stride
+        starts.append(position)
+
+    blocks = [compress(data[start:start + block_size]) for start in range(0, len(data), block_size)]
+    block_offsets = []
+    offset = 0
+    for block in blocks:
+        block_offsets.append(offset)
+        offset += len(block)
+    index = _COUNTS.pack(line_count, len(starts), len(blocks)) + struct.pack(
+        f"<{len(starts) + len(blocks)}Q", *starts, *block_offsets)
+
+    sections = []
+    offset = _HEADER.size
+    for section in (descriptor, stats, index):
+        sections += [offset, len(section)]
+        offset += len(section)
+    sections += [offset, sum(len(block) for block in blocks)]
+    header = _HEADER.pack(MAGIC, FORMAT_VERSION, COMPRESSIONS.index(compression), 0, stride, block_size, *sections)
+
+    tmp_path = path + ".tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(header)
+        f.write(descriptor)
+        f.write(stats)
+        f.write(index)
+        for block in blocks:
+            f.write(block)
+    os.replace(tmp_path, path)
+
+
+def is_container(path: str) -> bool:
+    try:
+        with open(path, 'rb') as f:
+            return f.read(len(MAGIC)) == MAGIC
+    except OSError:
+        return False
+
+
+class ContainerReader:
+    """Читання контейнера: метадані одразу, текст — за потреби, по блоках."""
+
+    def __init__(self, path: str):
+        import json
+        self.path = path
+        self._file = open(path, 'rb')
+        try:
+            raw = self._file.read(_HEADER.size)
+            if len(raw) < _HEADER.size or raw[:len(MAGIC)] != MAGIC:
+                raise ValueError(f"Not a document container: {path}")
+            fields = _HEADER.unpack(raw)
+            if fields[1] > FORMAT_VERSION:
+                raise ValueError(f"Unsupported container version: {fields[1]}")
+            self.compression = COMPRESSIONS[fields[2]]
+            self.stride, self.block_size = fields[4], fields[5]
+            sections = fields[6:]
+            descriptor = json.loads(self._section(sections[0], sections[1]))
+            self.filetype = descriptor["filetype"]
+            self.decorators = descriptor["decorators"]
+            self.stats = json.loads(self._section(sections[2], sections[3]))
+            index = self._section(sections[4], sections[5])
+            self.line_count, starts, blocks = _COUNTS.unpack_from(index)
+            values = struct.unpack_from(f"<{starts + blocks}Q", index, _COUNTS.size)
+            self._line_starts = values[:starts]
+            self._block_offsets = values[starts:] + (sections[7],)
+            self._body = sections[6]
+        except (struct.error, KeyError, IndexError) as e:
+            self._file.close()
+            raise ValueError(f"Corrupted document container: {path}") from e
+        except BaseException:
+            self._file.close()
+            raise
+        _, self._decompress, self._decompress_error = _compressor(self.compression)
+        self._cached = (None, b"")
+
+    def _section(self, offset: int, length: int) -> bytes:
+        self._file.seek(offset)
+        data = self._file.read(length)
+        if len(data) != length:
+            raise ValueError(f"Truncated document container: {self.path}")
+        return data
+
+    def _block(self, number: int) -> bytes:
+        if self._cached[0] != number:
+            start, end = self._block_offsets[number], self._block_offsets[number + 1]
+            try:
+                data = self._decompress(self._section(self._body + start, end - start))
+            except self._decompress_error as e:
+                raise ValueError(f"Corrupted document container: {self.path}") from e
+            self._cached = (number, data)
+        return self._cached[1]
+
+    def lines(self, start: int, count: int = 1) -> list:
+        """Рядки [start, start + count) без символів \\n."""
+        if start < 0 or count < 0:
+            raise ValueError("start and count must be non-negative")
+        if start >= self.line_count or not count:
+            return []
+        anchor = start // self.stride
+        offset = self._line_starts[anchor]
+        skip = start - anchor * self.stride
+        block = offset // self.block_size
+        pending = self._block(block)[offset - block * self.block_size:]
+        wanted = skip + min(count, self.line_count - start)
+        # Читаємо блок за блоком, поки не набереться потрібна кількість рядків
+        while pending.count(b"\n") < wanted and block + 1 < len(self._block_offsets) - 1:
+            block += 1
+            pending += self._block(block)
+        return [line.decode("utf-8") for line in pending.split(b"\n")[skip:wanted]]
+
+    def line(self, number: int) -> str:
+        lines = self.lines(number, 1)
+        if not lines:
+            raise ValueError(f"Line {number} is out of range")
+        return lines[0]
+
+    def read(self) -> str:
+        return b"".join(self._block(number) for number in range(len(self._block_offsets) - 1)).decode("utf-8")
+
+    def close(self):
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
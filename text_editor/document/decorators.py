@@ -1,8 +1,28 @@
-from .document import Document
-import json
+from .document import ContentView, Document, Snapshot
+from .validation import ForbiddenWordsRule, changed_lines, check_lines, rules_from_metadata
 import os
-from datetime import datetime
-import re
+
+# json, datetime, re та криптографічні модулі імпортуються ліниво:
+# безголовим користувачам фасаду вони на старті не потрібні.
+
+def _now() -> str:
+    from datetime import datetime
+    return datetime.now().isoformat()
+
+def xor_cipher(text: str, key: str, offset: int = 0) -> str:
+    """XOR кожного символу з символом ключа; offset — позиція text у документі.
+
+    Символи обробляються одним буфером UTF-32 як одне велике ціле число,
+    без посимвольної конкатенації рядків.
+    """
+    if not text:
+        return ""
+    size = len(text)
+    shift = offset % len(key)
+    key_stream = (key[shift:] + key[:shift]) * (size // len(key) + 1)
+    text_bits = int.from_bytes(text.encode('utf-32-le', 'surrogatepass'), 'little')
+    key_bits = int.from_bytes(key_stream[:size].encode('utf-32-le', 'surrogatepass'), 'little')
+    return (text_bits ^ key_bits).to_bytes(4 * size, 'little').decode('utf-32-le', 'surrogatepass')
 
 class DocumentDecorator(Document):
     def __init__(self, document: Document):
@@ -16,11 +36,55 @@ class DocumentDecorator(Document):
     def content(self, value: str):
         self._document.content = value
 
+    @property
+    def lock(self):
+        # Увесь ланцюжок серіалізується на lock базового документа
+        return self._document.lock
+
+    def attach(self, observer):
+        self._document.attach(observer)
+
+    def detach(self, observer):
+        self._document.detach(observer)
+
+    @property
+    def version(self) -> int:
+        return self._document.version
+
+    def snapshot(self) -> Snapshot:
+        return self._document.snapshot()
+
+    def read_range(self, start: int, end: int) -> str:
+        return self._document.read_range(start, end)
+
+    def apply_edit(self, start: int, end: int, text: str):
+        # Правка йде крізь ланцюжок до шару, що вміє її застосувати без перескладання тексту
+        with self.lock:
+            self._document.apply_edit(start, end, text)
+            self._edited(start, end, text)
+
+    def _edited(self, start: int, end: int, text: str):
+        """Викликається після apply_edit; шари з власним станом перевизначають."""
+
+    def iter_read(self, chunk_size: int = 65536):
+        return self._document.iter_read(chunk_size)
+
+    def write_from(self, chunks):
+        self._document.write_from(chunks)
+
+    def release_caches(self):
+        self._document.release_caches()
+
     def get_metadata(self) -> dict:
         """Повертає метадані декоратора"""
         return {"type": self.__class__.__name__}
 
 class AutoSaveDecorator(DocumentDecorator):
+    """Викликає save_callback після кожного запису.
+
+    Після content і apply_edit колбек отримує текст, після потокового
+    write_from — ContentView, щоб не збирати вміст у пам'яті.
+    """
     def __init__(self, document: Document, save_callback):
         super().__init__(document)
         self.save_callback = save_callback
@@ -31,16 +95,30 @@ class AutoSaveDecorator(DocumentDecorator):
 
     @content.setter
     def content(self, value: str):
-        self._document.content = value
+        with self.lock:
+            self._document.content = value
+            self.save_callback(self._document.content)
+
+    def write_from(self, chunks):
+        with self.lock:
+            self._document.write_from(chunks)
+            self.save_callback(ContentView(self._document))
+
+    def _edited(self, start: int, end: int, text: str):
         self.save_callback(self._document.content)
 
     def get_metadata(self) -> dict:
         return {"type": "AutoSave", "enabled": True}
 
 class ValidationDecorator(DocumentDecorator):
-    def __init__(self, document: Document, max_length: int = 10000):
+    def __init__(self, document: Document, max_length: int = 10000, forbidden_words: list = None, rules: list = None):
         super().__init__(document)
         self.max_length = max_length
+        self.forbidden_words = list(forbidden_words or [])
+        self.rules = list(rules or [])
+        if self.forbidden_words:
+            self.rules.append(ForbiddenWordsRule(self.forbidden_words))
+        self._length = None
 
     @property
     def content(self) -> str:
@@ -48,55 +126,218 @@ class ValidationDecorator(DocumentDecorator):
 
     @content.setter
     def content(self, value: str):
-        if self._validate_content(value):
+        error = self._validation_error(value)
+        if error:
+            raise ValueError(f"Content validation failed: {error}")
+        with self.lock:
             self._document.content = value
-        else:
-            raise ValueError("Content validation failed")
+            self._length = len(value)
 
     def _validate_content(self, content: str) -> bool:
+        return self._validation_error(content) is None
+
+    def _validation_error(self, content: str):
         # Перевірка довжини
-        return len(content) <= self.max_length
+        if len(content) > self.max_length:
+            return f"longer than {self.max_length} characters"
+        return check_lines(self.rules, content) if self.rules else None
+
+    def apply_edit(self, start: int, end: int, text: str):
+        """Перевіряє правку до того, як буде зібрано новий вміст.
+
+        Довжина відстежується, тому перевищення ліміту відхиляється за O(1);
+        правила перевіряють лише рядки, яких торкнулася правка.
+        """
+        with self.lock:
+            if self._length is None:
+                self._length = len(self._document.content)
+            length = self._length - (end - start) + len(text)
+            if length > self.max_length:
+                raise ValueError(f"Content validation failed: longer than {self.max_length} characters")
+            if self.rules:
+                content = self._document.content
+                error = check_lines(self.rules, changed_lines(content, start, end, text))
+                if error:
+                    raise ValueError(f"Content validation failed: {error}")
+                self._document.content = content[:start] + text + content[end:]
+            else:
+                self._document.apply_edit(start, end, text)
+            self._length = length
+
+    def write_from(self, chunks):
+        with self.lock:
+            self._document.write_from(self._checked(chunks))
+            self._length = None
+
+    def release_caches(self):
+        self._length = None
+        self._document.release_caches()
+
+    def _checked(self, chunks):
+        # Довжина рахується наростаючим підсумком: запис переривається
+        # на першій порції, що перевищує ліміт; правила — на кожному
+        # завершеному рядку
+        length = 0
+        partial = ""
+        for chunk in chunks:
+            length += len(chunk)
+            if length > self.max_length:
+                raise ValueError(f"Content validation failed: longer than {self.max_length} characters")
+            if self.rules:
+                lines, _, partial = (partial + chunk).rpartition("\n")
+                error = check_lines(self.rules, lines) if lines else None
+                if error:
+                    raise ValueError(f"Content validation failed: {error}")
+            yield chunk
+        error = check_lines(self.rules, partial) if self.rules and partial else None
+        if error:
+            raise ValueError(f"Content validation failed: {error}")
 
     def get_metadata(self) -> dict:
-        return {
+        metadata = {
             "type": "Validation", 
             "enabled": True, 
-            "max_length": self.max_length
+            "max_length": self.max_length,
+            "forbidden_words": self.forbidden_words,
         }
+        for rule in self.rules:
+            if rule.name != "forbidden_words":
+                metadata[rule.name] = rule.get_metadata()
+        return metadata
 
 class EncryptionDecorator(DocumentDecorator):
+    """Шифрує вміст ключем.
+
+    mode="xor" — початковий XOR-шифр з MAGIC-префіксом, зворотно сумісний.
+    mode="block" — автентифіковані блоки (див. BlockCipher): читання
+    діапазону розшифровує лише потрібні блоки, правка — перешифровує
+    лише змінені, підміна чи пошкодження виявляються.
+
+    key_check — запис із метаданих (сіль і верифікатор PBKDF2): з ним
+    неправильний пароль відхиляється ще до читання вмісту.
+    """
     MAGIC = "MAGIC:"
-    def __init__(self, document: Document, key: str = "default_key"):
+    MODES = ("xor", "block")
+    def __init__(self, document: Document, key: str = "default_key", mode: str = "xor", block_size: int = 4096,
+                 key_check: dict = None, key_cache=None):
+        if mode not in self.MODES:
+            raise ValueError(f"Unknown encryption mode: {mode}")
+        if key_check:
+            from .key_derivation import check_key
+        if key_check and not check_key(key, key_check, key_cache):
+            raise ValueError("Неправильний пароль для розшифрування")
         super().__init__(document)
         self.key = key
+        self.key_check = key_check
+        self._key_cache = key_cache
+        self.mode = mode
+        self.block_size = block_size
+        self._cipher = None
+        self._plain_snapshot = None
+        if mode == "block":
+            from .block_cipher import BlockCipher
+            self._cipher = BlockCipher(key, block_size)
 
     @property
     def content(self) -> str:
-        encrypted_content = self._document.content
+        return self._plain(self._document.content)
+
+    def _plain(self, encrypted_content: str) -> str:
+        if self._cipher is not None:
+            return self._cipher.decrypt(encrypted_content)
         decrypted = self._decrypt(encrypted_content)
         if not decrypted.startswith(self.MAGIC):
             raise ValueError("Неправильний пароль для розшифрування")
         return decrypted[len(self.MAGIC):]
 
+    def snapshot(self) -> Snapshot:
+        """Розшифрований знімок; розшифровується раз на версію."""
+        encrypted = self._document.snapshot()
+        plain = self._plain_snapshot
+        if plain is None or plain.version != encrypted.version:
+            plain = Snapshot(encrypted.version, self._plain(encrypted.content))
+            self._plain_snapshot = plain
+        return plain
+
     @content.setter
     def content(self, value: str):
+        if self._cipher is not None:
+            self._document.content = self._cipher.encrypt(value)
+            return
         value_with_magic = self.MAGIC + value
         encrypted_value = self._encrypt(value_with_magic)
         self._document.content = encrypted_value
 
     def _encrypt(self, text: str) -> str:
         # Простий XOR шифр
-        encrypted = ""
-        for i, char in enumerate(text):
-            key_char = self.key[i % len(self.key)]
-            encrypted += chr(ord(char) ^ ord(key_char))
-        return encrypted
+        return xor_cipher(text, self.key)
 
     def _decrypt(self, text: str) -> str:
         return self._encrypt(text)
 
+    def read_range(self, start: int, end: int) -> str:
+        if self._cipher is not None:
+            return self._cipher.read_range(self._document.content, start, end)
+        return self.content[start:end]
+
+    def apply_edit(self, start: int, end: int, text: str):
+        with self.lock:
+            if self._cipher is not None:
+                self._document.content = self._cipher.apply_edit(self._document.content, start, end, text)
+            else:
+                # Шифротекст XOR зсувається разом із правкою, тож текст збирається заново
+                Document.apply_edit(self, start, end, text)
+
+    def iter_read(self, chunk_size: int = 65536):
+        if self._cipher is not None:
+            # Блоки розшифровуються по одному; chunk_size тут не застосовується
+            yield from self._cipher.iter_decrypt(self._document.content)
+            return
+        position = 0
+        pending = ""
+        for chunk in self._document.iter_read(chunk_size):
+            decrypted = xor_cipher(chunk, self.key, position)
+            position += len(chunk)
+            if pending is not None:
+                pending += decrypted
+                if len(pending) < len(self.MAGIC):
+                    continue
+                if not pending.startswith(self.MAGIC):
+                    raise ValueError("Неправильний пароль для розшифрування")
+                decrypted, pending = pending[len(self.MAGIC):], None
+            if decrypted:
+                yield decrypted
+        if pending is not None:
+            raise ValueError("Неправильний пароль для розшифрування")
+
+    def write_from(self, chunks):
+        if self._cipher is not None:
+            self._document.write_from(self._cipher.iter_encrypt(chunks))
+        else:
+            self._document.write_from(self._encrypted(chunks))
+
+    def release_caches(self):
+        self._plain_snapshot = None
+        if self._cipher is not None:
+            self._cipher.clear_cache()
+        self._document.release_caches()
+
+    def _encrypted(self, chunks):
+        yield xor_cipher(self.MAGIC, self.key)
+        position = len(self.MAGIC)
+        for chunk in chunks:
+            yield xor_cipher(chunk, self.key, position)
+            position += len(chunk)
+
     def get_metadata(self) -> dict:
-        return {"type": "Encryption", "enabled": True, "key": self.key}
+        if self.key_check is None:
+            from .key_derivation import make_key_check
+            self.key_check = make_key_check(self.key, cache=self._key_cache)
+        # Сам ключ у метадані не потрапляє: для перевірки пароля досить верифікатора
+        metadata = {"type": "Encryption", "enabled": True, "mode": self.mode, "key_check": self.key_check}
+        if self._cipher is not None:
+            metadata["block_size"] = self.block_size
+        return metadata
 
 class StatisticsDecorator(DocumentDecorator):
     def __init__(self, document: Document):
@@ -114,14 +355,49 @@ class StatisticsDecorator(DocumentDecorator):
 
     @content.setter
     def content(self, value: str):
-        self._document.content = value
-        self._update_stats(value)
+        with self.lock:
+            self._document.content = value
+            self._update_stats(value)
 
     def _update_stats(self, content: str):
         self.stats['char_count'] = len(content)
         self.stats['word_count'] = len(content.split()) if content.strip() else 0
         self.stats['line_count'] = len(content.splitlines()) if content else 0
-        self.stats['last_modified'] = datetime.now().isoformat()
+        self.stats['last_modified'] = _now()
+
+    def apply_edit(self, start: int, end: int, text: str):
+        """Статистика оновлюється за змінену ділянку, а не за весь текст.
+
+        Ділянка береться з одним незмінним символом з кожного боку, тож слова
+        й кінці рядків \\r\\n на межі правки не рахуються двічі.
+        """
+        with self.lock:
+            if self.stats['last_modified'] is None:
+                # Статистику ще не пораховано повністю — нема що оновлювати
+                self._document.apply_edit(start, end, text)
+                self._update_stats(self._document.content)
+                return
+            length = self.stats['char_count']
+            left, right = max(start - 1, 0), min(end + 1, length)
+            old_words, old_breaks = _words_and_breaks(self._document.read_range(left, right))
+            old_trailing = _trailing_line(self._document.read_range(length - 1, length))
+            self._document.apply_edit(start, end, text)
+            length += len(text) - (end - start)
+            new_words, new_breaks = _words_and_breaks(
+                self._document.read_range(left, right + len(text) - (end - start)))
+            self.stats['char_count'] = length
+            self.stats['word_count'] += new_words - old_words
+            self.stats['line_count'] += (new_breaks - old_breaks
+                                         + _trailing_line(self._document.read_range(length - 1, length))
+                                         - old_trailing)
+            self.stats['last_modified'] = _now()
+
+    def write_from(self, chunks):
+        counter = _RunningStatistics()
+        with self.lock:
+            self._document.write_from(counter.feed(chunks))
+            self.stats.update(counter.result())
+            self.stats['last_modified'] = _now()
 
     def get_statistics(self) -> dict:
         return self.stats.copy()
@@ -129,12 +405,60 @@ class StatisticsDecorator(DocumentDecorator):
     def get_metadata(self) -> dict:
         return {"type": "Statistics", "enabled": True}
 
+_LINE_BREAK = r"\r\n|[\n\r\v\f\x1c\x1d\x1e\x85\u2028\u2029]"
+
+def _words_and_breaks(text: str) -> tuple:
+    import re
+    return len(text.split()), len(re.findall(_LINE_BREAK, text))
+
+def _trailing_line(last_char: str) -> int:
+    """1, якщо останній рядок не закінчується кінцем рядка (як у splitlines)."""
+    import re
+    return 1 if last_char and not re.match(_LINE_BREAK, last_char) else 0
+
+class _RunningStatistics:
+    """Рахує символи, слова й рядки порціями так само, як _update_stats."""
+    def __init__(self):
+        import re
+        self._line_break = re.compile(_LINE_BREAK)
+        self.chars = 0
+        self.words = 0
+        self.breaks = 0
+        self.last_char = ""
+
+    def feed(self, chunks):
+        for chunk in chunks:
+            if chunk:
+                self._count(chunk)
+            yield chunk
+
+    def _count(self, chunk: str):
+        words = len(chunk.split())
+        # Слово, розірване межею порцій, не рахуємо двічі
+        if self.last_char and not self.last_char.isspace() and not chunk[0].isspace():
+            words -= 1
+        self.words += words
+        self.breaks += len(self._line_break.findall(chunk))
+        if self.last_char == "\r" and chunk[0] == "\n":
+            self.breaks -= 1
+        self.chars += len(chunk)
+        self.last_char = chunk[-1]
+
+    def result(self) -> dict:
+        trailing = 1 if self.last_char and not self._line_break.match(self.last_char) else 0
+        return {
+            'char_count': self.chars,
+            'word_count': self.words,
+            'line_count': self.breaks + trailing,
+        }
+
 def save_decorators_metadata(file_path: str, decorators_metadata: list):
     """Зберігає метадані декораторів у JSON файл в D:\Documents\Data"""
     metadata_dir = "D:\\Documents\\Data"
     os.makedirs(metadata_dir, exist_ok=True)
     
     import hashlib
+    import json
     file_hash = hashlib.md5(file_path.encode()).hexdigest()
     metadata_file = os.path.join(metadata_dir, f"{file_hash}.meta")
     
@@ -149,6 +473,7 @@ def load_decorators_metadata(file_path: str) -> list:
     """Завантажує метадані декораторів з JSON файлу в D:\Documents\Data"""
     metadata_dir = "D:\\Documents\\Data"
     import hashlib
+    import json
     file_hash = hashlib.md5(file_path.encode()).hexdigest()
     metadata_file = os.path.join(metadata_dir, f"{file_hash}.meta")
     
@@ -171,6 +496,7 @@ def cleanup_orphaned_metadata():
     if not os.path.exists(metadata_dir):
         return
     
+    import json
     for filename in os.listdir(metadata_dir):
         if filename.endswith('.meta'):
             metadata_file = os.path.join(metadata_dir, filename)
@@ -185,7 +511,112 @@ def cleanup_orphaned_metadata():
             except Exception as e:
                 print(f"Error processing metadata file {filename}: {e}")
 
-def create_decorator_chain(document: Document, decorators_metadata: list, save_callback=None, encryption_key=None):
+class CompiledDocument(Document):
+    """Ланцюжок декораторів, сплющений в один об'єкт.
+
+    Замість проходу крізь кожен шар через властивості зберігає готові
+    списки етапів запису та читання; шари, що лише передають значення
+    далі (читання Validation, Statistics, AutoSave), пропускаються.
+    Стан вихідних декораторів (статистика, ключ) лишається спільним.
+    Шифрування в режимі "block" не сплющується і стає цільовим документом.
+    """
+
+    def __init__(self, chain: Document):
+        self.source = chain
+        self._write_stages = []
+        self._post_stages = []
+        self._read_stages = []
+        current = chain
+        while type(current) in _COMPILERS and getattr(current, 'mode', "xor") == "xor":
+            _COMPILERS[type(current)](self, current)
+            current = current._document
+        self._target = current
+        self._read_stages.reverse()
+
+    def _compile_validation(self, decorator):
+        def validate(value):
+            error = decorator._validation_error(value)
+            if error:
+                raise ValueError(f"Content validation failed: {error}")
+            return value
+        self._write_stages.append(validate)
+
+    def _compile_encryption(self, decorator):
+        magic = decorator.MAGIC
+        self._write_stages.append(lambda value: xor_cipher(magic + value, decorator.key))
+        def decrypt(value):
+            decrypted = xor_cipher(value, decorator.key)
+            if not decrypted.startswith(magic):
+                raise ValueError("Неправильний пароль для розшифрування")
+            return decrypted[len(magic):]
+        self._read_stages.append(decrypt)
+
+    def _compile_statistics(self, decorator):
+        self._write_stages.append(None)
+        self._post_stages.append((len(self._write_stages) - 1, decorator._update_stats))
+
+    def _compile_autosave(self, decorator):
+        self._write_stages.append(None)
+        self._post_stages.append((len(self._write_stages) - 1, lambda value: decorator.save_callback(value)))
+
+    def _compile_passthrough(self, decorator):
+        pass
+
+    @property
+    def content(self) -> str:
+        value = self._target.content
+        for stage in self._read_stages:
+            value = stage(value)
+        return value
+
+    @content.setter
+    def content(self, value: str):
+        values = []
+        for stage in self._write_stages:
+            values.append(value)
+            if stage is not None:
+                value = stage(value)
+        with self.source.lock:
+            self._target.content = value
+            for index, action in reversed(self._post_stages):
+                action(values[index])
+
+    @property
+    def version(self) -> int:
+        return self.source.version
+
+    def attach(self, observer):
+        self.source.attach(observer)
+
+    def detach(self, observer):
+        self.source.detach(observer)
+
+    def snapshot(self) -> Snapshot:
+        return self.source.snapshot()
+
+    def get_metadata(self) -> dict:
+        return self.source.get_metadata()
+
+    def __getattr__(self, name):
+        if name == 'source':
+            raise AttributeError(name)
+        return getattr(self.source, name)
+
+_COMPILERS = {
+    DocumentDecorator: CompiledDocument._compile_passthrough,
+    ValidationDecorator: CompiledDocument._compile_validation,
+    EncryptionDecorator: CompiledDocument._compile_encryption,
+    StatisticsDecorator: CompiledDocument._compile_statistics,
+    AutoSaveDecorator: CompiledDocument._compile_autosave,
+}
+
+def compile_decorator_chain(document: Document) -> Document:
+    """Повертає сплющену версію ланцюжка або сам документ, якщо шарів немає."""
+    if isinstance(document, CompiledDocument) or type(document) not in _COMPILERS:
+        return document
+    return CompiledDocument(document)
+
+def create_decorator_chain(document: Document, decorators_metadata: list, save_callback=None, encryption_key=None, compiled=False, key_cache=None):
     """Створює ланцюжок декораторів на основі метадані"""
     decorated_doc = document
     
@@ -199,19 +630,29 @@ def create_decorator_chain(document: Document, decorators_metadata: list, save_c
             decorated_doc = AutoSaveDecorator(decorated_doc, save_callback)
         elif decorator_type == "Validation":
             max_length = decorator_info.get("max_length", 10000)
-            decorated_doc = ValidationDecorator(decorated_doc, max_length)
+            rules = [rule for rule in rules_from_metadata(decorator_info) if rule.name != "forbidden_words"]
+            decorated_doc = ValidationDecorator(
+                decorated_doc, max_length, decorator_info.get("forbidden_words"), rules
+            )
         elif decorator_type == "Encryption":
-            key = encryption_key or decorator_info.get("key", "default_key")
-            decorated_doc = EncryptionDecorator(decorated_doc, key)
+            if not encryption_key:
+                raise ValueError("Encryption key is required to open an encrypted document")
+            decorated_doc = EncryptionDecorator(
+                decorated_doc, encryption_key,
+                decorator_info.get("mode", "xor"), decorator_info.get("block_size", 4096),
+                decorator_info.get("key_check"), key_cache
+            )
         elif decorator_type == "Statistics":
             decorated_doc = StatisticsDecorator(decorated_doc)
     
+    if compiled:
+        return compile_decorator_chain(decorated_doc)
     return decorated_doc
 
 def collect_decorators_metadata(document) -> list:
     """Збирає метадані з ланцюжка декораторів"""
     metadata = []
-    current_doc = document
+    current_doc = document.source if isinstance(document, CompiledDocument) else document
     
     while hasattr(current_doc, '_document'):
         if hasattr(current_doc, 'get_metadata'):
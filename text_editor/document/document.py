@@ -1,14 +1,64 @@
-from typing import List, Protocol
+import os
+import threading
 from .observer import DocumentObserver
 
-class Observer(Protocol):
+class Observer:
+    """Протокол спостерігача: будь-який об'єкт з методом update(content).
+
+    Звичайний клас замість typing.Protocol, щоб не імпортувати typing на старті.
+    """
     def update(self, content: str):
         ...
 
+class Snapshot:
+    """Незмінний знімок вмісту документа з номером версії.
+
+    Версія монотонно зростає з кожним записом, тому фоновий обробник
+    перевіряє застарілість порівнянням чисел: snapshot.version != document.version.
+    """
+    __slots__ = ("version", "content")
+
+    def __init__(self, version: int, content: str):
+        object.__setattr__(self, "version", version)
+        object.__setattr__(self, "content", content)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Snapshot is immutable")
+
+    def __repr__(self):
+        return f"Snapshot(version={self.version}, length={len(self.content)})"
+
+class ContentView:
+    """Лінивий погляд на вміст документа: нічого не читає, доки не попросять.
+
+    AutoSaveDecorator передає його в save_callback після потокового запису,
+    щоб отримувач міг записати вміст порціями (iter_read), а не тримати
+    весь текст у пам'яті. str(view) повертає вміст цілком.
+    """
+    __slots__ = ("document",)
+
+    def __init__(self, document):
+        self.document = document
+
+    def iter_read(self, chunk_size: int = 65536):
+        return self.document.iter_read(chunk_size)
+
+    def __str__(self):
+        return self.document.content
+
 class Document:
+    """Документ у пам'яті з моделлю конкурентного доступу.
+
+    Записи серіалізуються на lock (RLock, тож декоратори й спостерігачі
+    можуть писати повторно з того ж потоку). Читачі з інших потоків беруть
+    snapshot() без блокування: знімок публікується одним присвоєнням
+    посилання, а рядки в Python незмінні.
+    """
     def __init__(self, content: str = ""):
         self._content = content
-        self._observers: List[Observer] = []
+        self._observers: list = []
+        self.lock = threading.RLock()
+        self._snapshot = Snapshot(0, content)
 
     def attach(self, observer: Observer):
         self._observers.append(observer)
@@ -26,5 +76,123 @@ class Document:
 
     @content.setter
     def content(self, value: str):
-        self._content = value
-        self.notify() 
\ No newline at end of file
+        with self.lock:
+            self._content = value
+            self._snapshot = Snapshot(self._snapshot.version + 1, value)
+            self.notify()
+
+    @property
+    def version(self) -> int:
+        return self._snapshot.version
+
+    def snapshot(self) -> Snapshot:
+        """Поточний знімок; не блокується записами."""
+        return self._snapshot
+
+    def unload(self, snapshot: Snapshot):
+        """Звільняє вміст з пам'яті без нової версії і сповіщень (вивантаження документа).
+
+        snapshot — знімок поточної версії з тим самим вмістом, що читає його
+        звідкись ще (наприклад, з диска): читачі знімків різниці не бачать.
+        """
+        with self.lock:
+            if snapshot.version != self._snapshot.version:
+                raise ValueError("Snapshot does not match the document version")
+            self._content = ""
+            self._snapshot = snapshot
+
+    def restore_content(self, content: str):
+        """Повертає вміст, звільнений unload; версія не змінюється."""
+        with self.lock:
+            self._content = content
+            self._snapshot = Snapshot(self._snapshot.version, content)
+
+    def apply_edit(self, start: int, end: int, text: str):
+        """Замінює content[start:end] на text."""
+        with self.lock:
+            content = self.content
+            self.content = content[:start] + text + content[end:]
+
+    def read_range(self, start: int, end: int) -> str:
+        """Повертає content[start:end]."""
+        return self.content[start:end]
+
+    def iter_read(self, chunk_size: int = 65536):
+        """Віддає вміст порціями по chunk_size символів."""
+        content = self.content
+        for start in range(0, len(content), chunk_size):
+            yield content[start:start + chunk_size]
+
+    def write_from(self, chunks):
+        """Записує вміст з ітератора порцій."""
+        self.content = "".join(chunks)
+
+    def release_caches(self):
+        """Звільняє кеші, похідні від вмісту (перед вивантаженням документа)."""
+
+
+class FileDocument(Document):
+    """Документ, вміст якого живе у файлі, а не в пам'яті.
+
+    Потокові iter_read/write_from працюють з постійним обсягом пам'яті;
+    запис іде у тимчасовий файл і замінює оригінал лише після успіху.
+    Знімок читає файл під lock, тож не перетинається із заміною файлу.
+    """
+    def __init__(self, path: str, encoding: str = "utf-8"):
+        self.path = path
+        self.encoding = encoding
+        self._observers: list = []
+        self.lock = threading.RLock()
+        self._version = 0
+
+    def notify(self):
+        if self._observers:
+            super().notify()
+
+    @property
+    def _content(self) -> str:
+        return self.content
+
+    @property
+    def content(self) -> str:
+        if not os.path.exists(self.path):
+            return ""
+        with open(self.path, 'r', encoding=self.encoding, newline='') as f:
+            return f.read()
+
+    @content.setter
+    def content(self, value: str):
+        self.write_from([value])
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    def snapshot(self) -> Snapshot:
+        with self.lock:
+            return Snapshot(self._version, self.content)
+
+    def iter_read(self, chunk_size: int = 65536):
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, 'r', encoding=self.encoding, newline='') as f:
+            while True:
+                chunk = f.read(chunk_size)
+                if not chunk:
+                    break
+                yield chunk
+
+    def write_from(self, chunks):
+        tmp_path = self.path + ".tmp"
+        with self.lock:
+            try:
+                with open(tmp_path, 'w', encoding=self.encoding, newline='') as f:
+                    for chunk in chunks:
+                        f.write(chunk)
+            except BaseException:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                raise
+            os.replace(tmp_path, self.path)
+            self._version += 1
+            self.notify()
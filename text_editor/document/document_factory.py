@@ -1,4 +1,5 @@
 from .document import Document
+from .formats import registry as default_registry
 
 class TxtDocument(Document):
     pass
@@ -13,15 +14,29 @@ class HtmlDocument(Document):
     pass
 
 class DocumentFactory:
-    _doc_types = {
-        ".txt": TxtDocument,
-        ".md": MdDocument,
-        ".rtf": RtfDocument,
-        ".html": HtmlDocument,
-    }
+    """Створює документи за типом файлу через реєстр форматів.
+
+    Класи документів і обробники форматів реєструються рядками
+    "модуль:атрибут" і імпортуються під час першого використання.
+    """
+    def __init__(self, registry=None):
+        self.registry = registry or default_registry
 
     def create_document(self, content: str = "", filetype: str = ".txt") -> Document:
-        doc_class = self._doc_types.get(filetype)
-        if not doc_class:
-            raise ValueError(f"Unsupported file type: {filetype}")
-        return doc_class(content) 
\ No newline at end of file
+        return self.registry.for_extension(filetype).create("document", content)
+
+    def extensions(self) -> tuple:
+        return self.registry.extensions()
+
+    def detect_filetype(self, path: str = None, head: bytes = None) -> str:
+        """Тип файлу за сигнатурою вмісту, розширенням або евристикою."""
+        return self.registry.detect(path, head).extensions[0]
+
+    def filetype_of(self, document) -> str:
+        """Розширення типу базового документа під ланцюжком декораторів."""
+        while hasattr(document, "_document"):
+            document = document._document
+        for handler in self.registry.handlers():
+            if handler.provides("document", type(document)):
+                return handler.extensions[0]
+        return ".txt"
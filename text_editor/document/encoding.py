@@ -0,0 +1,201 @@
+"""Визначення кодування й стилю рядків та потокове перекодування файлів.
+
+Кодування визначається лише за першими HEAD_SIZE байтами: BOM, розподіл
+нульових байтів (UTF-16/32 без BOM), оголошення формату (meta charset,
+\\ansicpg), перевірка UTF-8. Решта файлу читається блоками через
+інкрементний декодер, а записується інкрементним кодером, тож обидва
+проходи лінійні і тримають у пам'яті лише один блок байтів.
+"""
+import codecs
+import os
+import re
+
+HEAD_SIZE = 8192
+CHUNK_SIZE = 65536
+
+_BOMS = (
+    (codecs.BOM_UTF32_LE, "utf-32-le"),
+    (codecs.BOM_UTF32_BE, "utf-32-be"),
+    (codecs.BOM_UTF8, "utf-8"),
+    (codecs.BOM_UTF16_LE, "utf-16-le"),
+    (codecs.BOM_UTF16_BE, "utf-16-be"),
+)
+_BOM_BYTES = {encoding: bom for bom, encoding in _BOMS}
+_NEWLINE = re.compile(r"\r\n|\r|\n")
+# Запасні кодування, якщо вгадане не підійшло далі в файлі
+_FALLBACKS = ("cp1252", "latin-1")
+
+
+class TextFormat:
+    """Кодування, наявність BOM і стиль кінця рядка файлу."""
+
+    __slots__ = ("encoding", "bom", "newline")
+
+    def __init__(self, encoding: str = "utf-8", bom: bool = False, newline: str = "\n"):
+        encoding = codecs.lookup(encoding).name
+        if bom and encoding not in _BOM_BYTES:
+            raise ValueError(f"Encoding {encoding} has no byte order mark")
+        if newline not in ("\n", "\r\n", "\r"):
+            raise ValueError(f"Unsupported newline: {newline!r}")
+        self.encoding = encoding
+        self.bom = bom
+        self.newline = newline
+
+    def __eq__(self, other):
+        return (isinstance(other, TextFormat)
+                and (self.encoding, self.bom, self.newline) == (other.encoding, other.bom, other.newline))
+
+    def __repr__(self):
+        return f"TextFormat({self.encoding!r}, bom={self.bom}, newline={self.newline!r})"
+
+
+def byte_order_mark(encoding: str) -> bytes:
+    """BOM кодування (порожній рядок для кодувань без BOM)."""
+    return _BOM_BYTES.get(codecs.lookup(encoding).name, b"")
+
+
+def _zero_pattern(head: bytes):
+    """UTF-16/32 без BOM: нульові старші байти ASCII-символів стоять на сталих позиціях."""
+    sample = head[:len(head) - len(head) % 4]
+    if len(sample) < 4 or b"\x00" not in sample:
+        return None
+    units = len(sample) // 4
+    zeros = [sample[offset::4].count(0) / units for offset in range(4)]
+    # У UTF-32 два старші байти нульові для всієї BMP, не лише для латиниці
+    if min(zeros[2:]) > 0.9 and zeros[0] < 0.5:
+        return "utf-32-le"
+    if min(zeros[:2]) > 0.9 and zeros[3] < 0.5:
+        return "utf-32-be"
+    even, odd = (zeros[0] + zeros[2]) / 2, (zeros[1] + zeros[3]) / 2
+    # Навіть у нелатинському тексті пробіли й кінці рядків дають нулі з одного боку
+    if odd > 0.01 and even <= odd / 20:
+        return "utf-16-le"
+    if even > 0.01 and odd <= even / 20:
+        return "utf-16-be"
+    return None
+
+
+def _decodes(head: bytes, encoding: str) -> bool:
+    try:
+        # final=False: обрізана в кінці head послідовність не є помилкою
+        codecs.getincrementaldecoder(encoding)().decode(head, final=False)
+        return True
+    except UnicodeDecodeError:
+        return False
+
+
+def detect_encoding(head: bytes, declared=None) -> tuple:
+    """Кодування за початком файлу; повертає (кодування, bom, впевнено).
+
+    declared — detect_encoding обробника формату (див. FormatHandler) або
+    None. "Впевнено" означає BOM, нульові байти чи оголошення у файлі, з
+    яким початок файлу справді декодується; інакше кодування вгадане і
+    може бути замінене під час читання.
+    """
+    for bom, encoding in _BOMS:
+        if head.startswith(bom):
+            return encoding, True, True
+    encoding = _zero_pattern(head)
+    if encoding:
+        return encoding, False, True
+    if declared is not None:
+        try:
+            encoding = declared(head)
+            if encoding and _decodes(head, encoding):
+                return codecs.lookup(encoding).name, False, True
+        except LookupError:
+            pass
+    if _decodes(head, "utf-8"):
+        return "utf-8", False, False
+    try:
+        head.decode("cp1252")
+        return "cp1252", False, False
+    except UnicodeDecodeError:
+        return "latin-1", False, False
+
+
+class TextDecoder:
+    """Інкрементний декодер, що зводить \\r\\n і \\r до \\n.
+
+    newline — перший знайдений стиль кінця рядка (None, поки не трапився).
+    """
+
+    def __init__(self, encoding: str, errors: str = "strict"):
+        self._decoder = codecs.getincrementaldecoder(encoding)(errors)
+        self._carry = ""
+        self.newline = None
+
+    def decode(self, data: bytes, final: bool = False) -> str:
+        text = self._carry + self._decoder.decode(data, final)
+        self._carry = ""
+        # \r в кінці блоку може бути початком \r\n з наступного
+        if not final and text.endswith("\r"):
+            self._carry, text = "\r", text[:-1]
+        if self.newline is None:
+            match = _NEWLINE.search(text)
+            if match:
+                self.newline = match.group()
+        if "\r" in text:
+            text = text.replace("\r\n", "\n").replace("\r", "\n")
+        return text
+
+
+def iter_decode(f, decoder: TextDecoder, chunk_size: int = CHUNK_SIZE):
+    """Декодує бінарний потік до кінця блоками по chunk_size байт."""
+    while True:
+        data = f.read(chunk_size)
+        text = decoder.decode(data, final=not data)
+        if text:
+            yield text
+        if not data:
+            break
+
+
+def read_text(path: str, declared=None, chunk_size: int = CHUNK_SIZE) -> tuple:
+    """Читає текстовий файл у будь-якому кодуванні; повертає (текст, TextFormat)."""
+    with open(path, 'rb') as f:
+        head = f.read(HEAD_SIZE)
+        encoding, bom, certain = detect_encoding(head, declared)
+        candidates = (encoding,) if certain else (encoding,) + tuple(e for e in _FALLBACKS if e != encoding)
+        for candidate in candidates:
+            f.seek(len(byte_order_mark(candidate)) if bom else 0)
+            decoder = TextDecoder(candidate)
+            try:
+                text = "".join(iter_decode(f, decoder, chunk_size))
+            except UnicodeDecodeError:
+                # Вгадане кодування не підійшло далі в файлі: ще один лінійний прохід
+                if candidate == candidates[-1]:
+                    raise
+                continue
+            return text, TextFormat(candidate, bom, decoder.newline or "\n")
+
+
+def write_text(path: str, content: str, text_format: TextFormat = None, chunk_size: int = CHUNK_SIZE) -> int:
+    """Записує content у кодуванні й зі стилем рядків text_format; запис атомарний.
+
+    Повертає кількість записаних байтів.
+    """
+    text_format = text_format or TextFormat()
+    encoder = codecs.getincrementalencoder(text_format.encoding)()
+    tmp_path = path + ".tmp"
+    size = 0
+    try:
+        with open(tmp_path, 'wb') as f:
+            if text_format.bom:
+                size += f.write(_BOM_BYTES[text_format.encoding])
+            for start in range(0, len(content), chunk_size):
+                chunk = content[start:start + chunk_size]
+                if text_format.newline != "\n":
+                    chunk = chunk.replace("\n", text_format.newline)
+                size += f.write(encoder.encode(chunk))
+            size += f.write(encoder.encode("", final=True))
+    except UnicodeEncodeError as e:
+        os.remove(tmp_path)
+        raise ValueError(f"Content cannot be saved in {text_format.encoding}: "
+                         f"{e.object[e.start:e.end]!r}") from None
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    os.replace(tmp_path, path)
+    return size
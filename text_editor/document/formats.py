@@ -0,0 +1,177 @@
+"""Реєстр форматів документів з лінивим завантаженням обробників.
+
+Формат описується розширеннями, сигнатурами вмісту і точками входу —
+рядками "модуль:атрибут", як entry points у пакетах. Модуль обробника
+імпортується лише під час першого звернення до нього, тож відкриття
+.txt не тягне за собою розбір RTF чи HTML.
+"""
+import importlib
+import os
+
+_BOMS = (b"\xef\xbb\xbf", b"\xff\xfe", b"\xfe\xff")
+_MARKDOWN_STARTS = (b"# ", b"## ", b"### ", b"```", b"~~~", b"- ", b"* ", b"+ ", b"> ", b"1. ", b"|")
+
+
+def load_entry_point(reference: str):
+    """Імпортує об'єкт за рядком "пакет.модуль:атрибут"."""
+    module_name, _, attribute = reference.partition(":")
+    obj = importlib.import_module(module_name)
+    for part in filter(None, attribute.split(".")):
+        obj = getattr(obj, part)
+    return obj
+
+
+def looks_like_markdown(head: bytes) -> bool:
+    """Евристика для вмісту без розширення: кілька рядків з розміткою Markdown."""
+    lines = head.splitlines()[:50]
+    if lines and lines[0].startswith(b"# "):
+        return True
+    marked = sum(1 for line in lines if line.lstrip().startswith(_MARKDOWN_STARTS) or b"](" in line)
+    return marked >= 2
+
+
+class FormatHandler:
+    """Формат документа: розширення, сигнатури вмісту й ліниві точки входу.
+
+    Ролі точок входу: document — клас документа, lexer — клас лексера
+    підсвічування, renderer — TextFormatter для перегляду, encoding —
+    detect_encoding(data: bytes) -> str | None, sniff — sniff(head: bytes)
+    -> bool для вмісту без явної сигнатури.
+    """
+
+    def __init__(self, name: str, extensions, signatures=(), **entry_points):
+        self.name = name
+        self.extensions = tuple(extension.lower() for extension in extensions)
+        self.signatures = tuple(signature.lower() for signature in signatures)
+        self.entry_points = entry_points
+        self._loaded = {}
+
+    def has(self, role: str) -> bool:
+        return role in self.entry_points
+
+    def loaded(self, role: str) -> bool:
+        return role in self._loaded
+
+    def load(self, role: str):
+        if role not in self._loaded:
+            reference = self.entry_points.get(role)
+            if reference is None:
+                raise ValueError(f"Format {self.name} has no {role} handler")
+            self._loaded[role] = load_entry_point(reference)
+        return self._loaded[role]
+
+    def create(self, role: str, *args, **kwargs):
+        return self.load(role)(*args, **kwargs)
+
+    def provides(self, role: str, cls) -> bool:
+        """Чи є cls обробником ролі, не імпортуючи його модуль."""
+        if role in self._loaded:
+            return self._loaded[role] is cls
+        return self.entry_points.get(role) == f"{cls.__module__}:{cls.__qualname__}"
+
+    def detect_encoding(self, data: bytes):
+        return self.load("encoding")(data) if self.has("encoding") else None
+
+    def has_signature(self, head: bytes) -> bool:
+        sample = head[:512]
+        for bom in _BOMS:
+            if sample.startswith(bom):
+                sample = sample[len(bom):]
+                break
+        sample = sample.lstrip()[:64].lower()
+        return any(sample.startswith(signature) for signature in self.signatures)
+
+
+class FormatRegistry:
+    """Обробники форматів за назвою та розширенням."""
+
+    def __init__(self, default: str = "txt"):
+        self.default = default
+        self._handlers = {}
+        self._extensions = {}
+
+    def register(self, handler: FormatHandler, replace: bool = False) -> FormatHandler:
+        if not replace:
+            if handler.name in self._handlers:
+                raise ValueError(f"Format is already registered: {handler.name}")
+            taken = [extension for extension in handler.extensions if extension in self._extensions]
+            if taken:
+                raise ValueError(f"Extension is already registered: {taken[0]}")
+        if handler.name in self._handlers:
+            self.unregister(handler.name)
+        self._handlers[handler.name] = handler
+        for extension in handler.extensions:
+            self._extensions[extension] = handler
+        return handler
+
+    def unregister(self, name: str):
+        handler = self._handlers.pop(name)
+        for extension in handler.extensions:
+            if self._extensions.get(extension) is handler:
+                del self._extensions[extension]
+
+    def get(self, name: str) -> FormatHandler:
+        try:
+            return self._handlers[name]
+        except KeyError:
+            raise ValueError(f"Unknown format: {name}") from None
+
+    def handlers(self) -> list:
+        return list(self._handlers.values())
+
+    def extensions(self) -> tuple:
+        return tuple(self._extensions)
+
+    def for_extension(self, extension: str) -> FormatHandler:
+        handler = self._extensions.get(extension.lower())
+        if handler is None:
+            raise ValueError(f"Unsupported file type: {extension}")
+        return handler
+
+    def _by_signature(self, head: bytes):
+        return next((handler for handler in self._handlers.values() if handler.has_signature(head)), None)
+
+    def _by_heuristic(self, head: bytes):
+        return next((handler for handler in self._handlers.values()
+                     if handler.has("sniff") and handler.load("sniff")(head)), None)
+
+    def sniff(self, head: bytes):
+        """Формат за вмістом: спершу сигнатури, потім евристики; None, якщо не впізнано."""
+        return self._by_signature(head) or self._by_heuristic(head)
+
+    def detect(self, filename: str = None, head: bytes = None) -> FormatHandler:
+        """Формат файлу: сигнатура вмісту, потім розширення, потім евристики, потім типовий."""
+        handler = self._by_signature(head) if head else None
+        if handler is None and filename:
+            handler = self._extensions.get(os.path.splitext(filename)[1].lower())
+        if handler is None and head:
+            handler = self._by_heuristic(head)
+        return handler or self._handlers[self.default]
+
+
+registry = FormatRegistry()
+registry.register(FormatHandler(
+    "txt", [".txt"],
+    document="text_editor.document.document_factory:TxtDocument",
+    renderer="text_editor.document.formatters:PlainTextFormatter",
+))
+registry.register(FormatHandler(
+    "md", [".md"],
+    document="text_editor.document.document_factory:MdDocument",
+    lexer="text_editor.document.lexers:MarkdownLexer",
+    renderer="text_editor.document.formatters:MarkdownFormatter",
+    sniff="text_editor.document.formats:looks_like_markdown",
+))
+registry.register(FormatHandler(
+    "rtf", [".rtf"], signatures=[b"{\\rtf"],
+    document="text_editor.document.document_factory:RtfDocument",
+    renderer="text_editor.document.rtf_format:RtfTextFormatter",
+    encoding="text_editor.document.rtf_format:detect_encoding",
+))
+registry.register(FormatHandler(
+    "html", [".html"], signatures=[b"<!doctype html", b"<html"],
+    document="text_editor.document.document_factory:HtmlDocument",
+    lexer="text_editor.document.html_format:HtmlLexer",
+    renderer="text_editor.document.html_format:HtmlTextFormatter",
+    encoding="text_editor.document.html_format:detect_encoding",
+))
@@ -0,0 +1,133 @@
+from abc import ABC, abstractmethod
+import html
+import re
+
+_FENCES = ("```", "~~~")
+_HEADING = re.compile(r"(#{1,6})(?:\s+(.*?))?\s*#*\s*$")
+_LIST_ITEM = re.compile(r"\s*(?:([-*+])|(\d+)[.)])\s+(.*)$")
+_INLINE_CODE = re.compile(r"`([^`]+)`")
+_BOLD = re.compile(r"\*\*(.+?)\*\*")
+_ITALIC = re.compile(r"__(.+?)__")
+
+
+class TextFormatter(ABC):
+    @abstractmethod
+    def format(self, text: str) -> str:
+        pass
+
+
+class PlainTextFormatter(TextFormatter):
+    def format(self, text: str) -> str:
+        return text
+
+
+def _line_end(text: str, pos: int) -> int:
+    end = text.find("\n", pos)
+    return len(text) if end == -1 else end + 1
+
+
+def _is_block_start(line: str) -> bool:
+    stripped = line.strip()
+    return (
+        not stripped
+        or stripped.startswith(_FENCES)
+        or _HEADING.match(stripped) is not None
+        or _LIST_ITEM.match(line) is not None
+    )
+
+
+def iter_markdown_blocks(text: str, pos: int = 0):
+    """Розбиває Markdown на блоки, що суцільно покривають текст.
+
+    Повертає кортежі (start, kind, block_text). Кожен блок розбирається з
+    верхнього рівня, тому однаковий текст завжди дає однакові блоки.
+    """
+    n = len(text)
+    while pos < n:
+        start = pos
+        end = _line_end(text, pos)
+        line = text[pos:end]
+        stripped = line.strip()
+        if not stripped:
+            kind = "blank"
+            while end < n and not text[end:_line_end(text, end)].strip():
+                end = _line_end(text, end)
+        elif stripped.startswith(_FENCES):
+            kind = "code"
+            fence = stripped[:3]
+            while end < n:
+                next_end = _line_end(text, end)
+                closing = text[end:next_end].strip()
+                end = next_end
+                if closing.startswith(fence) and not closing.strip(fence[0]):
+                    break
+        elif _HEADING.match(stripped):
+            kind = "heading"
+        elif _LIST_ITEM.match(line):
+            kind = "list"
+            while end < n:
+                next_end = _line_end(text, end)
+                next_line = text[end:next_end]
+                if not next_line.strip():
+                    break
+                if not (_LIST_ITEM.match(next_line) or next_line[:1] in (" ", "\t")):
+                    break
+                end = next_end
+        else:
+            kind = "paragraph"
+            while end < n:
+                next_end = _line_end(text, end)
+                if _is_block_start(text[end:next_end]):
+                    break
+                end = next_end
+        pos = end
+        yield start, kind, text[start:end]
+
+
+def _render_inline(text: str) -> str:
+    result = html.escape(text, quote=False)
+    result = _INLINE_CODE.sub(r"<code>\1</code>", result)
+    result = _BOLD.sub(r"<b>\1</b>", result)
+    return _ITALIC.sub(r"<i>\1</i>", result)
+
+
+class MarkdownFormatter(TextFormatter):
+    """Перетворює Markdown у HTML, обробляючи кожен блок окремо."""
+
+    def format(self, text: str) -> str:
+        return "".join(
+            self.format_block(kind, block) for _, kind, block in iter_markdown_blocks(text)
+        )
+
+    def format_block(self, kind: str, block: str) -> str:
+        if kind == "blank":
+            return ""
+        if kind == "heading":
+            match = _HEADING.match(block.strip())
+            level = len(match.group(1))
+            return f"<h{level}>{_render_inline(match.group(2) or '')}</h{level}>\n"
+        if kind == "code":
+            lines = block.splitlines()
+            fence = lines[0].strip()[:3]
+            lang = lines[0].strip()[3:].strip()
+            body = lines[1:]
+            if body and body[-1].strip().startswith(fence):
+                body = body[:-1]
+            attr = f' class="language-{html.escape(lang)}"' if lang else ""
+            code = html.escape("\n".join(body), quote=False)
+            return f"<pre><code{attr}>{code}</code></pre>\n"
+        if kind == "list":
+            items = []
+            ordered = False
+            for i, line in enumerate(block.splitlines()):
+                match = _LIST_ITEM.match(line)
+                if match:
+                    if i == 0:
+                        ordered = match.group(2) is not None
+                    items.append(match.group(3))
+                elif items:
+                    items[-1] += " " + line.strip()
+            tag = "ol" if ordered else "ul"
+            body = "".join(f"<li>{_render_inline(item)}</li>\n" for item in items)
+            return f"<{tag}>\n{body}</{tag}>\n"
+        return f"<p>{_render_inline(block.strip())}</p>\n"
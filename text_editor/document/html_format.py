@@ -0,0 +1,110 @@
+"""Підтримка HTML: лексер підсвічування, визначення кодування і текстовий вигляд.
+
+Модуль завантажується реєстром форматів лише під час першого звернення до HTML.
+"""
+import codecs
+import re
+from html.parser import HTMLParser
+from .formatters import TextFormatter
+from .lexers import Lexer
+
+_HTML_TEXT = re.compile(r"<!--|</?[A-Za-z!][^\s>/]*|&#?\w+;")
+_HTML_TAG = re.compile(r">|/>|\"[^\"]*\"?|'[^']*'?|[\w:-]+(?=\s*=)")
+_META_CHARSET = re.compile(rb"""<meta[^>]+charset\s*=\s*["']?\s*([\w.:-]+)""", re.I)
+_BLOCK_TAGS = {"p", "div", "br", "li", "tr", "h1", "h2", "h3", "h4", "h5", "h6", "pre", "blockquote", "table"}
+
+
+class HtmlLexer(Lexer):
+    def tokenize(self, line: str, state):
+        tokens = []
+        pos, n = 0, len(line)
+        while pos < n:
+            if state == "comment":
+                end = line.find("-->", pos)
+                if end == -1:
+                    tokens.append((pos, n, "comment"))
+                    return tokens, state
+                tokens.append((pos, end + 3, "comment"))
+                pos, state = end + 3, None
+            elif state == "tag":
+                match = _HTML_TAG.search(line, pos)
+                if not match:
+                    return tokens, state
+                token = match.group()
+                if token in (">", "/>"):
+                    tokens.append((match.start(), match.end(), "tag"))
+                    state = None
+                elif token[0] in "\"'":
+                    tokens.append((match.start(), match.end(), "string"))
+                else:
+                    tokens.append((match.start(), match.end(), "attribute"))
+                pos = match.end()
+            else:
+                match = _HTML_TEXT.search(line, pos)
+                if not match:
+                    break
+                token = match.group()
+                if token == "<!--":
+                    end = line.find("-->", match.end())
+                    if end == -1:
+                        tokens.append((match.start(), n, "comment"))
+                        return tokens, "comment"
+                    tokens.append((match.start(), end + 3, "comment"))
+                    pos = end + 3
+                    continue
+                if token[0] == "&":
+                    tokens.append((match.start(), match.end(), "entity"))
+                else:
+                    tokens.append((match.start(), match.end(), "tag"))
+                    state = "tag"
+                pos = match.end()
+        return tokens, state
+
+
+def detect_encoding(data: bytes):
+    """Кодування з BOM або <meta charset> у перших 4 КіБ; None, якщо не вказано."""
+    if data.startswith(codecs.BOM_UTF8):
+        return "utf-8-sig"
+    if data.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+        return "utf-16"
+    match = _META_CHARSET.search(data[:4096])
+    if not match:
+        return None
+    try:
+        return codecs.lookup(match.group(1).decode("ascii")).name
+    except LookupError:
+        return None
+
+
+class _TextExtractor(HTMLParser):
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.parts = []
+        self._skip = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag in ("script", "style"):
+            self._skip += 1
+        elif tag in _BLOCK_TAGS:
+            self.parts.append("\n")
+
+    def handle_endtag(self, tag):
+        if tag in ("script", "style"):
+            self._skip = max(self._skip - 1, 0)
+        elif tag in _BLOCK_TAGS:
+            self.parts.append("\n")
+
+    def handle_data(self, data):
+        if not self._skip:
+            self.parts.append(data)
+
+
+class HtmlTextFormatter(TextFormatter):
+    """Показує HTML як текст: без тегів, скриптів і стилів, блоки з нового рядка."""
+
+    def format(self, text: str) -> str:
+        parser = _TextExtractor()
+        parser.feed(text)
+        parser.close()
+        lines = [" ".join(line.split()) for line in "".join(parser.parts).splitlines()]
+        return "\n".join(line for line in lines if line)
@@ -0,0 +1,68 @@
+import hashlib
+import hmac
+import os
+from collections import OrderedDict
+
+KDF_ITERATIONS = 100_000
+
+
+def derive_key(password: str, salt: bytes, iterations: int = KDF_ITERATIONS) -> bytes:
+    return hashlib.pbkdf2_hmac('sha256', password.encode('utf-8', 'surrogatepass'), salt, iterations)
+
+
+class KeyCache:
+    """Кеш сесії: похідні ключі за (пароль, сіль) і паролі за шляхом документа.
+
+    Повторне відкриття файлу не питає пароль і не повторює дорогий PBKDF2.
+    """
+
+    def __init__(self, max_size: int = 64):
+        self.max_size = max_size
+        self._derived = OrderedDict()
+        self._passwords = {}
+
+    def derive(self, password: str, salt: bytes, iterations: int = KDF_ITERATIONS) -> bytes:
+        cache_key = (password, salt, iterations)
+        derived = self._derived.get(cache_key)
+        if derived is None:
+            derived = derive_key(password, salt, iterations)
+            self._derived[cache_key] = derived
+            if len(self._derived) > self.max_size:
+                self._derived.popitem(last=False)
+        else:
+            self._derived.move_to_end(cache_key)
+        return derived
+
+    def remember(self, path: str, password: str):
+        self._passwords[os.path.abspath(path)] = password
+
+    def password_for(self, path: str):
+        return self._passwords.get(os.path.abspath(path))
+
+    def forget(self, path: str):
+        self._passwords.pop(os.path.abspath(path), None)
+
+    def clear(self):
+        self._derived.clear()
+        self._passwords.clear()
+
+
+session_keys = KeyCache()
+
+
+def make_key_check(password: str, iterations: int = KDF_ITERATIONS, cache: KeyCache = None) -> dict:
+    """Створює запис для перевірки пароля: сіль, кількість ітерацій і верифікатор."""
+    salt = os.urandom(16)
+    derived = (cache or session_keys).derive(password, salt, iterations)
+    return {"salt": salt.hex(), "iterations": iterations, "verifier": derived.hex()}
+
+
+def check_key(password: str, key_check: dict, cache: KeyCache = None) -> bool:
+    """Перевіряє пароль за O(1) відносно розміру документа."""
+    try:
+        salt = bytes.fromhex(key_check["salt"])
+        iterations = int(key_check["iterations"])
+        verifier = bytes.fromhex(key_check["verifier"])
+    except (KeyError, TypeError, ValueError):
+        raise ValueError("Invalid key check record")
+    return hmac.compare_digest((cache or session_keys).derive(password, salt, iterations), verifier)
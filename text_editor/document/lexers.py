@@ -0,0 +1,119 @@
+import re
+
+_MD_FENCES = ("```", "~~~")
+_MD_HEADING = re.compile(r"#{1,6}(\s|$)")
+_MD_LIST = re.compile(r"\s*(?:[-*+]|\d+[.)])(?=\s)")
+_MD_INLINE = re.compile(r"`[^`]+`|\*\*.+?\*\*|__.+?__")
+
+
+class Lexer:
+    """Порядковий лексер, що може продовжити роботу з будь-якого рядка.
+
+    tokenize повертає список (start, end, tag) для рядка та стан лексера
+    на початку наступного рядка.
+    """
+    initial_state = None
+
+    def tokenize(self, line: str, state):
+        return [], state
+
+
+class MarkdownLexer(Lexer):
+    def tokenize(self, line: str, state):
+        stripped = line.strip()
+        if state is not None:
+            if stripped.startswith(state) and not stripped.strip(state[0]):
+                state = None
+            return [(0, len(line), "code")], state
+        if stripped.startswith(_MD_FENCES):
+            return [(0, len(line), "code")], stripped[:3]
+        if _MD_HEADING.match(stripped):
+            return [(0, len(line), "heading")], None
+        tokens = []
+        match = _MD_LIST.match(line)
+        if match:
+            tokens.append((match.end() - 1, match.end(), "list"))
+        for match in _MD_INLINE.finditer(line):
+            token = match.group()
+            tag = "code" if token[0] == "`" else "bold" if token[0] == "*" else "italic"
+            tokens.append((match.start(), match.end(), tag))
+        return tokens, None
+
+
+def lexer_for_filetype(filetype: str):
+    """Повертає лексер для типу файлу або None, якщо підсвічування немає.
+
+    Клас лексера береться з реєстру форматів і імпортується під час першого
+    запиту, тож лексер HTML не завантажується, поки не відкрито HTML.
+    """
+    from .formats import registry
+    try:
+        return registry.for_extension(filetype).create("lexer")
+    except ValueError:
+        return None
+
+
+def __getattr__(name):
+    # Зворотна сумісність: HtmlLexer переїхав до html_format
+    if name == "HtmlLexer":
+        from .html_format import HtmlLexer
+        return HtmlLexer
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+class LineStateCache:
+    """Зберігає стан лексера на початку кожного рядка.
+
+    Після правки рядки перелексовуються, доки обчислений стан не збіжиться
+    зі збереженим; далі кеш залишається дійсним.
+    """
+
+    def __init__(self, lexer: Lexer, line_count: int = 1):
+        self.lexer = lexer
+        self.reset(line_count)
+
+    def reset(self, line_count: int):
+        self._states = [self.lexer.initial_state] + [None] * (max(line_count, 1) - 1)
+        self._dirty = 1
+        self._edit_end = len(self._states)
+
+    @property
+    def line_count(self) -> int:
+        return len(self._states)
+
+    @property
+    def done(self) -> bool:
+        return self._dirty >= len(self._states)
+
+    def state_at(self, line: int):
+        return self._states[line]
+
+    def edit(self, line: int, removed: int, inserted: int):
+        """Враховує правку: у рядку line removed переносів замінено на inserted."""
+        self._states[line + 1:line + 1 + removed] = [None] * inserted
+        if self._edit_end > line + removed:
+            self._edit_end += inserted - removed
+        self._edit_end = max(self._edit_end, line + inserted + 1)
+        self._dirty = min(self._dirty, line + 1)
+
+    def relex(self, get_line, budget: int = None) -> bool:
+        """Перелексовує щонайбільше budget рядків; повертає True, якщо кеш дійсний."""
+        states = self._states
+        steps = 0
+        while self._dirty < len(states):
+            if budget is not None and steps >= budget:
+                return False
+            line = self._dirty - 1
+            _, state = self.lexer.tokenize(get_line(line), states[line])
+            if self._dirty >= self._edit_end and states[self._dirty] == state:
+                self._dirty = len(states)
+                break
+            states[self._dirty] = state
+            self._dirty += 1
+            steps += 1
+        self._edit_end = 0
+        return True
+
+    def tokens(self, line: int, text: str) -> list:
+        tokens, _ = self.lexer.tokenize(text, self._states[line])
+        return tokens
@@ -0,0 +1,109 @@
+from bisect import bisect_right
+from collections import OrderedDict
+from .formatters import MarkdownFormatter, iter_markdown_blocks
+from .observer import DocumentObserver
+from .text_diff import edit_span
+
+
+class MarkdownPreview(DocumentObserver):
+    """Живий попередній перегляд Markdown.
+
+    Після кожної зміни повторно розбирає лише блоки, яких торкнулася правка,
+    а HTML блоків бере з LRU-кешу за вмістом блоку.
+    """
+
+    def __init__(self, formatter: MarkdownFormatter = None, cache_size: int = 4096):
+        self.formatter = formatter or MarkdownFormatter()
+        self.cache_size = cache_size
+        self._cache = OrderedDict()
+        self._text = ""
+        self._starts = []
+        self._blocks = []
+        self._html = []
+        self.rendered_blocks = 0
+
+    def update(self, content: str):
+        self.render(content)
+
+    @property
+    def html(self) -> str:
+        return "".join(self._html)
+
+    @property
+    def blocks(self) -> list:
+        return list(self._blocks)
+
+    def render(self, content: str) -> str:
+        self._update(content)
+        return self.html
+
+    def patch(self, content: str):
+        """Оновлює перегляд і повертає заміну в уже показаному HTML.
+
+        Результат — (зсув, кількість символів, що прибираються, новий HTML)
+        лише для змінених блоків, або None, якщо нічого не змінилося.
+        Віджет латає цю ділянку, а не вставляє весь HTML заново.
+        """
+        change = self._update(content)
+        if change is None:
+            return None
+        first, removed, inserted = change
+        offset = sum(map(len, self._html[:first]))
+        return offset, sum(map(len, removed)), "".join(inserted)
+
+    def _update(self, content: str):
+        """Повертає (перший змінений блок, старий HTML блоків, новий HTML блоків)."""
+        old = self._text
+        self.rendered_blocks = 0
+        if content == old:
+            return None
+        prefix, _, new_edit_end = edit_span(old, content)
+        delta = len(content) - len(old)
+
+        # Блок перед зміненим теж розбираємо заново: його межа залежить від
+        # першого рядка наступного блоку.
+        first = max(bisect_right(self._starts, prefix) - 2, 0)
+        restart = self._starts[first] if self._blocks else 0
+
+        new_starts, new_blocks, new_html = [], [], []
+        last = len(self._blocks)
+        for start, kind, block in iter_markdown_blocks(content, restart):
+            if start >= new_edit_end:
+                # Далі текст не змінився: якщо межа збігається зі старою,
+                # решту блоків можна взяти з попереднього розбору.
+                old_index = self._find_block(start - delta, first)
+                if old_index is not None:
+                    last = old_index
+                    break
+            new_starts.append(start)
+            new_blocks.append((kind, block))
+            new_html.append(self._render_block(kind, block))
+
+        tail_starts = self._starts[last:]
+        if delta:
+            tail_starts = [start + delta for start in tail_starts]
+        removed = self._html[first:last]
+        self._starts[first:] = new_starts + tail_starts
+        self._blocks[first:last] = new_blocks
+        self._html[first:last] = new_html
+        self._text = content
+        return first, removed, new_html
+
+    def _find_block(self, offset: int, lo: int):
+        index = bisect_right(self._starts, offset, lo) - 1
+        if index >= lo and self._starts[index] == offset:
+            return index
+        return None
+
+    def _render_block(self, kind: str, block: str) -> str:
+        key = (kind, block)
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            return cached
+        rendered = self.formatter.format_block(kind, block)
+        self.rendered_blocks += 1
+        self._cache[key] = rendered
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return rendered
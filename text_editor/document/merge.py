@@ -0,0 +1,89 @@
+"""Тристоронне злиття тексту за рядками (як diff3).
+
+Зміни локальної і віддаленої версій відносно спільної основи беруться з
+обох боків; ділянки, які обидва боки змінили по-різному, позначаються
+маркерами конфлікту.
+"""
+LOCAL_MARKER = "<<<<<<< local\n"
+SEPARATOR = "=======\n"
+REMOTE_MARKER = ">>>>>>> disk\n"
+
+
+def _changes(base: list, side: list) -> list:
+    """Змінені ділянки side відносно base: (base_start, base_end, side_start, side_end)."""
+    from difflib import SequenceMatcher
+    limit = min(len(base), len(side))
+    prefix = 0
+    while prefix < limit and base[prefix] == side[prefix]:
+        prefix += 1
+    suffix = 0
+    while suffix < limit - prefix and base[-1 - suffix] == side[-1 - suffix]:
+        suffix += 1
+    # Спільні початок і кінець відкидаються, щоб SequenceMatcher працював лише зі зміненою серединою
+    matcher = SequenceMatcher(None, base[prefix:len(base) - suffix], side[prefix:len(side) - suffix], autojunk=False)
+    return [(i1 + prefix, i2 + prefix, j1 + prefix, j2 + prefix)
+            for tag, i1, i2, j1, j2 in matcher.get_opcodes() if tag != "equal"]
+
+
+def _side_text(base: list, side: list, changes: list, start: int, end: int) -> list:
+    lines = []
+    position = start
+    for base_start, base_end, side_start, side_end in changes:
+        lines += base[position:base_start] + side[side_start:side_end]
+        position = base_end
+    return lines + base[position:end]
+
+
+def _terminated(lines: list) -> list:
+    if lines and not lines[-1].endswith("\n"):
+        return lines[:-1] + [lines[-1] + "\n"]
+    return lines
+
+
+def merge3(base: str, local: str, remote: str) -> tuple:
+    """Зливає local і remote, що походять від base; повертає (текст, кількість конфліктів)."""
+    if local == base or local == remote:
+        return remote, 0
+    if remote == base:
+        return local, 0
+    base_lines = base.splitlines(keepends=True)
+    local_lines = local.splitlines(keepends=True)
+    remote_lines = remote.splitlines(keepends=True)
+    changes = sorted(
+        [(change, 0) for change in _changes(base_lines, local_lines)]
+        + [(change, 1) for change in _changes(base_lines, remote_lines)]
+    )
+    result = []
+    conflicts = 0
+    position = 0
+    index = 0
+    while index < len(changes):
+        # Ділянка основи, яку зачіпають зміни, що перекриваються або вставлені в одну точку
+        start, end = changes[index][0][0], changes[index][0][1]
+        hunk = [[], []]
+        while index < len(changes):
+            (change_start, change_end, _, _), side = changes[index]
+            if hunk[0] or hunk[1]:
+                if change_start > end or (change_start == end and change_start < change_end and start < end):
+                    break
+            hunk[side].append(changes[index][0])
+            end = max(end, change_end)
+            index += 1
+        result += base_lines[position:start]
+        position = end
+        if not hunk[1]:
+            result += _side_text(base_lines, local_lines, hunk[0], start, end)
+        elif not hunk[0]:
+            result += _side_text(base_lines, remote_lines, hunk[1], start, end)
+        else:
+            ours = _side_text(base_lines, local_lines, hunk[0], start, end)
+            theirs = _side_text(base_lines, remote_lines, hunk[1], start, end)
+            if ours == theirs:
+                result += ours
+            else:
+                conflicts += 1
+                if result and not result[-1].endswith("\n"):
+                    result[-1] += "\n"
+                result += [LOCAL_MARKER, *_terminated(ours), SEPARATOR, *_terminated(theirs), REMOTE_MARKER]
+    result += base_lines[position:]
+    return "".join(result), conflicts
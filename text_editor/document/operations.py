@@ -0,0 +1,108 @@
+"""Операції-правки для спільного редагування та їх перетворення (OT).
+
+Операція — трійка (start, end, text): замінити [start:end) на text, так
+само як Document.apply_edit чи EditCommand. Для перетворення правки
+розкладаються на прості: вставку (start == end) або видалення (text == "").
+Дві паралельні послідовності над однією версією тексту перетворюються одна
+відносно одної так, що будь-який порядок застосування дає той самий текст.
+"""
+from .text_diff import edit_span
+
+
+def split(op) -> list:
+    """Розкладає заміну на видалення і вставку; порожні операції відкидаються."""
+    start, end, text = op
+    ops = []
+    if start < end:
+        ops.append((start, end, ""))
+    if text:
+        ops.append((start, start, text))
+    return ops
+
+
+def diff(old: str, new: str) -> list:
+    """Прості операції, що перетворюють old на new (порожній список, якщо тексти однакові)."""
+    start, old_end, new_end = edit_span(old, new)
+    return split((start, old_end, new[start:new_end]))
+
+
+def apply(text: str, op) -> str:
+    start, end, insert = op
+    if not 0 <= start <= end <= len(text):
+        raise ValueError(f"Operation {start}:{end} is out of range for length {len(text)}")
+    return text[:start] + insert + text[end:]
+
+
+def apply_all(text: str, ops) -> str:
+    for op in ops:
+        text = apply(text, op)
+    return text
+
+
+def transform(op, other, op_first: bool) -> list:
+    """Перетворює просту операцію op так, щоб її можна було застосувати після other.
+
+    Повертає список: видалення, всередину якого потрапила чужа вставка,
+    розпадається на два; видалення вже видаленого зникає. op_first вирішує,
+    чия вставка в ту саму позицію йде першою.
+    """
+    start, end, text = op
+    other_start, other_end, other_text = other
+    if other_start == other_end:
+        size = len(other_text)
+        if start == end:
+            if start < other_start or (start == other_start and op_first):
+                return [op]
+            return [(start + size, end + size, text)]
+        if other_start <= start:
+            return [(start + size, end + size, "")]
+        if other_start >= end:
+            return [op]
+        return [(start, other_start, ""), (start + size, end + size - (other_start - start), "")]
+    removed = other_end - other_start
+
+    def position(index):
+        if index <= other_start:
+            return index
+        return other_start if index < other_end else index - removed
+
+    if start == end:
+        return [(position(start), position(start), text)]
+    new_start, new_end = position(start), position(end)
+    return [(new_start, new_end, "")] if new_start < new_end else []
+
+
+def _one_against(op, ops: list, op_first: bool) -> tuple:
+    result = [op]
+    transformed = []
+    for other in ops:
+        if len(result) == 1:
+            op = result[0]
+            result, others = transform(op, other, op_first), transform(other, op, not op_first)
+        else:
+            result, others = _many_against(result, other, op_first)
+        transformed.extend(others)
+    return result, transformed
+
+
+def _many_against(ops: list, other, op_first: bool) -> tuple:
+    others = [other]
+    transformed = []
+    for op in ops:
+        result, others = _one_against(op, others, op_first)
+        transformed.extend(result)
+    return transformed, others
+
+
+def transform_ops(left: list, right: list, left_first: bool) -> tuple:
+    """Перетворює дві послідовності простих операцій над однією версією тексту.
+
+    Повертає (left', right'): left' застосовується після right, right' —
+    після left.
+    """
+    right = list(right)
+    transformed = []
+    for op in left:
+        result, right = _one_against(op, right, left_first)
+        transformed.extend(result)
+    return transformed, right
@@ -0,0 +1,100 @@
+"""Підтримка RTF: визначення кодової сторінки та розбір у звичайний текст.
+
+Модуль завантажується реєстром форматів лише під час першого звернення до RTF.
+"""
+import codecs
+import re
+from .formatters import TextFormatter
+
+_TOKEN = re.compile(r"\\([a-z]{1,32})(-?\d{1,10})? ?|\\'([0-9a-f]{2})|\\([^a-z])|([{}])|([^\\{}\r\n]+)|[\r\n]+", re.I)
+# Групи, вміст яких не є текстом документа
+_DESTINATIONS = {
+    "fonttbl", "colortbl", "stylesheet", "info", "pict", "header", "footer", "headerl", "headerr",
+    "footerl", "footerr", "object", "themedata", "listtable", "listoverridetable", "rsidtbl",
+    "generator", "xmlnstbl", "datastore", "latentstyles", "filetbl", "revtbl",
+}
+_WORDS = {
+    "par": "\n", "line": "\n", "sect": "\n", "page": "\n", "row": "\n", "cell": "\t", "tab": "\t",
+    "emdash": "\u2014", "endash": "\u2013", "bullet": "\u2022", "lquote": "\u2018", "rquote": "\u2019",
+    "ldblquote": "\u201c", "rdblquote": "\u201d",
+}
+_SYMBOLS = {"~": "\u00a0", "_": "\u2011", "-": "", "\\": "\\", "{": "{", "}": "}"}
+
+
+def detect_encoding(data: bytes):
+    """Кодова сторінка з \\ansicpgN у заголовку RTF; None, якщо її не вказано.
+
+    Файли без \\ansicpg (зокрема збережені самим редактором) читаються
+    за загальними правилами визначення кодування.
+    """
+    if not data.lstrip().startswith(b"{\\rtf"):
+        return None
+    index = data.find(b"\\ansicpg", 0, 4096)
+    if index == -1:
+        return None
+    start = end = index + len(b"\\ansicpg")
+    while end < len(data) and end - start < 5 and 48 <= data[end] <= 57:
+        end += 1
+    try:
+        return codecs.lookup(f"cp{data[start:end].decode('ascii')}").name
+    except LookupError:
+        return None
+
+
+def rtf_to_text(rtf: str) -> str:
+    # Символи \'hh без \ansicpg за специфікацією належать cp1252
+    encoding = detect_encoding(rtf[:4096].encode("latin-1", "replace")) or "cp1252"
+    out = []
+    pending = bytearray()
+    stack = []
+    skip = False
+    uc = 1
+    drop = 0
+    for match in _TOKEN.finditer(rtf):
+        word, argument, hexcode, symbol, brace, text = match.groups()
+        if hexcode is None and pending:
+            out.append(pending.decode(encoding, "replace"))
+            pending.clear()
+        if brace == "{":
+            stack.append((skip, uc))
+        elif brace == "}":
+            if stack:
+                skip, uc = stack.pop()
+        elif hexcode is not None:
+            if drop:
+                drop -= 1
+            elif not skip:
+                pending.append(int(hexcode, 16))
+        elif text is not None:
+            if drop:
+                consumed = min(drop, len(text))
+                text, drop = text[consumed:], drop - consumed
+            if not skip:
+                out.append(text)
+        elif symbol is not None:
+            if symbol == "*":
+                skip = True
+            elif not skip:
+                out.append(_SYMBOLS.get(symbol, ""))
+        elif word is not None:
+            drop = 0
+            if word in _DESTINATIONS:
+                skip = True
+            elif word == "uc" and argument:
+                uc = int(argument)
+            elif word == "u" and argument:
+                if not skip:
+                    out.append(chr(int(argument) % 0x10000))
+                drop = uc
+            elif not skip and word in _WORDS:
+                out.append(_WORDS[word])
+    if pending:
+        out.append(pending.decode(encoding, "replace"))
+    return "".join(out)
+
+
+class RtfTextFormatter(TextFormatter):
+    """Показує RTF як звичайний текст."""
+
+    def format(self, text: str) -> str:
+        return rtf_to_text(text)
@@ -0,0 +1,137 @@
+import re
+from .observer import DocumentObserver
+from .text_diff import edit_span
+
+
+class SearchQuery:
+    """Пошуковий запит: буквальний рядок або регулярний вираз."""
+
+    def __init__(self, pattern: str, regex: bool = False, ignore_case: bool = False):
+        if not pattern:
+            raise ValueError("Search pattern must not be empty")
+        self.pattern = pattern
+        self.regex = regex
+        self.ignore_case = ignore_case
+        self._compiled = None
+        if regex or ignore_case:
+            try:
+                self._compiled = re.compile(
+                    pattern if regex else re.escape(pattern),
+                    re.IGNORECASE if ignore_case else 0,
+                )
+            except re.error as e:
+                raise ValueError(f"Invalid search pattern: {e}")
+
+    def finditer(self, text: str, start: int = 0):
+        """Ліниво повертає (start, end) усіх збігів, починаючи з позиції start."""
+        if self._compiled is not None:
+            for match in self._compiled.finditer(text, start):
+                yield match.start(), match.end()
+            return
+        size = len(self.pattern)
+        pos = text.find(self.pattern, start)
+        while pos != -1:
+            yield pos, pos + size
+            pos = text.find(self.pattern, pos + size)
+
+    def replace(self, text: str, replacement: str) -> tuple:
+        """Замінює всі збіги за один прохід; повертає (новий текст, кількість)."""
+        if self._compiled is None:
+            count = text.count(self.pattern)
+            return (text.replace(self.pattern, replacement) if count else text), count
+        if not self.regex:
+            return self._compiled.subn(lambda _: replacement, text)
+        return self._compiled.subn(replacement, text)
+
+
+def find_iter(text: str, pattern: str, regex: bool = False, ignore_case: bool = False, start: int = 0):
+    return SearchQuery(pattern, regex, ignore_case).finditer(text, start)
+
+
+class MatchTracker(DocumentObserver):
+    """Тримає список збігів актуальним під час редагування.
+
+    Після правки повторно шукає лише від останнього незачепленого збігу і
+    зупиняється, щойно новий збіг за правкою збігся зі зсунутим старим.
+    Зсув хвоста зберігається ліниво, як у буфері з розривом.
+    """
+
+    def __init__(self, query: SearchQuery, text: str = ""):
+        self.query = query
+        self._text = text
+        self._matches = list(query.finditer(text))
+        self._gap = len(self._matches)
+        self._delta = 0
+
+    def update(self, content: str):
+        if content == self._text:
+            return
+        start, old_end, new_end = edit_span(self._text, content)
+        self.edit(content, start, old_end, new_end)
+
+    def edit(self, content: str, start: int, old_end: int, new_end: int):
+        """Застосовує правку: old[start:old_end] замінено на new[start:new_end]."""
+        # Збіги, що закінчуються до правки, залишаються без змін
+        keep = self._bisect(start, 1)
+        tail = self._bisect(old_end, 0, keep)
+        self._move_gap(keep)
+        del self._matches[keep:tail]
+        self._delta += new_end - old_end
+
+        resume = self._matches[keep - 1][1] if keep else 0
+        found = []
+        for match in self.query.finditer(content, resume):
+            if match[0] >= new_end:
+                index = self._bisect(match[0], 0, keep)
+                if index < len(self._matches) and self._match(index) == match:
+                    del self._matches[keep:index]
+                    break
+            found.append(match)
+        else:
+            del self._matches[keep:]
+        self._matches[keep:keep] = found
+        self._gap = keep + len(found)
+        self._text = content
+
+    def _bisect(self, pos: int, field: int, lo: int = 0) -> int:
+        """Перший індекс, де match[field] >= pos, з урахуванням лінивого зсуву."""
+        hi = len(self._matches)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._match(mid)[field] < pos:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def _match(self, index: int) -> tuple:
+        start, end = self._matches[index]
+        if index >= self._gap:
+            return start + self._delta, end + self._delta
+        return start, end
+
+    def _move_gap(self, index: int):
+        """Переносить розрив так, щоб записи до index мали справжні позиції."""
+        delta = self._delta
+        matches = self._matches
+        if index > self._gap:
+            for i in range(self._gap, index):
+                start, end = matches[i]
+                matches[i] = (start + delta, end + delta)
+        elif index < self._gap:
+            for i in range(index, self._gap):
+                start, end = matches[i]
+                matches[i] = (start - delta, end - delta)
+        self._gap = index
+
+    def __len__(self) -> int:
+        return len(self._matches)
+
+    def __iter__(self):
+        for index in range(len(self._matches)):
+            yield self._match(index)
+
+    def next_after(self, pos: int):
+        """Перший збіг, що починається не раніше pos, або None."""
+        index = self._bisect(pos, 0)
+        return self._match(index) if index < len(self._matches) else None
@@ -0,0 +1,38 @@
+_CHUNK = 4096
+
+
+def common_prefix_length(a: str, b: str) -> int:
+    """Довжина спільного префікса, порівнюючи рядки шматками."""
+    limit = min(len(a), len(b))
+    pos = 0
+    while pos < limit:
+        step = min(_CHUNK, limit - pos)
+        if a[pos:pos + step] == b[pos:pos + step]:
+            pos += step
+            continue
+        while a[pos] == b[pos]:
+            pos += 1
+        return pos
+    return limit
+
+
+def common_suffix_length(a: str, b: str, limit: int) -> int:
+    """Довжина спільного суфікса, не більша за limit."""
+    la, lb = len(a), len(b)
+    count = 0
+    while count < limit:
+        step = min(_CHUNK, limit - count)
+        if a[la - count - step:la - count] == b[lb - count - step:lb - count]:
+            count += step
+            continue
+        while a[la - count - 1] == b[lb - count - 1]:
+            count += 1
+        return count
+    return limit
+
+
+def edit_span(old: str, new: str) -> tuple:
+    """Повертає (start, old_end, new_end) — ділянку, якою відрізняються тексти."""
+    prefix = common_prefix_length(old, new)
+    suffix = common_suffix_length(old, new, min(len(old), len(new)) - prefix)
+    return prefix, len(old) - suffix, len(new) - suffix
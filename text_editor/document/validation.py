@@ -0,0 +1,136 @@
+class ValidationRule:
+    """Правило, яке перевіряє один рядок тексту.
+
+    Правила застосовуються лише до рядків, яких торкнулася правка, тому
+    вартість перевірки не залежить від розміру документа.
+    """
+    name = "rule"
+
+    def check_line(self, line: str):
+        """Повертає текст помилки або None, якщо рядок коректний."""
+        return None
+
+    def check_text(self, text: str):
+        """Перевіряє всі рядки text; правила можуть робити це швидше за цикл."""
+        for line in text.split("\n"):
+            error = self.check_line(line)
+            if error:
+                return error
+        return None
+
+    def get_metadata(self):
+        return None
+
+
+class MaxLineLengthRule(ValidationRule):
+    name = "max_line_length"
+
+    def __init__(self, max_line_length: int):
+        self.max_line_length = max_line_length
+
+    def check_line(self, line: str):
+        if len(line) > self.max_line_length:
+            return f"line longer than {self.max_line_length} characters"
+        return None
+
+    def check_text(self, text: str):
+        return self.check_line(max(text.split("\n"), key=len))
+
+    def get_metadata(self):
+        return self.max_line_length
+
+
+class AllowedCharactersRule(ValidationRule):
+    """Дозволяє лише символи з класу, записаного як вміст [...] у regex."""
+    name = "allowed_characters"
+
+    def __init__(self, characters: str):
+        import re
+        self.characters = characters
+        self._forbidden = re.compile(f"[^{characters}\n]")
+
+    def check_line(self, line: str):
+        return self.check_text(line)
+
+    def check_text(self, text: str):
+        match = self._forbidden.search(text)
+        if match:
+            return f"character {match.group()!r} is not allowed"
+        return None
+
+    def get_metadata(self):
+        return self.characters
+
+
+class RegexDenylistRule(ValidationRule):
+    name = "denylist"
+
+    def __init__(self, patterns: list, ignore_case: bool = False):
+        import re
+        self.patterns = list(patterns)
+        self._compiled = re.compile(
+            "|".join(f"(?:{pattern})" for pattern in self.patterns),
+            re.IGNORECASE if ignore_case else 0,
+        ) if self.patterns else None
+
+    def check_line(self, line: str):
+        return self.check_text(line)
+
+    def check_text(self, text: str):
+        # Шаблони не мають охоплювати кілька рядків
+        if self._compiled is None:
+            return None
+        match = self._compiled.search(text)
+        if match:
+            return f"forbidden text {match.group()!r}"
+        return None
+
+    def get_metadata(self):
+        return self.patterns
+
+
+class ForbiddenWordsRule(RegexDenylistRule):
+    name = "forbidden_words"
+
+    def __init__(self, words: list):
+        import re
+        self.words = list(words)
+        super().__init__([rf"\b{re.escape(word)}\b" for word in self.words], ignore_case=True)
+
+    def get_metadata(self):
+        return self.words
+
+
+RULE_TYPES = {
+    MaxLineLengthRule.name: MaxLineLengthRule,
+    AllowedCharactersRule.name: AllowedCharactersRule,
+    RegexDenylistRule.name: RegexDenylistRule,
+    ForbiddenWordsRule.name: ForbiddenWordsRule,
+}
+
+
+def rules_from_metadata(metadata: dict) -> list:
+    """Відновлює правила з метаданих декоратора Validation."""
+    return [
+        rule_class(metadata[name])
+        for name, rule_class in RULE_TYPES.items()
+        if metadata.get(name)
+    ]
+
+
+def changed_lines(content: str, start: int, end: int, text: str) -> str:
+    """Повертає рядки нового тексту, яких торкається заміна content[start:end] на text."""
+    line_start = content.rfind("\n", 0, start) + 1
+    line_end = content.find("\n", end)
+    if line_end == -1:
+        line_end = len(content)
+    return content[line_start:start] + text + content[end:line_end]
+
+
+def check_lines(rules: list, text: str):
+    """Повертає першу помилку правил для рядків text або None."""
+    for rule in rules:
+        error = rule.check_text(text)
+        if error:
+            return error
+    return None
@@ -0,0 +1,64 @@
+import asyncio
+
+
+class AsyncEditorFacade:
+    """Асинхронні open/save/autosave поверх EditorFacade.
+
+    Читання, запис і проходження ланцюжка декораторів (розшифрування)
+    виконуються у виконавці, тож цикл подій не блокується. Записи одного
+    файлу йдуть по черзі; запис, який ще не почався, скасовується
+    (asyncio.CancelledError), щойно для того ж файлу надійшов новіший.
+    Записи зберігають кодування й кінці рядків відкритого файлу.
+    """
+
+    def __init__(self, facade, executor=None):
+        self.facade = facade
+        self.executor = executor
+        self._generations = {}
+        self._locks = {}
+
+    async def _run(self, func, *args):
+        return await asyncio.get_running_loop().run_in_executor(self.executor, func, *args)
+
+    async def open(self, path: str) -> str:
+        def load():
+            self.facade.open_from_file(path)
+            return self.facade.get_content()
+        return await self._run(load)
+
+    async def load(self, path: str, document) -> tuple:
+        """Читає файл у document; фасад не змінюється, доки результат не передано в adopt_document."""
+        return await self._run(self.facade.load_file, path, document)
+
+    async def save(self, path: str) -> int:
+        generation = self._supersede(path)
+        # Знімок не блокує UI, який може писати в документ під час збереження
+        content = await self._run(lambda: self.facade.document.snapshot().content)
+        # Як і save_to_file, явне збереження записує версію; автозбереження — ні
+        return await self._write(path, content, generation, record=True)
+
+    async def autosave(self, path: str, content: str) -> int:
+        # Автозбереження не затирає файл, змінений іншою програмою (див. EditorFacade.write_file)
+        return await self._write(path, content, self._supersede(path), guard=True)
+
+    def _supersede(self, path: str) -> int:
+        generation = self._generations.get(path, 0) + 1
+        self._generations[path] = generation
+        return generation
+
+    def _check(self, path: str, generation: int):
+        if self._generations.get(path) != generation:
+            raise asyncio.CancelledError(f"Superseded save of {path}")
+
+    async def _write(self, path: str, content: str, generation: int, guard: bool = False,
+                     record: bool = False) -> int:
+        lock = self._locks.get(path)
+        if lock is None:
+            lock = self._locks[path] = asyncio.Lock()
+        self._check(path, generation)
+        async with lock:
+            self._check(path, generation)
+            await self._run(self.facade.write_file, path, content, self.facade.file_format(), guard)
+            if record:
+                await self._run(self.facade.record_version, path, content)
+        return len(content)
@@ -1,6 +1,8 @@
 from text_editor.document.document_factory import DocumentFactory
-from text_editor.document.decorators import AutoSaveDecorator
+from text_editor.document.decorators import AutoSaveDecorator, collect_decorators_metadata, create_decorator_chain
 from text_editor.commands.undo_redo import UndoRedoManager
+from text_editor.commands.command import EditCommand, ReplaceAllCommand, SetTextCommand
+from text_editor.services.clipboard import Clipboard
 
 class EditorFacade:
     def __init__(self, save_callback=None):
@@ -8,9 +10,29 @@ class EditorFacade:
         self.undo_redo = UndoRedoManager()
         self.save_callback = save_callback or (lambda content: None)
         self.document = AutoSaveDecorator(self.factory.create_document(), self.save_callback)
+        self._workspace = None
+        # VersionStore: якщо задано, кожне явне збереження (не автозбереження) записує версію
+        self.version_store = None
+        # TextFormat відкритого файлу: save_to_file зберігає його кодування і кінці рядків
+        self.text_format = None
+        # FileWatcher: якщо задано, відкриті й збережені файли перевіряються на зовнішні зміни
+        self.file_watcher = None
+        # LogFollower режиму стеження за журналом (див. follow)
+        self.follower = None
+        # Буфер обміну з інтерфейсом get/set; вікно підставляє системний
+        self.clipboard = Clipboard()
+
+    @property
+    def workspace(self):
+        """Сесія з багатьма документами; створюється під час першого звернення."""
+        if self._workspace is None:
+            from text_editor.facade.workspace import Workspace
+            self._workspace = Workspace(self)
+        return self._workspace
 
     def new_document(self, content=""):
         self.document = AutoSaveDecorator(self.factory.create_document(content), self.save_callback)
+        self.text_format = None
 
     def set_content(self, content: str):
         self.document.content = content
@@ -19,10 +41,41 @@ class EditorFacade:
         return self.document.content
 
     def copy(self, text: str):
-        pass
+        self.clipboard.set(text)
+
+    def paste(self, start: int = None, end: int = None) -> str:
+        """Вставляє вміст буфера замість ділянки [start:end] (типово — в кінець).
+
+        Вставка будь-якого розміру — одна правка документа й одна одиниця
+        undo. Повертає вставлений текст.
+        """
+        text = self.clipboard.get()
+        length = len(self.get_content())
+        if start is None:
+            start = length
+        if end is None:
+            end = start
+        if not 0 <= start <= end <= length:
+            raise ValueError("Paste range is out of bounds")
+        if not text and start == end:
+            return ""
+        self.undo_redo.execute(EditCommand(self.document, start, end, text))
+        return text
+
+    def cancel_paste(self):
+        """Скасовує щойно виконаний paste так, ніби його не було: без запису для redo."""
+        self.undo_redo.discard()
 
-    def paste(self):
-        pass
+    def find(self, pattern: str, regex: bool = False, ignore_case: bool = False, start: int = 0):
+        from text_editor.document.search import SearchQuery
+        return SearchQuery(pattern, regex, ignore_case).finditer(self.get_content(), start)
+
+    def replace_all(self, pattern: str, replacement: str, regex: bool = False, ignore_case: bool = False) -> int:
+        from text_editor.document.search import SearchQuery
+        command = ReplaceAllCommand(self.document, SearchQuery(pattern, regex, ignore_case), replacement)
+        if command.count:
+            self.undo_redo.execute(command)
+        return command.count
 
     def undo(self):
         self.undo_redo.undo()
@@ -30,11 +83,154 @@ class EditorFacade:
     def redo(self):
         self.undo_redo.redo()
 
-    def save_to_file(self, filepath: str):
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(self.get_content())
+    def save_to_file(self, filepath: str, encoding: str = None, newline: str = None):
+        """Зберігає текст у кодуванні відкритого файлу (типово UTF-8) або в заданому."""
+        content = self.get_content()
+        self.write_file(filepath, content, self.file_format(encoding, newline))
+        self.record_version(filepath, content)
+
+    def record_version(self, filepath: str, content: str):
+        """Записує збережений текст у version_store, якщо його задано."""
+        if self.version_store is not None:
+            self.version_store.record(filepath, content)
+
+    def write_file(self, filepath: str, content: str, text_format=None, guard: bool = False):
+        """Записує content; з file_watcher запис фіксується як відомий стан файлу.
+
+        guard=True (автозбереження) відмовляє з ValueError, якщо файл змінила
+        інша програма і зміну ще не прийнято, замість того щоб затерти її.
+        """
+        from text_editor.document.encoding import write_text
+        text_format = text_format or self.file_format()
+        watcher = self.file_watcher
+        if watcher is None:
+            write_text(filepath, content, text_format)
+            return
+        with watcher.lock:
+            if guard:
+                watcher.guard(filepath)
+                if watcher.is_current(filepath, content):
+                    return
+            size = write_text(filepath, content, text_format)
+            watcher.acknowledge(filepath, content, text_format, size)
+
+    def checkout_version(self, filepath: str, version: int = None):
+        """Завантажує збережену версію файлу в документ як звичайну зміну тексту."""
+        if self.version_store is None:
+            raise ValueError("Version store is not configured")
+        self.undo_redo.execute(SetTextCommand(self.document, self.version_store.checkout(filepath, version)))
+
+    def file_format(self, encoding: str = None, newline: str = None):
+        """TextFormat для збереження: відкритого файлу з можливою заміною кодування чи кінців рядків."""
+        from text_editor.document.encoding import TextFormat
+        current = self.text_format or TextFormat()
+        if encoding is None and newline is None:
+            return current
+        bom = current.bom and encoding is None
+        return TextFormat(encoding or current.encoding, bom, newline or current.newline)
 
     def open_from_file(self, filepath: str):
-        with open(filepath, 'r', encoding='utf-8') as f:
-            content = f.read()
-        self.set_content(content) 
\ No newline at end of file
+        """Відкриває файл, визначивши кодування за BOM, вмістом чи оголошенням формату."""
+        self.adopt_document(filepath, self.document, self.load_file(filepath, self.document))
+
+    def detect_filetype(self, filepath: str) -> str:
+        """Тип документа файлу (розширення формату): за вмістом, потім за назвою."""
+        from text_editor.document.encoding import HEAD_SIZE
+        with open(filepath, 'rb') as f:
+            head = f.read(HEAD_SIZE)
+        return self.factory.detect_filetype(filepath, head)
+
+    def load_file(self, filepath: str, document) -> tuple:
+        """Читає файл у document, не змінюючи стан фасаду.
+
+        Повертає (текст файлу, TextFormat, оголошене кодування) для adopt_document.
+        """
+        from text_editor.document.encoding import HEAD_SIZE, read_text
+        with open(filepath, 'rb') as f:
+            head = f.read(HEAD_SIZE)
+        handler = self.factory.registry.detect(filepath, head)
+        declared = handler.detect_encoding if handler.has("encoding") else None
+        content, text_format = read_text(filepath, declared)
+        document.content = content
+        return content, text_format, declared
+
+    def adopt_document(self, filepath: str, document, loaded: tuple):
+        """Робить document, прочитаний load_file, поточним документом файлу filepath."""
+        content, text_format, declared = loaded
+        self.document = document
+        self.text_format = text_format
+        if self.file_watcher is not None:
+            self.file_watcher.watch(filepath, content, text_format, declared)
+
+    def apply_external_change(self, change) -> list:
+        """Дописаний іншою програмою хвіст файлу додається до документа правкою.
+
+        Локальні незбережені зміни зберігаються: вставка перетворюється
+        відносно них (див. text_editor.document.operations) і не потрапляє в
+        історію undo. Повертає застосовані операції (start, end, text).
+        """
+        from text_editor.document.operations import diff, transform_ops
+        if change.kind != "appended":
+            raise ValueError(f"Only appended text can be applied incrementally, got {change.kind}")
+        with self.document.lock:
+            content = self.get_content()
+            ops = [(len(change.base), len(change.base), change.text)]
+            if content != change.base:
+                ops, _ = transform_ops(ops, diff(change.base, content), False)
+            for start, end, text in ops:
+                self.document.apply_edit(start, end, text)
+        return ops
+
+    def merge_external_change(self, change) -> tuple:
+        """Тристороннє злиття локального тексту з вмістом файлу; повертає (текст, конфлікти)."""
+        from text_editor.document.merge import merge3
+        return merge3(change.base, self.get_content(), change.text)
+
+    def accept_external_change(self, change, text: str):
+        """Замінює текст документа (злиттям чи версією з диска) однією одиницею undo."""
+        if change.text_format is not None:
+            self.text_format = change.text_format
+        if text != self.get_content():
+            self.undo_redo.execute(SetTextCommand(self.document, text))
+
+    def follow(self, filepath: str, lines: int = 1000) -> str:
+        """Вмикає режим стеження за журналом; повертає останні lines рядків.
+
+        Дописане далі читає self.follower.read_new(); документ при цьому не
+        змінюється, тож журнал будь-якого розміру не потрапляє в пам'ять.
+        """
+        from text_editor.services.log_follower import LogFollower
+        self.stop_following()
+        follower = LogFollower(filepath)
+        text = follower.start(lines)
+        self.follower = follower
+        return text
+
+    def stop_following(self):
+        if self.follower is not None:
+            self.follower.close()
+            self.follower = None
+
+    def save_to_container(self, filepath: str, compression: str = "zlib"):
+        """Зберігає документ у форматі .tedc разом з описом ланцюжка декораторів."""
+        from text_editor.document.container import write_container
+        content = self.get_content()
+        write_container(filepath, content, self.factory.filetype_of(self.document),
+                        collect_decorators_metadata(self.document), compression)
+        self.record_version(filepath, content)
+
+    def open_from_container(self, filepath: str, encryption_key: str = None) -> dict:
+        """Відкриває .tedc: відновлює тип документа й декоратори; повертає статистику з файлу."""
+        from text_editor.document.container import ContainerReader
+        with ContainerReader(filepath) as reader:
+            document = self.factory.create_document("", filetype=reader.filetype)
+            document = create_decorator_chain(document, reader.decorators, self.save_callback, encryption_key)
+            content = reader.read()
+            stats = reader.stats
+        document.content = content
+        self.document = document
+        # Історія і формат попереднього файлу до нового документа не належать
+        self.undo_redo = UndoRedoManager()
+        self.text_format = None
+        return stats
+
@@ -0,0 +1,343 @@
+import os
+import pickle
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from text_editor.commands.undo_redo import UndoRedoManager
+from text_editor.document.decorators import (
+    EncryptionDecorator, create_decorator_chain, load_decorators_metadata, save_decorators_metadata
+)
+from text_editor.document.document import Snapshot
+
+
+class AutoSaveWriter:
+    """Один фоновий потік запису для всіх документів сесії.
+
+    Поспіль надіслані версії одного файлу зливаються: записується лише
+    остання, і редагування не чекає на диск.
+    """
+
+    def __init__(self):
+        self._pending = OrderedDict()
+        self._writing = 0
+        self._condition = threading.Condition()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def submit(self, path: str, content: str):
+        with self._condition:
+            if self._closed:
+                raise ValueError("Auto-save writer is closed")
+            self._pending[path] = content
+            self._pending.move_to_end(path)
+            self._condition.notify_all()
+
+    def flush(self):
+        """Чекає, доки всі надіслані версії не буде записано."""
+        with self._condition:
+            self._condition.wait_for(lambda: not self._pending and not self._writing)
+
+    def close(self):
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        self._thread.join()
+
+    def _run(self):
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: self._pending or self._closed)
+                if not self._pending:
+                    return
+                path, content = self._pending.popitem(last=False)
+                self._writing += 1
+            try:
+                write_atomic(path, content)
+            except OSError as e:
+                print(f"Could not auto-save {path}: {e}", file=sys.stderr)
+            finally:
+                with self._condition:
+                    self._writing -= 1
+                    self._condition.notify_all()
+
+
+def write_atomic(path: str, content):
+    """content — рядок або ContentView, який записується порціями."""
+    chunks = [content] if isinstance(content, str) else content.iter_read()
+    tmp_path = path + ".tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        for chunk in chunks:
+            f.write(chunk)
+    os.replace(tmp_path, path)
+
+
+class MetadataStore:
+    """Спільний доступ до метаданих декораторів з кешем у пам'яті."""
+
+    def __init__(self):
+        self._cache = {}
+        self._lock = threading.Lock()
+
+    def load(self, path: str) -> list:
+        with self._lock:
+            if path not in self._cache:
+                self._cache[path] = load_decorators_metadata(path)
+            return self._cache[path]
+
+    def save(self, path: str, metadata: list):
+        with self._lock:
+            save_decorators_metadata(path, metadata)
+            self._cache[path] = metadata
+
+
+class QueuedObserver:
+    """Передає оновлення спостерігачу через спільний виконавець сесії."""
+
+    def __init__(self, observer, executor):
+        self.observer = observer
+        self.executor = executor
+
+    def update(self, content: str):
+        self.executor.submit(self.observer.update, content)
+
+
+def _innermost(document):
+    while hasattr(document, '_document'):
+        document = document._document
+    return document
+
+
+def _is_encrypted(document) -> bool:
+    while hasattr(document, '_document'):
+        if isinstance(document, EncryptionDecorator):
+            return True
+        document = document._document
+    return False
+
+
+class SpilledSnapshot(Snapshot):
+    """Знімок вивантаженого документа: вміст читається з файлу вивантаження на вимогу."""
+    __slots__ = ("path", "document")
+
+    def __init__(self, version: int, path: str, document):
+        object.__setattr__(self, "version", version)
+        object.__setattr__(self, "path", path)
+        object.__setattr__(self, "document", document)
+
+    @property
+    def content(self) -> str:
+        try:
+            with open(self.path, 'rb') as f:
+                return pickle.load(f)
+        except FileNotFoundError:
+            # Документ уже повернуто в пам'ять: та сама версія має той самий вміст
+            current = self.document.snapshot()
+            if current.version != self.version:
+                raise ValueError("Snapshot is no longer available") from None
+            return current.content
+
+
+class DocumentSession:
+    """Відкритий документ: ланцюжок декораторів і власна історія undo/redo.
+
+    Історія зашифрованого документа містить відкритий текст, тому під час
+    вивантаження вона лишається в пам'яті, а на диск іде лише шифротекст.
+    """
+
+    def __init__(self, path: str, document, undo_redo: UndoRedoManager = None):
+        self.path = path
+        self.document = document
+        self.undo_redo = undo_redo or UndoRedoManager()
+        self.last_used = time.monotonic()
+        self.spill_path = None
+
+    @property
+    def evicted(self) -> bool:
+        return self.spill_path is not None
+
+    def memory_size(self) -> int:
+        """Оцінка пам'яті вмісту та історії в байтах."""
+        size = 0 if self.evicted else sys.getsizeof(_innermost(self.document)._content)
+        for stack in (self.undo_redo._undo_stack, self.undo_redo._redo_stack):
+            for command in stack:
+                size += sum(sys.getsizeof(value) for value in vars(command).values() if isinstance(value, str))
+        return size
+
+
+class Workspace:
+    """Багато відкритих документів поверх одного EditorFacade.
+
+    Активний документ і його історія підставляються у facade, тому решта
+    коду працює з фасадом як раніше. Потік автозбереження, сховище
+    метаданих і виконавець спостерігачів спільні для всіх документів.
+    Коли пам'ять неактивних документів перевищує memory_budget, найдавніше
+    використані з них вивантажуються у тимчасові файли і повертаються
+    під час активації.
+    """
+
+    def __init__(self, facade, memory_budget: int = 256 * 1024 * 1024, spill_dir: str = None):
+        self.facade = facade
+        self.memory_budget = memory_budget
+        self.sessions = OrderedDict()
+        self.active = None
+        self.writer = AutoSaveWriter()
+        self.metadata = MetadataStore()
+        self._executor = None
+        self._spill_dir = spill_dir
+        self._own_spill_dir = spill_dir is None
+        self._spill_counter = 0
+
+    @property
+    def observer_executor(self):
+        if self._executor is None:
+            from concurrent.futures import ThreadPoolExecutor
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="observers")
+        return self._executor
+
+    def _build(self, path: str, metadata: list, encryption_key: str = None):
+        document = self.facade.factory.create_document("", filetype=os.path.splitext(path)[1].lower())
+        save_callback = lambda content: self.writer.submit(path, content)
+        return create_decorator_chain(document, metadata, save_callback, encryption_key)
+
+    def new(self, path: str, content: str = "", decorators_metadata: list = None,
+            encryption_key: str = None) -> DocumentSession:
+        path = os.path.abspath(path)
+        if path in self.sessions:
+            raise ValueError(f"Document is already open: {path}")
+        document = self._build(path, decorators_metadata or [], encryption_key)
+        document.content = content
+        if decorators_metadata:
+            self.metadata.save(path, decorators_metadata)
+        return self._add(DocumentSession(path, document))
+
+    def open(self, path: str, encryption_key: str = None) -> DocumentSession:
+        path = os.path.abspath(path)
+        if path in self.sessions:
+            return self.activate(path)
+        document = self._build(path, self.metadata.load(path), encryption_key)
+        with open(path, 'r', encoding='utf-8') as f:
+            document.content = f.read()
+        return self._add(DocumentSession(path, document))
+
+    def _add(self, session: DocumentSession) -> DocumentSession:
+        self.sessions[session.path] = session
+        return self.activate(session.path)
+
+    def get(self, path: str) -> DocumentSession:
+        session = self.sessions.get(os.path.abspath(path))
+        if session is None:
+            raise ValueError(f"Document is not open: {path}")
+        return session
+
+    def activate(self, path: str) -> DocumentSession:
+        session = self.get(path)
+        if session.evicted:
+            self._reload(session)
+        session.last_used = time.monotonic()
+        self.sessions.move_to_end(session.path)
+        self.active = session
+        self.facade.document = session.document
+        self.facade.undo_redo = session.undo_redo
+        self.enforce_budget()
+        return session
+
+    def attach(self, path: str, observer):
+        """Підписує observer на документ; оновлення йдуть через спільний виконавець."""
+        queued = QueuedObserver(observer, self.observer_executor)
+        _innermost(self.get(path).document).attach(queued)
+        return queued
+
+    def save(self, path: str = None):
+        session = self.get(path) if path else self.active
+        if session.evicted:
+            self._reload(session)
+        write_atomic(session.path, session.document.content)
+
+    def close(self, path: str):
+        session = self.get(path)
+        self.writer.flush()
+        self._discard_spill(session)
+        del self.sessions[session.path]
+        if session is self.active:
+            self.active = None
+            if self.sessions:
+                self.activate(next(reversed(self.sessions)))
+            else:
+                self.facade.new_document()
+                self.facade.undo_redo = UndoRedoManager()
+
+    def memory_usage(self) -> dict:
+        return {path: session.memory_size() for path, session in self.sessions.items()}
+
+    def enforce_budget(self):
+        """Вивантажує найдавніше використані неактивні документи, поки не вкладемося в бюджет."""
+        usage = self.memory_usage()
+        total = sum(usage.values())
+        for path, session in list(self.sessions.items()):
+            if total <= self.memory_budget:
+                break
+            if session is self.active or session.evicted:
+                continue
+            self.evict(path)
+            total -= usage[path] - session.memory_size()
+
+    def evict(self, path: str):
+        session = self.get(path)
+        if session.evicted or session is self.active:
+            return
+        base = _innermost(session.document)
+        stacks = (session.undo_redo._undo_stack, session.undo_redo._redo_stack)
+        history = None
+        if not _is_encrypted(session.document):
+            history = [
+                [(type(command), {k: v for k, v in vars(command).items() if k != "document"}) for command in stack]
+                for stack in stacks
+            ]
+        spill_path = os.path.join(self._spill_directory(), f"{self._spill_counter}.spill")
+        self._spill_counter += 1
+        with open(spill_path, 'wb') as f:
+            # Вміст першим: SpilledSnapshot читає лише його
+            pickle.dump(base._content, f, protocol=pickle.HIGHEST_PROTOCOL)
+            pickle.dump(history, f, protocol=pickle.HIGHEST_PROTOCOL)
+        # Вміст прибирається напряму, без сповіщення спостерігачів і автозбереження
+        base.unload(SpilledSnapshot(base.version, spill_path, base))
+        session.document.release_caches()
+        if history is not None:
+            for stack in stacks:
+                stack.clear()
+        session.spill_path = spill_path
+
+    def _reload(self, session: DocumentSession):
+        with open(session.spill_path, 'rb') as f:
+            content = pickle.load(f)
+            history = pickle.load(f)
+        _innermost(session.document).restore_content(content)
+        for stack, records in zip((session.undo_redo._undo_stack, session.undo_redo._redo_stack), history or ()):
+            for command_type, state in records:
+                command = command_type.__new__(command_type)
+                command.__dict__.update(state)
+                command.document = session.document
+                stack.append(command)
+        self._discard_spill(session)
+
+    def _spill_directory(self) -> str:
+        if self._spill_dir is None:
+            self._spill_dir = tempfile.mkdtemp(prefix="text_editor_spill_")
+        os.makedirs(self._spill_dir, exist_ok=True)
+        return self._spill_dir
+
+    def _discard_spill(self, session: DocumentSession):
+        if session.spill_path is not None:
+            os.remove(session.spill_path)
+            session.spill_path = None
+
+    def shutdown(self):
+        self.writer.close()
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+        if self._own_spill_dir and self._spill_dir is not None:
+            shutil.rmtree(self._spill_dir, ignore_errors=True)
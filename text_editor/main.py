@@ -1,10 +1,23 @@
-from text_editor.ui.editor_window import EditorWindow
+import os
 import tkinter as tk
 
 def main():
+    # TEXT_EDITOR_METRICS=шлях вмикає метрики з періодичним JSON-знімком
+    metrics_path = os.environ.get("TEXT_EDITOR_METRICS")
+    if metrics_path:
+        from text_editor.services.metrics import metrics
+        metrics.enable()
+        metrics.start_dump(metrics_path)
     root = tk.Tk()
+    root.title("Text Editor")
+    # Спершу малюємо порожнє вікно, а редактор і його залежності
+    # імпортуються й будуються вже після цього
+    root.update()
+    from text_editor.ui.editor_window import EditorWindow
     app = EditorWindow(root)
     root.mainloop()
+    if metrics_path:
+        metrics.stop_dump()
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    main()
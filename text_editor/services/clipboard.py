@@ -0,0 +1,15 @@
+class Clipboard:
+    """Буфер обміну в пам'яті: типовий для EditorFacade без вікна.
+
+    Вікно підставляє системний буфер (text_editor.ui.paste.TkClipboard)
+    з тим самим інтерфейсом get/set.
+    """
+
+    def __init__(self):
+        self._text = ""
+
+    def get(self) -> str:
+        return self._text
+
+    def set(self, text: str):
+        self._text = text
@@ -0,0 +1,253 @@
+"""Спільне редагування одного документа кількома екземплярами редактора.
+
+CollabServer тримає канонічний текст і журнал ревізій; CollabClient
+підключає EditorFacade. Обидва обмінюються не повним текстом, а
+операціями (start, end, text) у рядках JSON і надсилають накопичене раз
+за такт. Паралельні правки зводяться операційним перетворенням
+(див. text_editor.document.operations), як у схемі з центральним сервером:
+клієнт тримає не більше однієї непідтвердженої партії, сервер перетворює
+її відносно ревізій, яких клієнт ще не бачив.
+"""
+import asyncio
+import json
+from text_editor.document.operations import apply_all, diff, split, transform_ops
+
+# Повідомлення hello несе весь текст, тому межа рядка значно більша за типові 64 КіБ
+_LINE_LIMIT = 256 * 1024 * 1024
+
+
+def _encode(message: dict) -> bytes:
+    return (json.dumps(message, ensure_ascii=False) + "\n").encode("utf-8")
+
+
+class CollabServer:
+    """Сервер синхронізації для TCP або локального UNIX-сокета."""
+
+    def __init__(self, text: str = "", tick: float = 0.01):
+        self.text = text
+        self.tick = tick
+        self.history = []
+        self._clients = {}
+        self._next_id = 1
+        self._server = None
+        self._flusher = None
+        self._handlers = set()
+
+    @property
+    def revision(self) -> int:
+        return len(self.history)
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> tuple:
+        """Запускає TCP-сервер; повертає фактичні (host, port)."""
+        self._server = await asyncio.start_server(self._handle, host, port, limit=_LINE_LIMIT)
+        self._flusher = asyncio.ensure_future(self._flush_loop())
+        return self._server.sockets[0].getsockname()[:2]
+
+    async def start_unix(self, path: str):
+        self._server = await asyncio.start_unix_server(self._handle, path, limit=_LINE_LIMIT)
+        self._flusher = asyncio.ensure_future(self._flush_loop())
+
+    async def close(self):
+        if self._flusher is not None:
+            self._flusher.cancel()
+        for writer, _ in list(self._clients.values()):
+            writer.close()
+        await asyncio.gather(*self._handlers, return_exceptions=True)
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+
+    def receive(self, client_id: int, revision: int, ops: list) -> list:
+        """Приймає партію клієнта, створену на ревізії revision; повертає застосовані операції."""
+        if not 0 <= revision <= self.revision:
+            raise ValueError(f"Unknown revision: {revision}")
+        ops = [part for op in ops for part in split(tuple(op))]
+        for author, applied in self.history[revision:]:
+            ops, _ = transform_ops(ops, applied, client_id < author)
+        self.text = apply_all(self.text, ops)
+        self.history.append((client_id, ops))
+        message = {"type": "ops", "revision": self.revision, "client": client_id, "ops": ops}
+        for _, outbox in self._clients.values():
+            outbox.append(message)
+        return ops
+
+    async def _handle(self, reader, writer):
+        client_id = self._next_id
+        self._next_id += 1
+        outbox = [{"type": "hello", "client": client_id, "revision": self.revision, "text": self.text}]
+        self._clients[client_id] = (writer, outbox)
+        self._handlers.add(asyncio.current_task())
+        try:
+            async for line in reader:
+                message = json.loads(line)
+                if message.get("type") == "ops":
+                    self.receive(client_id, message["revision"], message["ops"])
+        except (ValueError, KeyError, TypeError) as e:
+            # Клієнт із некоректною партією від'єднується, решта працює далі
+            outbox.append({"type": "error", "message": str(e)})
+            await self._flush_one(writer, outbox)
+        except ConnectionError:
+            pass
+        finally:
+            self._clients.pop(client_id, None)
+            self._handlers.discard(asyncio.current_task())
+            writer.close()
+
+    async def _flush_loop(self):
+        while True:
+            await asyncio.sleep(self.tick)
+            await self.flush()
+
+    async def flush(self):
+        """Надсилає кожному клієнту все накопичене за такт одним записом."""
+        await asyncio.gather(
+            *(self._flush_one(writer, outbox) for writer, outbox in list(self._clients.values()) if outbox),
+            return_exceptions=True,
+        )
+
+    @staticmethod
+    async def _flush_one(writer, outbox: list):
+        data = b"".join(_encode(message) for message in outbox)
+        outbox.clear()
+        writer.write(data)
+        await writer.drain()
+
+
+class CollabClient:
+    """Синхронізує документ EditorFacade з CollabServer.
+
+    Клієнт підписаний на документ: кожен локальний запис порівнюється з
+    останнім синхронізованим текстом, і різниця стає окремою вузькою
+    операцією (одна широка різниця за весь такт охоплювала б чужі правки,
+    що потрапили між локальними). Номер версії документа дозволяє
+    пропустити порівняння, якщо змін не було. Накопичені операції
+    надсилаються раз за такт. Віддалені операції застосовуються через
+    apply_edit під lock документа і не потрапляють в історію undo.
+    """
+
+    def __init__(self, facade, tick: float = 0.01):
+        self.facade = facade
+        self.tick = tick
+        self.client_id = None
+        self.revision = 0
+        self.error = None
+        self._outstanding = []
+        # Партія може звестися до порожньої, але підтвердження все одно прийде
+        self._awaiting = False
+        self._buffer = []
+        self._shadow = ""
+        self._seen_version = None
+        self._writer = None
+        self._tasks = []
+        self._document = None
+        self._applying = False
+
+    async def connect(self, host: str, port: int):
+        reader, writer = await asyncio.open_connection(host, port, limit=_LINE_LIMIT)
+        await self._start(reader, writer)
+
+    async def connect_unix(self, path: str):
+        reader, writer = await asyncio.open_unix_connection(path, limit=_LINE_LIMIT)
+        await self._start(reader, writer)
+
+    async def _start(self, reader, writer):
+        self._writer = writer
+        hello = json.loads(await reader.readline())
+        self.client_id = hello["client"]
+        self.revision = hello["revision"]
+        document = self._document = self.facade.document
+        with document.lock:
+            self._applying = True
+            try:
+                document.content = hello["text"]
+            finally:
+                self._applying = False
+            self._shadow = hello["text"]
+            self._seen_version = document.version
+            document.attach(self)
+        self._tasks = [asyncio.ensure_future(self._receive_loop(reader)),
+                       asyncio.ensure_future(self._tick_loop())]
+
+    @property
+    def synced(self) -> bool:
+        """Немає локальних змін, ненадісланих чи непідтверджених операцій."""
+        return (not self._awaiting and not self._buffer
+                and self._document.version == self._seen_version)
+
+    async def wait_synced(self, revision: int = None, timeout: float = 10):
+        """Чекає, поки все локальне підтверджено (і, якщо задано, отримано ревізію revision)."""
+        async def settled():
+            while not self.synced or (revision is not None and self.revision < revision):
+                if self.error:
+                    raise ValueError(self.error)
+                await asyncio.sleep(self.tick)
+        await asyncio.wait_for(settled(), timeout)
+
+    async def close(self):
+        for task in self._tasks:
+            task.cancel()
+        if self._document is not None:
+            self._document.detach(self)
+        if self._writer is not None:
+            self._writer.close()
+
+    def update(self, content: str):
+        """Сповіщення документа про запис (викликається під його lock)."""
+        if not self._applying:
+            self._capture()
+
+    def _capture(self):
+        document = self._document
+        if document.version == self._seen_version:
+            return
+        snapshot = document.snapshot()
+        self._buffer.extend(diff(self._shadow, snapshot.content))
+        self._shadow = snapshot.content
+        self._seen_version = snapshot.version
+
+    def send_pending(self):
+        """Відправляє накопичені за такт правки однією партією."""
+        with self._document.lock:
+            self._capture()
+            if not self._buffer or self._awaiting:
+                return
+            self._outstanding, self._buffer = self._buffer, []
+            self._awaiting = True
+            message = {"type": "ops", "revision": self.revision, "ops": self._outstanding}
+        self._writer.write(_encode(message))
+
+    async def _tick_loop(self):
+        while True:
+            self.send_pending()
+            await asyncio.sleep(self.tick)
+
+    async def _receive_loop(self, reader):
+        async for line in reader:
+            message = json.loads(line)
+            if message["type"] == "ops":
+                self._on_ops(message)
+            elif message["type"] == "error":
+                self.error = message["message"]
+
+    def _on_ops(self, message: dict):
+        ops = [tuple(op) for op in message["ops"]]
+        document = self._document
+        with document.lock:
+            self.revision = message["revision"]
+            if message["client"] == self.client_id:
+                self._outstanding = []
+                self._awaiting = False
+                return
+            # Локальні правки мають бути в буфері до перетворення
+            self._capture()
+            first = self.client_id < message["client"]
+            self._outstanding, ops = transform_ops(self._outstanding, ops, first)
+            self._buffer, ops = transform_ops(self._buffer, ops, first)
+            self._applying = True
+            try:
+                for start, end, text in ops:
+                    document.apply_edit(start, end, text)
+            finally:
+                self._applying = False
+            self._shadow = apply_all(self._shadow, ops)
+            self._seen_version = document.version
@@ -0,0 +1,76 @@
+from collections import OrderedDict
+import os
+import threading
+
+
+class DirectoryListing:
+    """Кешований перелік файлів каталогу на основі os.scandir.
+
+    Записи каталогу (os.DirEntry разом з їхнім кешем stat) зберігаються,
+    доки не зміниться mtime самого каталогу.
+    """
+
+    def __init__(self, max_directories: int = 32):
+        self.max_directories = max_directories
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _directory_mtime(self, directory: str):
+        try:
+            return os.stat(directory).st_mtime_ns
+        except OSError:
+            return None
+
+    def cached_entries(self, directory: str):
+        """Повертає записи з кешу або None, якщо кеш застарів."""
+        mtime = self._directory_mtime(directory)
+        with self._lock:
+            cached = self._cache.get(directory)
+            if cached is None or mtime is None or cached[0] != mtime:
+                return None
+            self._cache.move_to_end(directory)
+            return cached[1]
+
+    def iter_entries(self, directory: str, chunk_size: int = 500):
+        """Віддає записи каталогу порціями, щойно вони прочитані."""
+        entries = self.cached_entries(directory)
+        if entries is not None:
+            for start in range(0, len(entries), chunk_size):
+                yield entries[start:start + chunk_size]
+            return
+        mtime = self._directory_mtime(directory)
+        entries = []
+        chunk = []
+        with os.scandir(directory) as it:
+            for entry in it:
+                chunk.append(entry)
+                if len(chunk) >= chunk_size:
+                    entries.extend(chunk)
+                    yield chunk
+                    chunk = []
+        if chunk:
+            entries.extend(chunk)
+            yield chunk
+        if mtime is None:
+            return
+        with self._lock:
+            self._cache[directory] = (mtime, entries)
+            self._cache.move_to_end(directory)
+            if len(self._cache) > self.max_directories:
+                self._cache.popitem(last=False)
+
+    def list_names(self, directory: str, extension: str = "all") -> list:
+        names = []
+        for chunk in self.iter_entries(directory):
+            names.extend(
+                entry.name for entry in chunk
+                if extension == "all" or entry.name.endswith(extension)
+            )
+        return names
+
+    def invalidate(self, directory: str = None):
+        with self._lock:
+            if directory is None:
+                self._cache.clear()
+            else:
+                self._cache.pop(directory, None)
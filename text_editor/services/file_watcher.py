@@ -0,0 +1,176 @@
+"""Стеження за змінами відкритих файлів іншими процесами.
+
+Працює опитуванням os.stat, без API конкретної ОС. Якщо файл той самий
+(inode), він лише виріс, а перші й останні відомі байти не змінилися,
+зміна вважається дописуванням: читаються тільки нові байти, і їх
+декодує той самий інкрементний декодер, що тримає обрізані посередині
+символи до наступного опитування. Будь-яка інша зміна читає файл
+повністю і повертає основу для тристороннього злиття.
+"""
+import os
+import threading
+from text_editor.document.encoding import CHUNK_SIZE, TextDecoder, read_text
+
+# Скільки байтів з початку й кінця відомого вмісту звіряється перед дочитуванням
+_EDGE = 4096
+
+
+class FileChange:
+    """Зміна файлу на диску.
+
+    kind: "appended" — text містить лише дописаний хвіст; "modified" —
+    text містить новий вміст; "deleted" — файл зник (стеження за ним
+    припиняється). base — вміст, з яким працював редактор до зміни.
+    """
+
+    __slots__ = ("kind", "path", "text", "base", "text_format")
+
+    def __init__(self, kind: str, path: str, text: str = "", base: str = None, text_format=None):
+        self.kind = kind
+        self.path = path
+        self.text = text
+        self.base = base
+        self.text_format = text_format
+
+    def __repr__(self):
+        return f"FileChange({self.kind!r}, {self.path!r}, {len(self.text)} chars)"
+
+
+class _WatchedFile:
+    __slots__ = ("path", "base", "text_format", "declared", "stat", "head", "tail", "decoder")
+
+    def __init__(self, path: str, declared):
+        self.path = path
+        self.declared = declared
+
+
+class FileWatcher:
+    """Опитування відкритих файлів; poll() повертає список FileChange.
+
+    Записи самого редактора мають іти під lock з acknowledge() після
+    запису, інакше власне збереження виглядатиме як зовнішня зміна.
+    """
+
+    def __init__(self):
+        self.lock = threading.RLock()
+        self._files = {}
+
+    def watch(self, path: str, text: str, text_format, declared=None, size: int = None):
+        """Починає стежити за path, вміст якого на диску відповідає text.
+
+        declared — визначення кодування обробником формату (для повторного
+        читання після змін); size — кількість байтів, що відповідає text,
+        якщо файл міг вирости від моменту читання чи запису.
+        """
+        path = os.path.abspath(path)
+        with self.lock:
+            entry = self._files.get(path) or _WatchedFile(path, declared)
+            if declared is not None:
+                entry.declared = declared
+            self._baseline(entry, text, text_format, size)
+            self._files[path] = entry
+
+    def unwatch(self, path: str):
+        with self.lock:
+            self._files.pop(os.path.abspath(path), None)
+
+    def watched(self) -> list:
+        with self.lock:
+            return list(self._files)
+
+    def acknowledge(self, path: str, text: str, text_format, size: int = None):
+        """Фіксує власний запис редактора як новий відомий стан файлу."""
+        self.watch(path, text, text_format, size=size)
+
+    def guard(self, path: str):
+        """ValueError, якщо файл змінився від останнього відомого стану (викликати під lock)."""
+        entry = self._files.get(os.path.abspath(path))
+        if entry is not None and self._stat(entry.path) != entry.stat:
+            raise ValueError(f"File was changed by another program: {path}")
+
+    def is_current(self, path: str, text: str) -> bool:
+        """Чи збігається text з останнім відомим вмістом файлу на диску."""
+        entry = self._files.get(os.path.abspath(path))
+        return entry is not None and entry.base == text
+
+    def poll(self) -> list:
+        """Перевіряє всі файли; під час запису редактора нічого не робить."""
+        if not self.lock.acquire(blocking=False):
+            return []
+        try:
+            changes = (self._check(entry) for entry in list(self._files.values()))
+            return [change for change in changes if change is not None]
+        finally:
+            self.lock.release()
+
+    @staticmethod
+    def _stat(path: str):
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            return None
+        return stat.st_ino, stat.st_size, stat.st_mtime_ns
+
+    def _baseline(self, entry: _WatchedFile, text: str, text_format, size: int = None):
+        entry.base = text
+        entry.text_format = text_format
+        entry.decoder = TextDecoder(text_format.encoding)
+        entry.stat = self._stat(entry.path)
+        entry.head = entry.tail = b""
+        if entry.stat is None:
+            return
+        if size is not None and size < entry.stat[1]:
+            # Файл уже виріс після запису: наступне опитування дочитає решту
+            entry.stat = (entry.stat[0], size, None)
+        with open(entry.path, 'rb') as f:
+            entry.head, entry.tail = self._edges(f, entry.stat[1])
+
+    @staticmethod
+    def _edges(f, size: int) -> tuple:
+        f.seek(0)
+        head = f.read(min(_EDGE, size))
+        f.seek(max(size - _EDGE, 0))
+        return head, f.read(min(_EDGE, size))
+
+    def _check(self, entry: _WatchedFile):
+        stat = self._stat(entry.path)
+        if stat == entry.stat:
+            return None
+        if stat is None:
+            del self._files[entry.path]
+            return FileChange("deleted", entry.path, base=entry.base)
+        with open(entry.path, 'rb') as f:
+            if entry.stat is not None and stat[0] == entry.stat[0] and stat[1] > entry.stat[1]:
+                if self._edges(f, entry.stat[1]) == (entry.head, entry.tail):
+                    return self._read_appended(f, entry, stat)
+        try:
+            text, text_format = read_text(entry.path, entry.declared)
+        except (OSError, ValueError):
+            # Файл саме переписується чи тимчасово недоступний: спробуємо наступного разу
+            return None
+        base, old_format = entry.base, entry.text_format
+        self._baseline(entry, text, text_format)
+        if text == base and text_format == old_format:
+            # touch чи перезапис тими самими байтами: зливати нічого
+            return None
+        return FileChange("modified", entry.path, text, base, text_format)
+
+    def _read_appended(self, f, entry: _WatchedFile, stat: tuple):
+        old_size, new_size = entry.stat[1], stat[1]
+        f.seek(old_size)
+        parts = []
+        remaining = new_size - old_size
+        while remaining:
+            data = f.read(min(CHUNK_SIZE, remaining))
+            if not data:
+                break
+            remaining -= len(data)
+            parts.append(entry.decoder.decode(data))
+        text = "".join(parts)
+        entry.stat = (stat[0], new_size - remaining, stat[2])
+        entry.head, entry.tail = self._edges(f, entry.stat[1])
+        if not text:
+            return None
+        base = entry.base
+        entry.base = base + text
+        return FileChange("appended", entry.path, text, base, entry.text_format)
@@ -0,0 +1,170 @@
+from concurrent.futures import ProcessPoolExecutor
+import json
+import os
+import re
+from text_editor.document.decorators import load_decorators_metadata
+
+_WORD = re.compile(r"\w+")
+
+
+def cache_directory() -> str:
+    """Каталог кешу редактора: індекси не потрапляють у каталоги документів."""
+    base = (os.environ.get("LOCALAPPDATA") or os.environ.get("XDG_CACHE_HOME")
+            or os.path.join(os.path.expanduser("~"), ".cache"))
+    return os.path.join(base, "text_editor")
+
+
+def default_index_path(directory: str) -> str:
+    """Файл індексу каталогу directory у кеші; ім'я — хеш абсолютного шляху."""
+    import hashlib
+    key = hashlib.sha256(os.path.abspath(directory).encode('utf-8', 'surrogatepass')).hexdigest()
+    return os.path.join(cache_directory(), "index", key[:32] + ".json")
+
+
+def tokenize(text: str) -> list:
+    return _WORD.findall(text.lower())
+
+
+def _index_file(path: str):
+    """Індексує один файл; виконується у процесі пулу."""
+    try:
+        stat = os.stat(path)
+        with open(path, 'r', encoding='utf-8', errors='replace') as f:
+            words = {}
+            for position, word in enumerate(tokenize(f.read())):
+                words.setdefault(word, []).append(position)
+    except OSError:
+        return path, None, None, None
+    return path, stat.st_mtime_ns, stat.st_size, words
+
+
+def is_encrypted(path: str) -> bool:
+    return any(d.get("type") == "Encryption" for d in load_decorators_metadata(path))
+
+
+class FullTextIndex:
+    """Постійний інвертований індекс слів для файлів у каталозі.
+
+    Оновлюється інкрементно за mtime; перша побудова великого каталогу
+    виконується пулом процесів. Зашифровані документи не індексуються.
+    """
+
+    def __init__(self, directory: str, extensions=(".txt", ".md", ".html"), index_path: str = None,
+                 exclude=is_encrypted, workers: int = None, pool_threshold: int = 64):
+        self.directory = directory
+        self.extensions = tuple(extensions)
+        self.index_path = index_path or default_index_path(directory)
+        self.exclude = exclude
+        self.workers = workers
+        self.pool_threshold = pool_threshold
+        self._files = {}
+        self._postings = {}
+        self._load()
+
+    def _load(self):
+        if not os.path.exists(self.index_path):
+            return
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if data.get("directory") != os.path.abspath(self.directory):
+            return
+        for path, entry in data.get("files", {}).items():
+            self._add(path, entry)
+
+    def save(self):
+        data = {"directory": os.path.abspath(self.directory), "files": self._files}
+        os.makedirs(os.path.dirname(self.index_path) or ".", exist_ok=True)
+        tmp_path = self.index_path + ".tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, separators=(",", ":"))
+        os.replace(tmp_path, self.index_path)
+
+    def _add(self, path: str, entry: dict):
+        self._files[path] = entry
+        for word, positions in entry["words"].items():
+            self._postings.setdefault(word, {})[path] = positions
+
+    def _remove(self, path: str):
+        entry = self._files.pop(path, None)
+        if entry is None:
+            return
+        for word in entry["words"]:
+            docs = self._postings.get(word)
+            if docs is not None:
+                docs.pop(path, None)
+                if not docs:
+                    del self._postings[word]
+
+    def _scan(self) -> dict:
+        found = {}
+        for root, _, filenames in os.walk(self.directory):
+            for name in filenames:
+                if not name.lower().endswith(self.extensions):
+                    continue
+                path = os.path.join(root, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                found[path] = (stat.st_mtime_ns, stat.st_size)
+        return found
+
+    def update(self) -> int:
+        """Переіндексовує нові та змінені файли; повертає кількість змін."""
+        found = self._scan()
+        changed = 0
+        for path in list(self._files):
+            if path not in found:
+                self._remove(path)
+                changed += 1
+        stale = []
+        for path, (mtime, size) in found.items():
+            entry = self._files.get(path)
+            if entry and entry["mtime"] == mtime and entry["size"] == size:
+                continue
+            if self.exclude and self.exclude(path):
+                self._remove(path)
+                continue
+            stale.append(path)
+        for path, mtime, size, words in self._index_files(stale):
+            self._remove(path)
+            if words is not None:
+                self._add(path, {"mtime": mtime, "size": size, "words": words})
+            changed += 1
+        if changed:
+            self.save()
+        return changed
+
+    def _index_files(self, paths: list):
+        if len(paths) < self.pool_threshold:
+            return map(_index_file, paths)
+        workers = self.workers or os.cpu_count() or 1
+        chunksize = max(1, len(paths) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(_index_file, paths, chunksize=chunksize))
+
+    def search(self, phrase: str) -> list:
+        """Повертає відсортовані шляхи файлів, що містять фразу."""
+        words = tokenize(phrase)
+        if not words:
+            return []
+        postings = [self._postings.get(word) for word in words]
+        if not all(postings):
+            return []
+        postings.sort(key=len)
+        candidates = set(postings[0]).intersection(*postings[1:])
+        if len(words) == 1:
+            return sorted(candidates)
+        result = []
+        for path in candidates:
+            first = self._postings[words[0]][path]
+            following = [set(self._postings[word][path]) for word in words[1:]]
+            if any(all(start + i in positions for i, positions in enumerate(following, 1)) for start in first):
+                result.append(path)
+        return sorted(result)
+
+    def __len__(self) -> int:
+        return len(self._files)
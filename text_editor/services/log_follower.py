@@ -0,0 +1,149 @@
+"""Режим стеження за журналом, що постійно росте (як tail -F).
+
+Файл не читається повністю: останні рядки знаходяться читанням блоків
+з кінця назад, а далі читаються лише дописані байти, не більше
+max_batch за раз. Пам'ять і час кожного кроку залежать від обсягу
+дописаного, а не від розміру файлу. Якщо файл обрізали чи замінили новим
+(ротація журналу), читання починається з початку нового файлу.
+"""
+import os
+from text_editor.document.encoding import HEAD_SIZE, TextDecoder, byte_order_mark, detect_encoding
+
+_BLOCK = 65536
+# Скільки останніх прочитаних байтів звіряється, щоб помітити переписаний файл того ж розміру
+_SIGNATURE = 64
+
+
+def last_lines(text: str, count: int) -> str:
+    """Останні count рядків text; кінець рядка в самому кінці не починає новий рядок."""
+    index = len(text) - 1 if text.endswith("\n") else len(text)
+    for _ in range(count):
+        index = text.rfind("\n", 0, index)
+        if index == -1:
+            return text
+    return text[index + 1:]
+
+
+class LogFollower:
+    """Читає кінець файлу path, а далі — лише дописане."""
+
+    def __init__(self, path: str, max_batch: int = 4 * 1024 * 1024):
+        self.path = path
+        self.max_batch = max_batch
+        self.encoding = None
+        self.offset = 0
+        self._file = None
+        self._inode = None
+        self._start = 0
+        self._newline = b"\n"
+        self._decoder = None
+        self._mtime = None
+        self._signature = b""
+
+    def start(self, lines: int = 1000) -> str:
+        """Відкриває файл і повертає його останні lines рядків."""
+        self._open()
+        stat = os.fstat(self._file.fileno())
+        self.offset = self._tail_offset(stat.st_size, lines)
+        return self._read(stat.st_size - self.offset, stat.st_mtime_ns)
+
+    def _open(self):
+        self.close()
+        self._file = open(self.path, 'rb')
+        self._inode = os.fstat(self._file.fileno()).st_ino
+        head = self._file.read(HEAD_SIZE)
+        self.encoding, bom, _ = detect_encoding(head)
+        self._start = len(byte_order_mark(self.encoding)) if bom else 0
+        probe = TextDecoder(self.encoding)
+        probe.decode(head[self._start:])
+        self._newline = ("\r" if probe.newline == "\r" else "\n").encode(self.encoding)
+        # Один пошкоджений байт у журналі не має зупиняти перегляд
+        self._decoder = TextDecoder(self.encoding, errors="replace")
+        self.offset = self._start
+
+    def _tail_offset(self, size: int, lines: int) -> int:
+        """Зсув початку останніх lines рядків."""
+        newline, unit = self._newline, len(self._newline)
+        if lines <= 0:
+            return size
+        end = size
+        # Кінець рядка в самому кінці файлу не відокремлює ще один рядок
+        if end - unit >= self._start:
+            self._file.seek(end - unit)
+            if self._file.read(unit) == newline:
+                end -= unit
+        found = 0
+        position = end
+        while position > self._start:
+            # Початок блоку вирівняний на одиницю кодування, тож кінець рядка не розривається
+            block_start = max(self._start, position - _BLOCK)
+            block_start -= (block_start - self._start) % unit
+            self._file.seek(block_start)
+            block = self._file.read(position - block_start)
+            index = block.rfind(newline)
+            while index != -1:
+                if index % unit == 0:
+                    found += 1
+                    if found == lines:
+                        return block_start + index + unit
+                index = block.rfind(newline, 0, index + unit - 1)
+            position = block_start
+        return self._start
+
+    def _read(self, count: int, mtime: int) -> str:
+        self._file.seek(self.offset)
+        parts = []
+        while count > 0:
+            data = self._file.read(min(_BLOCK, count))
+            if not data:
+                break
+            count -= len(data)
+            self.offset += len(data)
+            parts.append(self._decoder.decode(data))
+        self._mtime = mtime
+        self._signature = self._bytes_before(self.offset)
+        return "".join(parts)
+
+    def _bytes_before(self, offset: int) -> bytes:
+        start = max(self._start, offset - _SIGNATURE)
+        self._file.seek(start)
+        return self._file.read(offset - start)
+
+    def _rewritten(self, stat) -> bool:
+        """Файл обрізали, замінили чи переписали з початку, а не дописали."""
+        if stat.st_ino != self._inode or stat.st_size < self.offset:
+            return True
+        return self._bytes_before(self.offset) != self._signature
+
+    def read_new(self, max_lines: int = None) -> str:
+        """Текст, дописаний з останнього виклику (не більше max_batch байтів).
+
+        Якщо задано max_lines, з довшої партії повертаються лише останні
+        max_lines рядків — решту однаково довелося б одразу обрізати.
+        """
+        if self._file is None:
+            raise ValueError("Follow mode is not started")
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            # Старий журнал уже перейменовано, новий ще не створено
+            return ""
+        if stat.st_size == self.offset and stat.st_mtime_ns == self._mtime and stat.st_ino == self._inode:
+            return ""
+        if self._rewritten(stat):
+            self._open()
+        text = self._read(min(stat.st_size - self.offset, self.max_batch), stat.st_mtime_ns)
+        return text if max_lines is None else last_lines(text, max_lines)
+
+    @property
+    def pending(self) -> int:
+        """Скільки байтів дописано, але ще не прочитано."""
+        try:
+            return max(os.stat(self.path).st_size - self.offset, 0)
+        except FileNotFoundError:
+            return 0
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
@@ -0,0 +1,161 @@
+import sys
+import time
+import tracemalloc
+import types
+from text_editor.document.decorators import CompiledDocument
+
+_SKIPPED = (type, types.ModuleType, types.FunctionType, types.MethodType,
+            types.BuiltinFunctionType, types.CodeType, types.FrameType)
+
+
+def deep_sizeof(obj, seen: set = None) -> int:
+    """Розмір obj разом із вмістом контейнерів і атрибутами об'єктів.
+
+    Об'єкти з seen не рахуються вдруге, тож спільний seen для кількох
+    розділів звіту не враховує один рядок двічі. Функції, класи, модулі
+    та віджети tkinter пропускаються.
+    """
+    if seen is None:
+        seen = set()
+    size = 0
+    stack = [obj]
+    while stack:
+        current = stack.pop()
+        if id(current) in seen or isinstance(current, _SKIPPED):
+            continue
+        if type(current).__module__.startswith("tkinter"):
+            continue
+        seen.add(id(current))
+        size += sys.getsizeof(current)
+        if isinstance(current, dict):
+            stack.extend(current.keys())
+            stack.extend(current.values())
+        elif isinstance(current, (list, tuple, set, frozenset)) or type(current).__name__ == "deque":
+            stack.extend(current)
+        if hasattr(current, "__dict__"):
+            stack.append(current.__dict__)
+        for slot in getattr(type(current), "__slots__", ()):
+            if hasattr(current, slot):
+                stack.append(getattr(current, slot))
+    return size
+
+
+def _layers(document) -> list:
+    if isinstance(document, CompiledDocument):
+        document = document.source
+    layers = []
+    while document is not None:
+        layers.append(document)
+        document = getattr(document, "_document", None)
+    return layers
+
+
+def collect_footprint(facade, extra: dict = None) -> dict:
+    """Розкладає пам'ять редактора за відомими структурами, у байтах.
+
+    Розділи рахуються по черзі зі спільним seen: документ, потім стеки
+    undo/redo (лише те, що не спільне з документом), кеші декораторів,
+    спостерігачі та додаткові об'єкти з extra (кеш превʼю, індекси тощо).
+    """
+    seen = set()
+    layers = _layers(facade.document)
+    document = layers[-1]
+    # Сам ланцюжок не рахуємо як вміст його шарів
+    seen.update(id(layer) for layer in layers)
+    seen.add(id(document.__dict__))
+    seen.add(id(getattr(document, "_observers", None)))
+    footprint = {"document": deep_sizeof(vars(document).get("_content", ""), seen)}
+    footprint["undo_stack"] = deep_sizeof(facade.undo_redo._undo_stack, seen)
+    footprint["redo_stack"] = deep_sizeof(facade.undo_redo._redo_stack, seen)
+    decorators = {}
+    for layer in layers[:-1]:
+        # seen зберігає id, тому тимчасові контейнери тут не створюються
+        state = vars(layer)
+        seen.add(id(state))
+        size = sys.getsizeof(state) + sum(
+            deep_sizeof(value, seen) for name, value in state.items() if name != "_document"
+        )
+        name = type(layer).__name__
+        decorators[name] = decorators.get(name, 0) + size
+    footprint["decorators"] = decorators
+    footprint["observers"] = {
+        f"{type(observer).__name__}#{index}": deep_sizeof(observer, seen)
+        for index, observer in enumerate(getattr(document, "_observers", []))
+    }
+    for name, obj in (extra or {}).items():
+        footprint[name] = deep_sizeof(obj, seen)
+    return footprint
+
+
+def _total(value) -> int:
+    return sum(value.values()) if isinstance(value, dict) else value
+
+
+class MemoryProfiler:
+    """Знімки пам'яті: tracemalloc плюс розклад за структурами редактора."""
+
+    def __init__(self, frames: int = 1):
+        self.frames = frames
+        self.snapshots = []
+
+    def start(self):
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.frames)
+
+    def stop(self):
+        if tracemalloc.is_tracing():
+            tracemalloc.stop()
+        self.snapshots.clear()
+
+    def take(self, facade, extra: dict = None) -> dict:
+        self.start()
+        snapshot = {
+            "time": time.time(),
+            "footprint": collect_footprint(facade, extra),
+            "traced": tracemalloc.get_traced_memory()[0],
+            "tracemalloc": tracemalloc.take_snapshot().filter_traces([
+                tracemalloc.Filter(False, tracemalloc.__file__),
+                tracemalloc.Filter(False, __file__),
+            ]),
+        }
+        self.snapshots.append(snapshot)
+        return snapshot
+
+    @staticmethod
+    def diff(older: dict, newer: dict, limit: int = 10) -> dict:
+        """Зміни між двома знімками: за розділами та за рядками коду."""
+        sections = {}
+        for name in newer["footprint"].keys() | older["footprint"].keys():
+            before = older["footprint"].get(name, 0)
+            after = newer["footprint"].get(name, 0)
+            if isinstance(before, dict) or isinstance(after, dict):
+                before, after = before or {}, after or {}
+                for key in after.keys() | before.keys():
+                    sections[f"{name}.{key}"] = after.get(key, 0) - before.get(key, 0)
+            else:
+                sections[name] = after - before
+        top = newer["tracemalloc"].compare_to(older["tracemalloc"], "lineno")[:limit]
+        return {
+            "seconds": newer["time"] - older["time"],
+            "traced": newer["traced"] - older["traced"],
+            "sections": dict(sorted(sections.items(), key=lambda item: -abs(item[1]))),
+            "top": [(str(stat.traceback), stat.size_diff, stat.count_diff) for stat in top],
+        }
+
+
+def format_report(snapshot: dict, diff: dict = None) -> str:
+    lines = [f"Traced by tracemalloc: {snapshot['traced']:,} B", "", "Footprint:"]
+    for name, value in snapshot["footprint"].items():
+        lines.append(f"  {name:<24} {_total(value):>14,} B")
+        if isinstance(value, dict):
+            for key, size in value.items():
+                lines.append(f"    {key:<22} {size:>14,} B")
+    if diff is not None:
+        lines += ["", f"Diff over {diff['seconds']:.1f} s (traced {diff['traced']:+,} B):"]
+        for name, delta in diff["sections"].items():
+            if delta:
+                lines.append(f"  {name:<24} {delta:>+14,} B")
+        lines += ["", "Top allocations since previous snapshot:"]
+        for where, size, count in diff["top"]:
+            lines.append(f"  {where}: {size:+,} B in {count:+} blocks")
+    return "\n".join(lines)
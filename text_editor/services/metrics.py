@@ -0,0 +1,173 @@
+import functools
+import json
+import os
+import threading
+import time
+from collections import deque
+from text_editor.document.document import Document
+from text_editor.document.decorators import (
+    DocumentDecorator, AutoSaveDecorator, ValidationDecorator,
+    EncryptionDecorator, StatisticsDecorator
+)
+from text_editor.commands.undo_redo import UndoRedoManager
+from text_editor.facade.editor_facade import EditorFacade
+
+
+def _content_size(args, result):
+    return len(result) if isinstance(result, str) else len(args[1])
+
+
+def _edit_size(args, result):
+    return len(args[3])
+
+
+def _file_size(args, result):
+    try:
+        return os.path.getsize(args[1])
+    except OSError:
+        return 0
+
+
+# (клас, атрибут, назва метрики, функція розміру в байтах/символах)
+TARGETS = [
+    (Document, "notify", "Document.notify", None),
+    (UndoRedoManager, "execute", "UndoRedoManager.execute", None),
+    (UndoRedoManager, "undo", "UndoRedoManager.undo", None),
+    (UndoRedoManager, "redo", "UndoRedoManager.redo", None),
+    (EditorFacade, "open_from_file", "EditorFacade.open_from_file", _file_size),
+    (EditorFacade, "save_to_file", "EditorFacade.save_to_file", _file_size),
+    # Вікно читає і пише файли через load_file/write_file, а правки йдуть через apply_edit
+    (EditorFacade, "load_file", "EditorFacade.load_file", _file_size),
+    (EditorFacade, "write_file", "EditorFacade.write_file", _file_size),
+] + [
+    (decorator, "content", f"{decorator.__name__}.content", _content_size)
+    for decorator in (DocumentDecorator, AutoSaveDecorator, ValidationDecorator,
+                      EncryptionDecorator, StatisticsDecorator)
+] + [
+    (decorator, "apply_edit", f"{decorator.__name__}.apply_edit", _edit_size)
+    for decorator in (DocumentDecorator, ValidationDecorator, EncryptionDecorator, StatisticsDecorator)
+]
+
+
+class Metric:
+    """Лічильник викликів, сумарний час, оброблені символи і вибірка затримок."""
+
+    def __init__(self, sample_size: int = 2048):
+        self.count = 0
+        self.total = 0.0
+        self.bytes = 0
+        self.samples = deque(maxlen=sample_size)
+
+    def add(self, seconds: float, size: int):
+        self.count += 1
+        self.total += seconds
+        self.bytes += size
+        self.samples.append(seconds)
+
+    def summary(self) -> dict:
+        samples = sorted(self.samples)
+        def percentile(p):
+            return samples[min(int(len(samples) * p), len(samples) - 1)] * 1000 if samples else 0.0
+        return {
+            "count": self.count,
+            "total_ms": self.total * 1000,
+            "p50_ms": percentile(0.5),
+            "p99_ms": percentile(0.99),
+            "bytes": self.bytes,
+        }
+
+
+class MetricsRegistry:
+    """Інструментування гарячих шляхів, яке вмикається під час роботи.
+
+    enable() підміняє методи з TARGETS обгортками з таймером, disable()
+    повертає оригінали, тому вимкнене інструментування нічого не коштує.
+    """
+
+    def __init__(self, targets: list = None, sample_size: int = 2048):
+        self.targets = TARGETS if targets is None else targets
+        self.sample_size = sample_size
+        self._metrics = {}
+        self._originals = []
+        self._lock = threading.Lock()
+        self._dump_stop = None
+        self._dump_thread = None
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self._originals)
+
+    def record(self, name: str, seconds: float, size: int = 0):
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = Metric(self.sample_size)
+            metric.add(seconds, size)
+
+    def _timed(self, name: str, func, size):
+        record = self.record
+        clock = time.perf_counter
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            start = clock()
+            result = func(*args, **kwargs)
+            record(name, clock() - start, size(args, result) if size else 0)
+            return result
+        return wrapper
+
+    def enable(self):
+        if self.enabled:
+            return
+        for owner, attribute, name, size in self.targets:
+            original = owner.__dict__[attribute]
+            if isinstance(original, property):
+                wrapped = property(
+                    self._timed(f"{name}.get", original.fget, size),
+                    self._timed(f"{name}.set", original.fset, size) if original.fset else None,
+                )
+            else:
+                wrapped = self._timed(name, original, size)
+            self._originals.append((owner, attribute, original))
+            setattr(owner, attribute, wrapped)
+
+    def disable(self):
+        while self._originals:
+            owner, attribute, original = self._originals.pop()
+            setattr(owner, attribute, original)
+
+    def reset(self):
+        with self._lock:
+            self._metrics.clear()
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {name: metric.summary() for name, metric in sorted(self._metrics.items())}
+
+    def dump(self, path: str):
+        tmp_path = path + ".tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({"timestamp": time.time(), "metrics": self.snapshot()}, f, indent=2)
+        os.replace(tmp_path, path)
+
+    def start_dump(self, path: str, interval: float = 10.0):
+        """Періодично записує знімок у path у фоновому потоці."""
+        self.stop_dump()
+        stop = self._dump_stop = threading.Event()
+
+        def loop():
+            while not stop.wait(interval):
+                self.dump(path)
+            self.dump(path)
+        self._dump_thread = threading.Thread(target=loop, daemon=True)
+        self._dump_thread.start()
+
+    def stop_dump(self):
+        """Зупиняє періодичний запис; останній знімок записується перед виходом."""
+        if self._dump_stop is not None:
+            self._dump_stop.set()
+            self._dump_thread.join()
+            self._dump_stop = self._dump_thread = None
+
+
+metrics = MetricsRegistry()
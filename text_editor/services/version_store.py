@@ -0,0 +1,193 @@
+import hashlib
+import json
+import os
+import threading
+import time
+import zlib
+
+_SCALE = 2 ** 32
+
+
+def content_chunks(data: bytes, min_size: int = 2048, avg_size: int = 8192, max_size: int = 65536):
+    """Ділить data на шматки, межі яких визначає вміст, а не зсув.
+
+    Межа ставиться після рядка, якщо CRC32 рядка менший за поріг,
+    пропорційний його довжині, тож у середньому шматок має avg_size байт.
+    Правка змінює лише шматок, у який потрапила, і, можливо, сусідній:
+    решта меж залежить тільки від власних рядків і збігається між версіями.
+    Рядки, довші за max_size, ріжуться на рівні частини.
+    """
+    scale = _SCALE / max(avg_size - min_size, 1)
+    chunk_start = position = 0
+    for line in data.splitlines(keepends=True):
+        end = position + len(line)
+        if end - chunk_start > max_size:
+            if position > chunk_start:
+                yield data[chunk_start:position]
+                chunk_start = position
+            while end - chunk_start > max_size:
+                yield data[chunk_start:chunk_start + max_size]
+                chunk_start += max_size
+        position = end
+        if position - chunk_start >= min_size and zlib.crc32(line) < len(line) * scale:
+            yield data[chunk_start:position]
+            chunk_start = position
+    if position > chunk_start:
+        yield data[chunk_start:position]
+
+
+class VersionStore:
+    """Локальне контентно-адресоване сховище версій документів.
+
+    Кожна версія — список SHA-256 шматків (див. content_chunks) у журналі
+    документа versions/<hash шляху>.log, по рядку JSON на версію. Шматки
+    лежать у chunks/ один раз для всіх версій і всіх документів; gc()
+    видаляє ті, на які не посилається жоден журнал.
+    """
+
+    def __init__(self, root: str, min_size: int = 2048, avg_size: int = 8192, max_size: int = 65536):
+        if not 0 < min_size < avg_size < max_size:
+            raise ValueError("Chunk sizes must satisfy 0 < min_size < avg_size < max_size")
+        self.root = root
+        self.min_size = min_size
+        self.avg_size = avg_size
+        self.max_size = max_size
+        self._logs = {}
+        self._lock = threading.Lock()
+        os.makedirs(os.path.join(root, "chunks"), exist_ok=True)
+        os.makedirs(os.path.join(root, "versions"), exist_ok=True)
+
+    def _chunk_path(self, digest: str) -> str:
+        return os.path.join(self.root, "chunks", digest[:2], digest[2:])
+
+    def _log_path(self, path: str) -> str:
+        key = hashlib.sha256(os.path.abspath(path).encode("utf-8")).hexdigest()
+        return os.path.join(self.root, "versions", f"{key}.log")
+
+    def _load_log(self, log_path: str) -> list:
+        if log_path not in self._logs:
+            entries = []
+            if os.path.exists(log_path):
+                with open(log_path, 'r', encoding='utf-8') as f:
+                    entries = [json.loads(line) for line in f if line.strip()]
+            self._logs[log_path] = entries
+        return self._logs[log_path]
+
+    def record(self, path: str, content: str) -> dict:
+        """Записує версію; якщо вміст не змінився з останньої, повертає її ж."""
+        data = content.encode("utf-8")
+        digest = hashlib.sha256(data).hexdigest()
+        with self._lock:
+            log_path = self._log_path(path)
+            entries = self._load_log(log_path)
+            if entries and entries[-1]["sha256"] == digest:
+                return entries[-1]
+            chunks = []
+            for chunk in content_chunks(data, self.min_size, self.avg_size, self.max_size):
+                chunk_digest = hashlib.sha256(chunk).hexdigest()
+                self._write_chunk(chunk_digest, chunk)
+                chunks.append(chunk_digest)
+            entry = {
+                "version": entries[-1]["version"] + 1 if entries else 1,
+                "path": os.path.abspath(path),
+                "time": time.time(),
+                "size": len(data),
+                "sha256": digest,
+                "chunks": chunks,
+            }
+            # Журнал лише дописується: шматки вже на диску до появи посилання
+            with open(log_path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(entry) + "\n")
+            entries.append(entry)
+            return entry
+
+    def _write_chunk(self, digest: str, chunk: bytes):
+        chunk_path = self._chunk_path(digest)
+        if os.path.exists(chunk_path):
+            return
+        os.makedirs(os.path.dirname(chunk_path), exist_ok=True)
+        tmp_path = f"{chunk_path}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(chunk)
+        os.replace(tmp_path, chunk_path)
+
+    def versions(self, path: str) -> list:
+        """Версії документа від найстарішої: номер, час, розмір і хеш вмісту."""
+        with self._lock:
+            entries = self._load_log(self._log_path(path))
+            return [{key: value for key, value in entry.items() if key != "chunks"} for entry in entries]
+
+    def checkout(self, path: str, version: int = None) -> str:
+        """Вміст версії version (або останньої) з перевіркою цілісності."""
+        with self._lock:
+            entries = self._load_log(self._log_path(path))
+            if not entries:
+                raise ValueError(f"No versions recorded for {path}")
+            if version is None:
+                entry = entries[-1]
+            else:
+                entry = next((e for e in entries if e["version"] == version), None)
+                if entry is None:
+                    raise ValueError(f"Unknown version {version} of {path}")
+        parts = []
+        for digest in entry["chunks"]:
+            try:
+                with open(self._chunk_path(digest), 'rb') as f:
+                    parts.append(f.read())
+            except FileNotFoundError:
+                raise ValueError(f"Missing chunk {digest} of {path} version {entry['version']}") from None
+        data = b"".join(parts)
+        if hashlib.sha256(data).hexdigest() != entry["sha256"]:
+            raise ValueError(f"Corrupted version {entry['version']} of {path}")
+        return data.decode("utf-8")
+
+    def prune(self, path: str, keep: int) -> int:
+        """Лишає в журналі останні keep версій; повертає кількість видалених.
+
+        Шматки звільняються лише наступним gc().
+        """
+        with self._lock:
+            log_path = self._log_path(path)
+            entries = self._load_log(log_path)
+            removed = max(len(entries) - max(keep, 0), 0)
+            if removed:
+                kept = entries[removed:]
+                tmp_path = log_path + ".tmp"
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    f.writelines(json.dumps(entry) + "\n" for entry in kept)
+                os.replace(tmp_path, log_path)
+                self._logs[log_path] = kept
+            return removed
+
+    def gc(self) -> dict:
+        """Видаляє шматки без посилань; повертає кількість і обсяг звільненого."""
+        with self._lock:
+            versions_dir = os.path.join(self.root, "versions")
+            referenced = set()
+            for name in os.listdir(versions_dir):
+                if name.endswith(".log"):
+                    for entry in self._load_log(os.path.join(versions_dir, name)):
+                        referenced.update(entry["chunks"])
+            removed = freed = 0
+            chunks_dir = os.path.join(self.root, "chunks")
+            for prefix in os.listdir(chunks_dir):
+                directory = os.path.join(chunks_dir, prefix)
+                for name in os.listdir(directory):
+                    if prefix + name in referenced:
+                        continue
+                    chunk_path = os.path.join(directory, name)
+                    freed += os.path.getsize(chunk_path)
+                    os.remove(chunk_path)
+                    removed += 1
+            return {"chunks": removed, "bytes": freed}
+
+    def stats(self) -> dict:
+        """Кількість і сумарний розмір збережених шматків."""
+        chunks_dir = os.path.join(self.root, "chunks")
+        count = size = 0
+        for prefix in os.listdir(chunks_dir):
+            directory = os.path.join(chunks_dir, prefix)
+            for name in os.listdir(directory):
+                count += 1
+                size += os.path.getsize(os.path.join(directory, name))
+        return {"chunks": count, "bytes": size}
@@ -0,0 +1,133 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from text_editor.facade.editor_facade import EditorFacade
+from text_editor.facade.async_facade import AsyncEditorFacade
+from text_editor.ui.async_tk import TkAsyncRunner
+
+
+def test_async_open_and_save(tmp_path):
+    source = tmp_path / "in.txt"
+    source.write_text("hello async", encoding="utf-8")
+    target = tmp_path / "out.txt"
+    facade = EditorFacade()
+    async_facade = AsyncEditorFacade(facade)
+
+    async def scenario():
+        content = await async_facade.open(str(source))
+        written = await async_facade.save(str(target))
+        return content, written
+
+    content, written = asyncio.run(scenario())
+    assert content == "hello async"
+    assert written == len("hello async")
+    assert target.read_text(encoding="utf-8") == "hello async"
+
+
+def test_superseded_autosave_is_cancelled(tmp_path):
+    path = str(tmp_path / "doc.txt")
+    async_facade = AsyncEditorFacade(EditorFacade())
+
+    async def scenario():
+        # Перший запис уже йде, другий чекає в черзі й витісняється третім
+        saves = [asyncio.ensure_future(async_facade.autosave(path, text)) for text in ("first", "old", "new")]
+        return await asyncio.gather(*saves, return_exceptions=True)
+
+    first, older, newer = asyncio.run(scenario())
+    assert first == 5
+    assert isinstance(older, asyncio.CancelledError)
+    assert newer == 3
+    with open(path, encoding="utf-8") as f:
+        assert f.read() == "new"
+
+
+class FakeRoot:
+    def __init__(self):
+        self.scheduled = []
+
+    def after(self, ms, callback):
+        self.scheduled.append(callback)
+
+    def pump(self):
+        while self.scheduled:
+            self.scheduled.pop(0)()
+
+
+def test_tk_runner_delivers_results_through_after(tmp_path):
+    root = FakeRoot()
+    runner = TkAsyncRunner(root)
+    results, errors = [], []
+
+    async def ok():
+        return 42
+
+    async def fail():
+        raise ValueError("boom")
+
+    runner.submit(ok(), on_done=results.append)
+    runner.submit(fail(), on_error=errors.append)
+    assert root.scheduled
+    runner.wait_idle(timeout=5)
+    root.pump()
+    runner.close()
+    assert results == [42]
+    assert len(errors) == 1 and str(errors[0]) == "boom"
+
+
+def test_tk_runner_calls_blocking_functions_off_the_tk_thread():
+    root = FakeRoot()
+    runner = TkAsyncRunner(root)
+    threads = []
+
+    def blocking(value):
+        threads.append(threading.current_thread())
+        return value * 2
+
+    results = []
+    runner.call(blocking, 21, on_done=results.append)
+    runner.wait_idle(timeout=5)
+    root.pump()
+    runner.close()
+    assert results == [42]
+    assert threads[0] is not threading.main_thread()
+
+
+def test_tk_runner_skips_superseded_saves(tmp_path):
+    root = FakeRoot()
+    runner = TkAsyncRunner(root)
+    executor = ThreadPoolExecutor(max_workers=1)
+    gate = threading.Event()
+    # Поки ворота закриті, перший запис не завершиться і решта стоїть у черзі
+    executor.submit(gate.wait)
+    async_facade = AsyncEditorFacade(EditorFacade(), executor=executor)
+    path = str(tmp_path / "doc.txt")
+    done, errors = [], []
+
+    futures = [
+        runner.submit(async_facade.autosave(path, text), on_done=done.append, on_error=errors.append)
+        for text in ("first", "middle", "last")
+    ]
+    gate.set()
+    runner.wait_idle(timeout=5)
+    executor.shutdown()
+    root.pump()
+    runner.close()
+    assert futures[1].cancelled()
+    assert done == [5, 4] and errors == []
+    with open(path, encoding="utf-8") as f:
+        assert f.read() == "last"
+
+
+def test_load_leaves_facade_untouched_until_adopted(tmp_path):
+    path = tmp_path / "next.txt"
+    path.write_text("next file", encoding="utf-8")
+    facade = EditorFacade()
+    facade.set_content("current")
+    async_facade = AsyncEditorFacade(facade)
+    document = facade.factory.create_document("")
+    loaded = asyncio.run(async_facade.load(str(path), document))
+    assert facade.get_content() == "current"
+    assert document.content == "next file"
+    facade.adopt_document(str(path), document, loaded)
+    assert facade.document is document
+    assert facade.text_format.encoding == "utf-8"
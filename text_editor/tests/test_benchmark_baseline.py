@@ -0,0 +1,66 @@
+import json
+import pytest
+from text_editor.benchmarks.baseline import (
+    compare, load_stats, main, parse_threshold, save_baseline
+)
+
+
+def write_results(path, means):
+    data = {"benchmarks": [
+        {"fullname": name, "stats": {"min": mean / 2, "mean": mean, "median": mean}}
+        for name, mean in means.items()
+    ]}
+    path.write_text(json.dumps(data), encoding="utf-8")
+    return str(path)
+
+
+def test_parse_threshold():
+    assert parse_threshold("mean:10%") == ("mean", 0.1)
+    assert parse_threshold("min:25") == ("min", 0.25)
+    for text in ("mean", "avg:10%", "mean:x%"):
+        with pytest.raises(ValueError):
+            parse_threshold(text)
+
+
+def test_compare_reports_only_regressions_over_threshold():
+    baseline = {"a": {"mean": 1.0}, "b": {"mean": 1.0}, "c": {"mean": 1.0}}
+    current = {"a": {"mean": 1.05}, "b": {"mean": 1.5}, "new": {"mean": 9.0}}
+    regressions = compare(baseline, current, [("mean", 0.1)])
+    assert [(r["name"], round(r["change"], 2)) for r in regressions] == [("b", 0.5)]
+
+
+def test_save_and_compare_cli(tmp_path, capsys):
+    baseline = str(tmp_path / "baselines" / "core.json")
+    save_baseline(write_results(tmp_path / "old.json", {"x": 1e-6, "y": 2e-6}), baseline)
+    assert load_stats(baseline)["y"]["mean"] == 2e-6
+
+    same = write_results(tmp_path / "same.json", {"x": 1e-6, "y": 2.1e-6})
+    assert main(["compare", same, "--baseline", baseline]) == 0
+    slower = write_results(tmp_path / "slow.json", {"x": 1e-6, "y": 3e-6})
+    assert main(["compare", slower, "--baseline", baseline]) == 1
+    assert "y: mean" in capsys.readouterr().out
+    assert main(["compare", slower, "--baseline", baseline, "--threshold", "mean:60%"]) == 0
+    assert main(["compare", slower, "--baseline", baseline, "--threshold", "bogus"]) == 2
+
+
+def test_names_do_not_depend_on_rootdir(tmp_path):
+    results = write_results(tmp_path / "r.json", {
+        "root/package/text_editor/benchmarks/bench_core.py::test_x[1KB]": 1e-6,
+    })
+    assert list(load_stats(results)) == ["bench_core.py::test_x[1KB]"]
+
+
+def test_committed_baseline_covers_core_benchmarks():
+    from text_editor.benchmarks.baseline import DEFAULT_BASELINE
+    names = load_stats(DEFAULT_BASELINE)
+    assert "bench_core.py::test_create_decorator_chain" in names
+
+
+def test_committed_baseline_matches_pinned_pytest_benchmark():
+    import os
+    from text_editor.benchmarks.baseline import DEFAULT_BASELINE
+    requirements = os.path.join(os.path.dirname(DEFAULT_BASELINE), "..", "..", "..", "requirements.txt")
+    with open(requirements, encoding="utf-8") as f:
+        pins = dict(line.strip().split("==") for line in f if "==" in line)
+    with open(DEFAULT_BASELINE, encoding="utf-8") as f:
+        assert json.load(f)["version"] == pins["pytest-benchmark"]
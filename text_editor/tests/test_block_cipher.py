@@ -0,0 +1,124 @@
+import random
+import pytest
+from text_editor.document.document import Document
+from text_editor.document.block_cipher import BlockCipher
+from text_editor.document.decorators import (
+    EncryptionDecorator, StatisticsDecorator, create_decorator_chain,
+    collect_decorators_metadata, compile_decorator_chain
+)
+
+
+def test_block_cipher_roundtrip_and_nonces():
+    cipher = BlockCipher("key", block_size=8)
+    text = "Привіт, світе! " * 10
+    encrypted = cipher.encrypt(text)
+    assert text not in encrypted
+    assert cipher.decrypt(encrypted) == text
+    assert cipher.encrypt(text) != encrypted
+    assert cipher.length(encrypted) == len(text)
+
+
+def test_block_cipher_wrong_key():
+    encrypted = BlockCipher("key", 8).encrypt("secret text")
+    with pytest.raises(ValueError, match="Неправильний пароль"):
+        BlockCipher("other", 8).decrypt(encrypted)
+
+
+def test_block_cipher_detects_tampering():
+    cipher = BlockCipher("key", 4)
+    header, *lines = cipher.encrypt("abcdefghijkl").split("\n")
+    with pytest.raises(ValueError):
+        cipher.decrypt("\n".join([header, lines[1], lines[0], lines[2]]))
+    with pytest.raises(ValueError):
+        cipher.decrypt("\n".join([header] + lines[:2]))
+    length, tag, payload = lines[1].split(":")
+    forged = payload[:-4] + ("AAAA" if payload[-4:] != "AAAA" else "BBBB")
+    with pytest.raises(ValueError, match="Пошкоджений"):
+        cipher.decrypt("\n".join([header, lines[0], f"{length}:{tag}:{forged}", lines[2]]))
+
+
+def test_block_cipher_read_range_decrypts_only_needed_blocks():
+    cipher = BlockCipher("key", 10)
+    text = "".join(chr(ord("a") + i % 26) for i in range(1000))
+    encrypted = cipher.encrypt(text)
+    calls = []
+    original = cipher.decrypt_block
+    cipher.decrypt_block = lambda line: calls.append(line) or original(line)
+    assert cipher.read_range(encrypted, 495, 505) == text[495:505]
+    assert len(calls) == 2
+
+
+def test_block_cipher_apply_edit_reencrypts_only_touched_blocks():
+    cipher = BlockCipher("key", 16)
+    rng = random.Random(3)
+    text = "".join(rng.choice("abc \n") for _ in range(500))
+    encrypted = cipher.encrypt(text)
+    for _ in range(200):
+        start = rng.randint(0, len(text))
+        end = rng.randint(start, min(len(text), start + 20))
+        insert = "".join(rng.choice("xyz\n") for _ in range(rng.randint(0, 20)))
+        before = set(encrypted.split("\n")[1:])
+        encrypted = cipher.apply_edit(encrypted, start, end, insert)
+        text = text[:start] + insert + text[end:]
+        assert len(set(encrypted.split("\n")[1:]) - before) <= 4
+    assert cipher.decrypt(encrypted) == text
+    block_lengths = [int(line.split(":")[0]) for line in encrypted.split("\n")[1:]]
+    assert max(block_lengths) <= 16
+    with pytest.raises(ValueError):
+        cipher.apply_edit(encrypted, 0, len(text) + 1, "")
+
+
+def test_encryption_decorator_block_mode():
+    base = Document()
+    doc = EncryptionDecorator(base, "secret", mode="block", block_size=32)
+    doc.content = "line one\nline two\n" * 20
+    assert base.content.startswith("AEAD1:32:")
+    assert doc.content == "line one\nline two\n" * 20
+    assert doc.read_range(9, 17) == "line two"
+    doc.apply_edit(0, 4, "LINE")
+    assert doc.content.startswith("LINE one")
+    assert "".join(doc.iter_read()) == doc.content
+    metadata = doc.get_metadata()
+    del metadata["key_check"]
+    assert metadata == {
+        "type": "Encryption", "enabled": True, "mode": "block", "block_size": 32,
+    }
+    with pytest.raises(ValueError):
+        EncryptionDecorator(Document(), "k", mode="rot13")
+
+
+def test_block_mode_restored_from_metadata_and_not_compiled():
+    chain = StatisticsDecorator(EncryptionDecorator(Document(), "k", mode="block", block_size=64))
+    metadata = collect_decorators_metadata(chain)
+    restored = create_decorator_chain(Document(), metadata, encryption_key="k")
+    assert restored._document.mode == "block"
+    assert restored._document.block_size == 64
+
+    compiled = compile_decorator_chain(chain)
+    compiled.content = "hello world"
+    assert compiled._target is chain._document
+    assert chain.content == "hello world"
+    assert compiled.get_statistics()["word_count"] == 2
+
+
+def test_xor_mode_stays_default():
+    base = Document()
+    doc = EncryptionDecorator(base, "k")
+    doc.content = "text"
+    assert doc.get_metadata()["mode"] == "xor"
+    assert EncryptionDecorator(Document(base.content), "k").read_range(1, 3) == "ex"
+
+
+def test_streamed_encryption_matches_whole_encryption(tmp_path):
+    from text_editor.document.document import FileDocument
+    text = "".join(f"line {i}\n" for i in range(500))
+    cipher = BlockCipher("key", 64)
+    streamed = "".join(cipher.iter_encrypt(text[i:i + 100] for i in range(0, len(text), 100)))
+    assert cipher.decrypt(streamed) == text
+    assert streamed.count("\n") == cipher.encrypt(text).count("\n")
+    assert cipher.decrypt("".join(cipher.iter_encrypt([]))) == ""
+
+    base = FileDocument(str(tmp_path / "doc.enc"))
+    doc = EncryptionDecorator(base, "key", mode="block", block_size=64)
+    doc.write_from(text[i:i + 100] for i in range(0, len(text), 100))
+    assert "".join(doc.iter_read()) == text
@@ -0,0 +1,62 @@
+import json
+import os
+import pytest
+from text_editor.cli import build_decorators_metadata, main, process_file
+from text_editor.document.decorators import EncryptionDecorator
+from text_editor.document.key_derivation import check_key
+from text_editor.document.document import Document
+
+def make_tree(tmp_path):
+    src = tmp_path / "src"
+    (src / "sub").mkdir(parents=True)
+    (src / "a.txt").write_text("hello world", encoding="utf-8")
+    (src / "sub" / "b.md").write_text("# Title\n\nsome **text**\n", encoding="utf-8")
+    (src / "ignored.bin").write_text("x", encoding="utf-8")
+    return src
+
+def test_build_decorators_metadata():
+    metadata = build_decorators_metadata(["validation", "encryption"], max_length=5, key="k")
+    assert check_key("k", metadata[1].pop("key_check"))
+    assert metadata == [
+        {"type": "Validation", "enabled": True, "max_length": 5},
+        {"type": "Encryption", "enabled": True, "mode": "xor"},
+    ]
+    with pytest.raises(ValueError):
+        build_decorators_metadata(["unknown"])
+
+def test_process_file_collects_statistics(tmp_path):
+    src = make_tree(tmp_path)
+    options = {"decorators": build_decorators_metadata(["statistics"])}
+    result = process_file(str(src / "a.txt"), options)
+    assert result["status"] == "ok"
+    assert result["statistics"]["word_count"] == 2
+
+def test_process_file_reports_validation_errors(tmp_path):
+    src = make_tree(tmp_path)
+    options = {"decorators": build_decorators_metadata(["validation"], max_length=3)}
+    result = process_file(str(src / "a.txt"), options)
+    assert result["status"] == "error"
+    assert "validation" in result["error"]
+
+def test_main_converts_and_encrypts_tree(tmp_path):
+    src = make_tree(tmp_path)
+    out = tmp_path / "out"
+    summary_file = tmp_path / "summary.json"
+    code = main([str(src), "--decorators", "encryption,statistics", "--key", "secret",
+                 "--convert", "--output-dir", str(out), "--summary", str(summary_file),
+                 "--workers", "2", "--chunk-size", "1", "--quiet"])
+    assert code == 0
+    summary = json.loads(summary_file.read_text(encoding="utf-8"))
+    assert summary["total"] == 2 and summary["failed"] == 0
+    html_path = out / "sub" / "b.html"
+    assert os.path.exists(html_path)
+    with open(html_path, encoding="utf-8", newline="") as f:
+        doc = EncryptionDecorator(Document(f.read()), "secret")
+    assert "<h1>Title</h1>" in doc.content
+
+def test_main_returns_error_code_on_failures(tmp_path, capsys):
+    src = make_tree(tmp_path)
+    code = main([str(src), "--decorators", "validation", "--max-length", "1", "--workers", "1", "--quiet"])
+    assert code == 1
+    summary = json.loads(capsys.readouterr().out)
+    assert summary["failed"] == 2
@@ -0,0 +1,148 @@
+import asyncio
+import json
+from text_editor.benchmarks.bench_collab import simulate
+from text_editor.commands.command import EditCommand
+from text_editor.facade.editor_facade import EditorFacade
+from text_editor.services.collab import CollabClient, CollabServer
+
+
+async def _connected(count, text="", tick=0.002):
+    server = CollabServer(text, tick=tick)
+    host, port = await server.start()
+    clients = []
+    for _ in range(count):
+        client = CollabClient(EditorFacade(), tick=tick)
+        await client.connect(host, port)
+        clients.append(client)
+    return server, clients
+
+
+async def _settle(server, clients):
+    for client in clients:
+        await client.wait_synced()
+    for client in clients:
+        await client.wait_synced(server.revision)
+
+
+async def _shutdown(server, clients):
+    for client in clients:
+        await client.close()
+    await server.close()
+
+
+def test_clients_receive_initial_text_and_converge():
+    async def scenario():
+        server, (first, second) = await _connected(2, "hello world")
+        assert first.facade.get_content() == second.facade.get_content() == "hello world"
+        # Обидва правлять ту саму версію до того, як побачать правку іншого
+        first.facade.undo_redo.execute(EditCommand(first.facade.document, 5, 5, ","))
+        second.facade.undo_redo.execute(EditCommand(second.facade.document, 6, 11, "there"))
+        await _settle(server, [first, second])
+        contents = (server.text, first.facade.get_content(), second.facade.get_content())
+        await _shutdown(server, [first, second])
+        return contents
+
+    assert asyncio.run(scenario()) == ("hello, there",) * 3
+
+
+def test_full_text_writes_become_delta_operations():
+    async def scenario():
+        server, (writer, reader) = await _connected(2, "x" * 1000)
+        writer.facade.set_content("x" * 500 + "!" + "x" * 500)
+        await _settle(server, [writer, reader])
+        history = list(server.history)
+        content = reader.facade.get_content()
+        await _shutdown(server, [writer, reader])
+        return history, content
+
+    history, content = asyncio.run(scenario())
+    assert history == [(1, [(500, 500, "!")])]
+    assert content == "x" * 500 + "!" + "x" * 500
+
+
+def test_remote_edits_are_not_added_to_undo_history():
+    async def scenario():
+        server, (first, second) = await _connected(2, "abc")
+        first.facade.undo_redo.execute(EditCommand(first.facade.document, 3, 3, "d"))
+        await _settle(server, [first, second])
+        stack = list(second.facade.undo_redo._undo_stack)
+        await _shutdown(server, [first, second])
+        return stack, second.facade.get_content()
+
+    stack, content = asyncio.run(scenario())
+    assert stack == [] and content == "abcd"
+
+
+def test_invalid_batch_disconnects_only_that_client():
+    async def scenario():
+        server, (client,) = await _connected(1, "abc")
+        host, port = server._server.sockets[0].getsockname()[:2]
+        reader, writer = await asyncio.open_connection(host, port)
+        await reader.readline()
+        writer.write((json.dumps({"type": "ops", "revision": 0, "ops": [[2, 9, ""]]}) + "\n").encode())
+        error = json.loads(await reader.readline())
+        writer.close()
+        client.facade.set_content("abcd")
+        await _settle(server, [client])
+        text = server.text
+        await _shutdown(server, [client])
+        return error, text
+
+    error, text = asyncio.run(scenario())
+    assert error["type"] == "error" and "out of range" in error["message"]
+    assert text == "abcd"
+
+
+def test_unix_socket_transport(tmp_path):
+    async def scenario():
+        path = str(tmp_path / "collab.sock")
+        server = CollabServer("shared")
+        await server.start_unix(path)
+        client = CollabClient(EditorFacade())
+        await client.connect_unix(path)
+        client.facade.set_content("shared doc")
+        await client.wait_synced()
+        text = server.text
+        await _shutdown(server, [client])
+        return text
+
+    assert asyncio.run(scenario()) == "shared doc"
+
+
+def test_many_simulated_clients_converge():
+    result = asyncio.run(simulate(clients=12, edits=25, seed=3, tick=0.002))
+    assert result["converged"]
+    assert result["edits"] == 300
+    assert result["revisions"] < result["edits"]
+
+
+def test_batch_reduced_to_nothing_still_waits_for_acknowledgement():
+    async def scenario():
+        server, (client,) = await _connected(1, "abc")
+        # Далі партії й розсилки лише вручну
+        server.tick = client.tick = 60
+        await asyncio.sleep(0.05)
+        outbox = server._clients[client.client_id][1]
+        client.facade.undo_redo.execute(EditCommand(client.facade.document, 1, 2, ""))
+        client.send_pending()
+        # Інший автор тим часом видаляє весь текст: партія клієнта зводиться до порожньої
+        server.receive(99, 0, [(0, 3, "")])
+        await asyncio.sleep(0.05)
+        acknowledgement = outbox.pop()
+        await server.flush()
+        await asyncio.sleep(0.05)
+        client.facade.undo_redo.execute(EditCommand(client.facade.document, 0, 0, "x"))
+        client.send_pending()
+        server.receive(99, 1, [(0, 0, "y")])
+        outbox.insert(0, acknowledgement)
+        for _ in range(5):
+            await server.flush()
+            await asyncio.sleep(0.05)
+            client.send_pending()
+        contents = server.text, client.facade.get_content()
+        await _shutdown(server, [client])
+        return contents
+
+    text, content = asyncio.run(scenario())
+    assert content == text
+    assert sorted(text) == ["x", "y"]
@@ -0,0 +1,114 @@
+import pytest
+from text_editor.commands.command import SetTextCommand
+from text_editor.document.container import ContainerReader, is_container, write_container
+from text_editor.document.decorators import StatisticsDecorator, ValidationDecorator
+from text_editor.document.document_factory import MdDocument
+from text_editor.facade.editor_facade import EditorFacade
+
+
+def _lines(count):
+    return [f"рядок {n} " + "x" * (n % 37) for n in range(count)]
+
+
+@pytest.mark.parametrize("compression", ["none", "zlib", "lzma"])
+def test_round_trip_and_metadata(tmp_path, compression):
+    path = str(tmp_path / "doc.tedc")
+    content = "\n".join(_lines(1000)) + "\n"
+    decorators = [{"type": "Statistics", "enabled": True}]
+    write_container(path, content, ".md", decorators, compression, block_size=4096, stride=16)
+    assert is_container(path)
+    with ContainerReader(path) as reader:
+        assert reader.filetype == ".md"
+        assert reader.decorators == decorators
+        assert reader.line_count == 1000
+        assert reader.stats["line_count"] == 1000
+        assert reader.stats["word_count"] == len(content.split())
+        assert reader.stats["size"] == len(content.encode("utf-8"))
+        assert reader.read() == content
+
+
+def test_seek_to_any_line_reads_only_nearby_blocks(tmp_path):
+    path = str(tmp_path / "doc.tedc")
+    lines = _lines(5000)
+    write_container(path, "\n".join(lines), block_size=2048, stride=32)
+    with ContainerReader(path) as reader:
+        assert reader.line_count == 5000
+        decoded = []
+        original = reader._decompress
+        reader._decompress = lambda data: decoded.append(1) or original(data)
+        assert reader.line(4321) == lines[4321]
+        assert len(decoded) <= 2
+        assert reader.lines(4990, 20) == lines[4990:]
+        assert reader.lines(0, 3) == lines[:3]
+        assert reader.lines(5000, 1) == []
+        with pytest.raises(ValueError):
+            reader.line(5000)
+
+
+def test_empty_document(tmp_path):
+    path = str(tmp_path / "empty.tedc")
+    write_container(path, "")
+    with ContainerReader(path) as reader:
+        assert reader.line_count == 0
+        assert reader.read() == ""
+        assert reader.stats["char_count"] == 0
+
+
+def test_rejects_foreign_and_truncated_files(tmp_path):
+    plain = tmp_path / "plain.txt"
+    plain.write_text("just text", encoding="utf-8")
+    assert not is_container(str(plain))
+    with pytest.raises(ValueError):
+        ContainerReader(str(plain))
+    path = tmp_path / "doc.tedc"
+    write_container(str(path), "hello\nworld\n")
+    path.write_bytes(path.read_bytes()[:60])
+    with pytest.raises(ValueError):
+        ContainerReader(str(path))
+    with pytest.raises(ValueError):
+        write_container(str(path), "x", compression="zstd")
+
+
+@pytest.mark.parametrize("compression", ["zlib", "lzma"])
+def test_corrupted_block_is_reported_as_value_error(tmp_path, compression):
+    path = tmp_path / "doc.tedc"
+    write_container(str(path), "\n".join(_lines(100)), compression=compression)
+    with ContainerReader(str(path)) as reader:
+        body = reader._body
+    data = bytearray(path.read_bytes())
+    data[body:body + 8] = b"\xff" * 8
+    path.write_bytes(bytes(data))
+    with ContainerReader(str(path)) as reader:
+        with pytest.raises(ValueError, match="Corrupted document container"):
+            reader.read()
+
+
+def test_opening_container_resets_history_and_text_format(tmp_path):
+    from text_editor.document.encoding import TextFormat
+    path = str(tmp_path / "doc.tedc")
+    write_container(path, "from container")
+    facade = EditorFacade()
+    facade.set_content("old")
+    facade.undo_redo.execute(SetTextCommand(facade.document, "old edit"))
+    facade.text_format = TextFormat("cp1251")
+    facade.open_from_container(path)
+    facade.undo()
+    assert facade.get_content() == "from container"
+    assert facade.text_format is None
+
+
+def test_facade_saves_and_opens_container_with_decorators(tmp_path):
+    path = str(tmp_path / "notes.tedc")
+    facade = EditorFacade()
+    facade.document = StatisticsDecorator(ValidationDecorator(MdDocument(), max_length=100))
+    facade.set_content("# title\nbody text\n")
+    facade.save_to_container(path, compression="lzma")
+
+    other = EditorFacade()
+    stats = other.open_from_container(path)
+    assert stats["word_count"] == 4
+    assert other.get_content() == "# title\nbody text\n"
+    assert other.factory.filetype_of(other.document) == ".md"
+    assert isinstance(other.document, StatisticsDecorator)
+    with pytest.raises(ValueError):
+        other.set_content("x" * 101)
@@ -90,7 +90,7 @@ def test_save_and_load_decorators_metadata():
         test_metadata = [
             {"type": "AutoSave", "enabled": True},
             {"type": "Validation", "enabled": True, "max_length": 5000, "forbidden_words": ["test"]},
-            {"type": "Encryption", "enabled": True, "key": "test_key"},
+            {"type": "Encryption", "enabled": True},
             {"type": "Statistics", "enabled": True}
         ]
         
@@ -180,7 +180,7 @@ def test_create_decorator_chain_with_encryption():
     
     # Тестові метадані з шифруванням
     metadata = [
-        {"type": "Encryption", "enabled": True, "key": "test_key"},
+        {"type": "Encryption", "enabled": True},
         {"type": "Statistics", "enabled": True}
     ]
     
@@ -238,7 +238,133 @@ def test_decorator_metadata_content():
     
     encryption_meta = encryption_decorator.get_metadata()
     assert encryption_meta["type"] == "Encryption"
-    assert encryption_meta["key"] == "secret_key"
+    # Ключ не зберігається разом з метаданими
+    assert "key" not in encryption_meta
     
     statistics_meta = statistics_decorator.get_metadata()
-    assert statistics_meta["type"] == "Statistics" 
\ No newline at end of file
+    assert statistics_meta["type"] == "Statistics" 
+
+
+def test_xor_cipher_matches_per_character_xor():
+    from text_editor.document.decorators import xor_cipher
+    text = "Привіт, world! \U0001F600"
+    key = "k€y"
+    expected = "".join(chr(ord(c) ^ ord(key[i % len(key)])) for i, c in enumerate(text))
+    assert xor_cipher(text, key) == expected
+    assert xor_cipher(text[5:], key, offset=5) == expected[5:]
+
+def test_autosave_after_streaming_write_gets_lazy_view():
+    from text_editor.document.document import ContentView
+    saved = []
+    deco = AutoSaveDecorator(Document(), saved.append)
+    deco.write_from(iter(["hello ", "world"]))
+    (view,) = saved
+    assert isinstance(view, ContentView)
+    assert "".join(view.iter_read(chunk_size=4)) == "hello world"
+    assert str(view) == "hello world"
+
+def test_compiled_chain_matches_nested_chain():
+    from text_editor.document.decorators import compile_decorator_chain, CompiledDocument
+    saved_nested, saved_compiled = [], []
+    def build(saved):
+        base = Document()
+        chain = StatisticsDecorator(EncryptionDecorator(ValidationDecorator(
+            AutoSaveDecorator(base, saved.append), 50), "key"))
+        return base, chain
+    base_nested, nested = build(saved_nested)
+    base_compiled, chain = build(saved_compiled)
+    compiled = compile_decorator_chain(chain)
+    assert isinstance(compiled, CompiledDocument)
+    nested.content = "hello world"
+    compiled.content = "hello world"
+    assert base_nested.content == base_compiled.content
+    assert compiled.content == "hello world"
+    assert saved_nested == saved_compiled
+    assert compiled.get_statistics()["word_count"] == 2
+    with pytest.raises(ValueError, match="Content validation failed"):
+        compiled.content = "x" * 100
+    assert compiled.content == "hello world"
+
+def test_compiled_chain_keeps_metadata_and_skips_passthrough_reads():
+    from text_editor.document.decorators import compile_decorator_chain
+    doc = TxtDocument("abc")
+    chain = AutoSaveDecorator(StatisticsDecorator(doc), lambda content: None)
+    compiled = compile_decorator_chain(chain)
+    assert compiled._read_stages == []
+    assert [m["type"] for m in collect_decorators_metadata(compiled)] == ["Statistics", "AutoSave"]
+    assert compile_decorator_chain(doc) is doc
+
+def test_create_decorator_chain_compiled_mode():
+    metadata = [{"type": "Encryption", "enabled": True}, {"type": "Statistics", "enabled": True}]
+    doc = TxtDocument()
+    compiled = create_decorator_chain(doc, metadata, encryption_key="k", compiled=True)
+    compiled.content = "secret text"
+    assert doc.content != "secret text"
+    assert create_decorator_chain(TxtDocument(doc.content), metadata, encryption_key="k").content == "secret text"
+    with pytest.raises(ValueError):
+        create_decorator_chain(TxtDocument(doc.content), metadata)
+
+def test_streaming_encryption_matches_whole_content():
+    doc = Document()
+    deco = EncryptionDecorator(doc, key="secret")
+    deco.write_from(iter(["hello ", "streaming ", "world"]))
+    reference = Document()
+    EncryptionDecorator(reference, key="secret").content = "hello streaming world"
+    assert doc.content == reference.content
+    assert "".join(deco.iter_read(chunk_size=4)) == "hello streaming world"
+
+def test_streaming_encryption_wrong_key():
+    doc = Document()
+    EncryptionDecorator(doc, key="secret").content = "text"
+    with pytest.raises(ValueError):
+        list(EncryptionDecorator(doc, key="other").iter_read(chunk_size=2))
+
+def test_streaming_validation_aborts_early():
+    consumed = []
+    def chunks():
+        for i in range(100):
+            consumed.append(i)
+            yield "x" * 10
+    doc = Document("original")
+    deco = ValidationDecorator(doc, max_length=25)
+    with pytest.raises(ValueError, match="Content validation failed"):
+        deco.write_from(chunks())
+    assert len(consumed) == 3
+    assert doc.content == "original"
+
+@pytest.mark.parametrize("text", ["hello world\nsecond line", "a\r\nb\rc\n", "  spaced   words  ", "", "word"])
+def test_streaming_statistics_match_full_statistics(text):
+    streamed = StatisticsDecorator(Document())
+    streamed.write_from(text[i:i + 3] for i in range(0, len(text), 3))
+    full = StatisticsDecorator(Document())
+    full.content = text
+    for key in ("char_count", "word_count", "line_count"):
+        assert streamed.get_statistics()[key] == full.get_statistics()[key]
+
+def test_statistics_follow_edits_incrementally():
+    import random
+    rng = random.Random(7)
+    deco = StatisticsDecorator(Document())
+    deco.content = "first line\r\nsecond  line\n"
+    for _ in range(300):
+        length = len(deco.content)
+        start = rng.randint(0, length)
+        end = rng.randint(start, min(length, start + 5))
+        deco.apply_edit(start, end, "".join(rng.choice("ab \r\n") for _ in range(rng.randint(0, 4))))
+        full = StatisticsDecorator(Document())
+        full.content = deco.content
+        for key in ("char_count", "word_count", "line_count"):
+            assert deco.get_statistics()[key] == full.get_statistics()[key]
+
+def test_file_document_streams_through_chain(tmp_path):
+    from text_editor.document.document import FileDocument
+    path = tmp_path / "big.txt"
+    base = FileDocument(str(path))
+    chain = StatisticsDecorator(EncryptionDecorator(ValidationDecorator(base, 10 ** 6), "key"))
+    chain.write_from("line %d\n" % i for i in range(1000))
+    assert chain.get_statistics()["line_count"] == 1000
+    assert "".join(chain.iter_read(chunk_size=100)).startswith("line 0\nline 1\n")
+    with pytest.raises(ValueError):
+        ValidationDecorator(base, 10).write_from(["x" * 20])
+    assert not os.path.exists(str(path) + ".tmp")
+    assert chain.content.endswith("line 999\n")
@@ -0,0 +1,73 @@
+import os
+import time
+from text_editor.services import dir_listing
+from text_editor.services.dir_listing import DirectoryListing
+from text_editor.ui.file_list import FileListLoader
+
+def make_files(tmp_path, count):
+    for i in range(count):
+        (tmp_path / f"file{i}.txt").write_text("x", encoding="utf-8")
+    (tmp_path / "note.md").write_text("x", encoding="utf-8")
+
+def test_list_names_filters_by_extension(tmp_path):
+    make_files(tmp_path, 3)
+    listing = DirectoryListing()
+    assert sorted(listing.list_names(str(tmp_path), ".md")) == ["note.md"]
+    assert len(listing.list_names(str(tmp_path))) == 4
+
+def test_listing_is_cached_until_directory_changes(tmp_path, monkeypatch):
+    make_files(tmp_path, 3)
+    calls = []
+    real_scandir = os.scandir
+    def counting_scandir(path):
+        calls.append(path)
+        return real_scandir(path)
+    monkeypatch.setattr(dir_listing.os, "scandir", counting_scandir)
+    listing = DirectoryListing()
+    listing.list_names(str(tmp_path))
+    listing.list_names(str(tmp_path))
+    assert len(calls) == 1
+    (tmp_path / "new.txt").write_text("x", encoding="utf-8")
+    os.utime(tmp_path, ns=(1, 1))
+    assert "new.txt" in listing.list_names(str(tmp_path))
+    assert len(calls) == 2
+
+def test_iter_entries_yields_chunks(tmp_path):
+    make_files(tmp_path, 9)
+    chunks = list(DirectoryListing().iter_entries(str(tmp_path), chunk_size=4))
+    assert [len(chunk) for chunk in chunks] == [4, 4, 2]
+
+class FakeRoot:
+    def __init__(self):
+        self.callbacks = {}
+        self.next_id = 0
+    def after(self, ms, callback):
+        self.next_id += 1
+        self.callbacks[self.next_id] = callback
+        return self.next_id
+    def after_cancel(self, after_id):
+        self.callbacks.pop(after_id, None)
+    def run(self, timeout=5):
+        deadline = time.time() + timeout
+        while self.callbacks and time.time() < deadline:
+            after_id = min(self.callbacks)
+            self.callbacks.pop(after_id)()
+            time.sleep(0.001)
+
+class FakeListbox:
+    def __init__(self):
+        self.items = []
+    def delete(self, first, last):
+        self.items = []
+    def insert(self, index, *names):
+        self.items.extend(names)
+
+def test_loader_debounces_and_streams_into_listbox(tmp_path):
+    make_files(tmp_path, 25)
+    root, listbox = FakeRoot(), FakeListbox()
+    loader = FileListLoader(root, listbox, DirectoryListing(), chunk_size=10)
+    loader.request("/nonexistent", lambda name: True)
+    loader.request(str(tmp_path), lambda name: name.endswith(".txt"))
+    assert len(root.callbacks) == 1
+    root.run()
+    assert sorted(listbox.items) == sorted(f"file{i}.txt" for i in range(25))
@@ -90,4 +90,73 @@ def test_decorator_multiple_saves():
     deco.content = "First"
     deco.content = "Second"
     deco.content = "Third"
-    assert saved_contents == ["First", "Second", "Third"] 
\ No newline at end of file
+    assert saved_contents == ["First", "Second", "Third"] 
+
+
+def test_snapshot_versions_increase_with_writes():
+    doc = Document("a")
+    first = doc.snapshot()
+    doc.content = "ab"
+    doc.apply_edit(2, 2, "c")
+    assert first.version == 0 and first.content == "a"
+    assert doc.version == 2
+    assert doc.snapshot().content == "abc"
+    assert first.version != doc.version
+
+def test_snapshot_is_immutable():
+    snapshot = Document("text").snapshot()
+    with pytest.raises(AttributeError):
+        snapshot.content = "other"
+
+def test_unload_keeps_version_and_snapshot_content():
+    from text_editor.document.document import Snapshot
+    doc = Document("hello world")
+    doc.apply_edit(5, 5, ",")
+    snapshot = doc.snapshot()
+    doc.unload(snapshot)
+    assert doc.snapshot() is snapshot
+    assert (doc.version, doc.snapshot().content) == (1, "hello, world")
+    with pytest.raises(ValueError):
+        doc.unload(Snapshot(0, "hello world"))
+    doc.restore_content("hello, world")
+    assert (doc.version, doc.content, doc.snapshot().content) == (1, "hello, world", "hello, world")
+
+def test_snapshot_through_encryption_is_plain_text():
+    from text_editor.document.decorators import EncryptionDecorator, StatisticsDecorator
+    for mode in ("xor", "block"):
+        base = Document()
+        doc = StatisticsDecorator(EncryptionDecorator(base, key="k", mode=mode))
+        doc.content = "secret"
+        snapshot = doc.snapshot()
+        assert snapshot.content == "secret"
+        assert snapshot.version == base.version == doc.version
+        assert doc.snapshot() is snapshot
+
+def test_concurrent_writers_and_snapshot_readers():
+    import threading
+    from text_editor.document.decorators import ValidationDecorator
+    doc = ValidationDecorator(Document(), max_length=100000)
+    writers, edits = 4, 200
+    seen = []
+
+    def write():
+        for _ in range(edits):
+            doc.apply_edit(0, 0, "x")
+
+    def read():
+        last = -1
+        while last < writers * edits:
+            snapshot = doc.snapshot()
+            # Версія і вміст знімка завжди узгоджені, версії не йдуть назад
+            assert len(snapshot.content) == snapshot.version
+            assert snapshot.version >= last
+            last = snapshot.version
+        seen.append(last)
+
+    threads = [threading.Thread(target=write) for _ in range(writers)] + [threading.Thread(target=read)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=10)
+    assert doc.content == "x" * writers * edits
+    assert seen == [writers * edits]
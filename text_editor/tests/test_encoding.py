@@ -0,0 +1,104 @@
+import codecs
+import pytest
+from text_editor.document.encoding import TextFormat, detect_encoding, read_text, write_text
+from text_editor.facade.editor_facade import EditorFacade
+
+TEXT = "Привіт, світ\nдругий рядок\n"
+
+
+@pytest.mark.parametrize("data, expected", [
+    (codecs.BOM_UTF8 + "a".encode("utf-8"), ("utf-8", True, True)),
+    (codecs.BOM_UTF16_LE + "a".encode("utf-16-le"), ("utf-16-le", True, True)),
+    (codecs.BOM_UTF32_BE + "a".encode("utf-32-be"), ("utf-32-be", True, True)),
+    ("plain text\n".encode("utf-16-le"), ("utf-16-le", False, True)),
+    ("plain text\n".encode("utf-16-be"), ("utf-16-be", False, True)),
+    ("plain text\n".encode("utf-32-le"), ("utf-32-le", False, True)),
+    (TEXT.encode("utf-32-le"), ("utf-32-le", False, True)),
+    (TEXT.encode("utf-32-be"), ("utf-32-be", False, True)),
+    (TEXT.encode("utf-16-le"), ("utf-16-le", False, True)),
+    (TEXT.encode("utf-8"), ("utf-8", False, False)),
+    ("café “quoted”".encode("cp1252"), ("cp1252", False, False)),
+    (b"\x81\x8d\x8f", ("latin-1", False, False)),
+])
+def test_detect_encoding(data, expected):
+    assert detect_encoding(data) == expected
+
+
+def test_declared_encoding_wins_over_guess():
+    data = b'<html><meta charset="windows-1251"><p>' + "текст".encode("cp1251")
+    declared = lambda head: "windows-1251"
+    assert detect_encoding(data, declared) == ("cp1251", False, True)
+
+
+@pytest.mark.parametrize("text_format", [
+    TextFormat("utf-8"),
+    TextFormat("utf-8", bom=True, newline="\r\n"),
+    TextFormat("utf-16-le", bom=True),
+    TextFormat("utf-16-be", newline="\r"),
+    TextFormat("cp1251", newline="\r\n"),
+])
+def test_round_trip_preserves_format(tmp_path, text_format):
+    path = str(tmp_path / "doc.txt")
+    # Маленькі блоки: межі проходять посеред \r\n і багатобайтових символів
+    write_text(path, TEXT * 50, text_format, chunk_size=7)
+    text, detected = read_text(path, lambda head: "cp1251" if text_format.encoding == "cp1251" else None,
+                               chunk_size=5)
+    assert text == TEXT * 50
+    assert detected == text_format
+
+
+def test_guessed_utf8_falls_back_when_invalid_later(tmp_path):
+    path = tmp_path / "late.txt"
+    path.write_bytes(b"a" * 20000 + "naïve\r\n".encode("cp1252"))
+    text, text_format = read_text(str(path))
+    assert text.endswith("naïve\n")
+    assert text_format == TextFormat("cp1252", newline="\r\n")
+
+
+def test_unencodable_content_is_rejected(tmp_path):
+    path = tmp_path / "doc.txt"
+    path.write_bytes(b"old")
+    with pytest.raises(ValueError):
+        write_text(str(path), "emoji \U0001f600", TextFormat("cp1252"))
+    assert path.read_bytes() == b"old"
+    assert [p.name for p in tmp_path.iterdir()] == ["doc.txt"]
+
+
+def test_facade_preserves_encoding_and_newlines(tmp_path):
+    path = tmp_path / "legacy.txt"
+    path.write_bytes(codecs.BOM_UTF16_LE + "one\r\ntwo\r\n".encode("utf-16-le"))
+    facade = EditorFacade()
+    facade.open_from_file(str(path))
+    assert facade.get_content() == "one\ntwo\n"
+    facade.set_content("one\ntwo\nthree\n")
+    facade.save_to_file(str(path))
+    assert path.read_bytes() == codecs.BOM_UTF16_LE + "one\r\ntwo\r\nthree\r\n".encode("utf-16-le")
+    facade.save_to_file(str(path), encoding="utf-8", newline="\n")
+    assert path.read_bytes() == b"one\ntwo\nthree\n"
+
+
+def test_facade_uses_format_declared_encoding(tmp_path):
+    path = tmp_path / "page.html"
+    path.write_bytes(b'<meta charset="koi8-u"><p>' + "ґанок".encode("koi8-u"))
+    facade = EditorFacade()
+    facade.open_from_file(str(path))
+    assert facade.get_content().endswith("ґанок")
+    assert facade.text_format.encoding == "koi8-u"
+
+
+def test_declared_encoding_that_does_not_decode_is_ignored():
+    data = "Привіт".encode("utf-8")
+    assert detect_encoding(data, lambda head: "ascii") == ("utf-8", False, False)
+
+
+@pytest.mark.parametrize("name", ["notes.rtf", "page.html"])
+@pytest.mark.parametrize("text", ["Привет", "Привіт світ"])
+def test_saved_non_ascii_document_reopens_unchanged(tmp_path, name, text):
+    path = str(tmp_path / name)
+    facade = EditorFacade()
+    facade.set_content(text)
+    facade.save_to_file(path)
+    reopened = EditorFacade()
+    reopened.open_from_file(path)
+    assert reopened.get_content() == text
+    assert reopened.text_format.encoding == "utf-8"
@@ -2,6 +2,7 @@ from text_editor.facade.editor_facade import EditorFacade
 from text_editor.commands.command import SetTextCommand
 import tempfile
 import os
+import pytest
 
 def test_facade_new_document():
     facade = EditorFacade()
@@ -83,10 +84,40 @@ def test_facade_no_save_callback():
     # Не має викликати помилку
     assert facade.get_content() == "Test"
 
-def test_facade_copy_unimplemented():
+def test_facade_copy_paste_appends_by_default():
     facade = EditorFacade()
-    assert facade.copy("text") is None
+    facade.set_content("abc")
+    facade.copy("xyz")
+    assert facade.paste() == "xyz"
+    assert facade.get_content() == "abcxyz"
 
-def test_facade_paste_unimplemented():
+def test_facade_paste_replaces_range_as_one_undo_step():
     facade = EditorFacade()
-    assert facade.paste() is None 
\ No newline at end of file
+    facade.set_content("hello world")
+    facade.copy("big " * 100000)
+    facade.paste(6, 11)
+    assert facade.get_content() == "hello " + "big " * 100000
+    facade.undo()
+    assert facade.get_content() == "hello world"
+    facade.redo()
+    assert facade.get_content().startswith("hello big big")
+
+def test_facade_paste_empty_clipboard_and_bad_range():
+    facade = EditorFacade()
+    facade.set_content("abc")
+    assert facade.paste(1) == ""
+    assert facade.get_content() == "abc"
+    facade.copy("x")
+    with pytest.raises(ValueError):
+        facade.paste(2, 5)
+    assert facade.get_content() == "abc"
+
+def test_facade_cancel_paste_leaves_nothing_to_redo():
+    facade = EditorFacade()
+    facade.set_content("abc")
+    facade.copy("xyz")
+    facade.paste(1, 2)
+    facade.cancel_paste()
+    assert facade.get_content() == "abc"
+    facade.redo()
+    assert facade.get_content() == "abc"
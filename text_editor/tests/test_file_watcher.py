@@ -0,0 +1,126 @@
+import asyncio
+import codecs
+import os
+import pytest
+from text_editor.commands.command import EditCommand
+from text_editor.facade.async_facade import AsyncEditorFacade
+from text_editor.facade.editor_facade import EditorFacade
+from text_editor.services.file_watcher import FileWatcher
+
+
+def _facade(path, content):
+    path.write_bytes(content)
+    facade = EditorFacade()
+    facade.file_watcher = FileWatcher()
+    facade.open_from_file(str(path))
+    return facade
+
+
+def _append(path, data: bytes):
+    with open(path, 'ab') as f:
+        f.write(data)
+
+
+def test_unchanged_file_reports_nothing(tmp_path):
+    facade = _facade(tmp_path / "log.txt", b"line\n")
+    assert facade.file_watcher.poll() == []
+
+
+def test_touch_and_identical_rewrite_report_nothing(tmp_path):
+    path = tmp_path / "log.txt"
+    facade = _facade(path, b"line\n")
+    os.utime(path, ns=(0, 10**9))
+    assert facade.file_watcher.poll() == []
+    path.write_bytes(b"line\n")
+    os.utime(path, ns=(0, 2 * 10**9))
+    assert facade.file_watcher.poll() == []
+    assert facade.file_watcher.poll() == []
+
+
+def test_append_is_read_incrementally_and_applied(tmp_path):
+    path = tmp_path / "log.txt"
+    facade = _facade(path, b"first\r\n")
+    _append(path, b"second\r\nthi")
+    (change,) = facade.file_watcher.poll()
+    assert (change.kind, change.text, change.base) == ("appended", "second\nthi", "first\n")
+    assert facade.apply_external_change(change) == [(6, 6, "second\nthi")]
+    assert facade.get_content() == "first\nsecond\nthi"
+    # Хвіст без кінця рядка дочитується з наступним опитуванням
+    _append(path, b"rd\r\n")
+    (change,) = facade.file_watcher.poll()
+    facade.apply_external_change(change)
+    assert facade.get_content() == "first\nsecond\nthird\n"
+
+
+def test_append_splitting_a_character_waits_for_the_rest(tmp_path):
+    path = tmp_path / "log.txt"
+    facade = _facade(path, codecs.BOM_UTF16_LE + "a\n".encode("utf-16-le"))
+    data = "ї\n".encode("utf-16-le")
+    _append(path, data[:1])
+    assert facade.file_watcher.poll() == []
+    _append(path, data[1:])
+    (change,) = facade.file_watcher.poll()
+    assert change.text == "ї\n"
+
+
+def test_append_keeps_local_edits(tmp_path):
+    path = tmp_path / "log.txt"
+    facade = _facade(path, b"one\ntwo\n")
+    facade.undo_redo.execute(EditCommand(facade.document, 0, 3, "ONE"))
+    facade.undo_redo.execute(EditCommand(facade.document, 8, 8, "local\n"))
+    _append(path, b"three\n")
+    (change,) = facade.file_watcher.poll()
+    facade.apply_external_change(change)
+    assert facade.get_content() == "ONE\ntwo\nlocal\nthree\n"
+    facade.undo()
+    facade.undo()
+    assert facade.get_content() == "one\ntwo\nthree\n"
+
+
+def test_rewrite_is_reported_for_merge(tmp_path):
+    path = tmp_path / "notes.txt"
+    facade = _facade(path, b"a\nb\nc\n")
+    facade.set_content("a\nb\nc\nmine\n")
+    path.write_bytes(b"A\nb\nc\n")
+    os.utime(path, ns=(0, 10 ** 9))
+    (change,) = facade.file_watcher.poll()
+    assert (change.kind, change.base, change.text) == ("modified", "a\nb\nc\n", "A\nb\nc\n")
+    merged, conflicts = facade.merge_external_change(change)
+    assert (merged, conflicts) == ("A\nb\nc\nmine\n", 0)
+    facade.accept_external_change(change, merged)
+    assert facade.get_content() == merged
+    facade.undo()
+    assert facade.get_content() == "a\nb\nc\nmine\n"
+
+
+def test_own_saves_are_not_external_changes(tmp_path):
+    path = tmp_path / "notes.txt"
+    facade = _facade(path, b"text\n")
+    facade.set_content("text\nmore\n")
+    facade.save_to_file(str(path))
+    assert facade.file_watcher.poll() == []
+    _append(path, b"tail\n")
+    (change,) = facade.file_watcher.poll()
+    assert change.text == "tail\n"
+
+
+def test_autosave_refuses_to_overwrite_external_change(tmp_path):
+    path = tmp_path / "log.txt"
+    facade = _facade(path, b"one\n")
+    async_facade = AsyncEditorFacade(facade)
+    _append(path, b"two\n")
+    with pytest.raises(ValueError):
+        asyncio.run(async_facade.autosave(str(path), "one\nlocal\n"))
+    assert path.read_bytes() == b"one\ntwo\n"
+    (change,) = facade.file_watcher.poll()
+    facade.apply_external_change(change)
+    asyncio.run(async_facade.autosave(str(path), facade.get_content()))
+    assert path.read_bytes() == b"one\ntwo\n"
+
+
+def test_deleted_file_is_reported_once(tmp_path):
+    path = tmp_path / "gone.txt"
+    facade = _facade(path, b"x")
+    path.unlink()
+    assert [change.kind for change in facade.file_watcher.poll()] == ["deleted"]
+    assert facade.file_watcher.poll() == []
@@ -0,0 +1,92 @@
+import subprocess
+import sys
+import pytest
+from text_editor.document.document_factory import DocumentFactory, HtmlDocument, MdDocument, RtfDocument, TxtDocument
+from text_editor.document.formats import FormatHandler, FormatRegistry, looks_like_markdown, registry
+from text_editor.document.html_format import HtmlTextFormatter
+from text_editor.document.rtf_format import detect_encoding, rtf_to_text
+
+
+def test_opening_txt_does_not_import_rtf_or_html_machinery():
+    probe = (
+        "import sys\n"
+        "from text_editor.document.document_factory import DocumentFactory\n"
+        "factory = DocumentFactory()\n"
+        "factory.create_document('x', '.txt')\n"
+        "factory.create_document('x', '.html')\n"
+        "print(sorted(m for m in ('text_editor.document.rtf_format', 'text_editor.document.html_format',"
+        " 'html.parser', 'text_editor.document.formatters') if m in sys.modules))\n"
+    )
+    output = subprocess.run([sys.executable, "-c", probe], capture_output=True, text=True, check=True).stdout
+    assert output.strip() == "[]"
+
+
+def test_factory_uses_registry_entry_points():
+    factory = DocumentFactory()
+    assert type(factory.create_document("a", ".md")) is MdDocument
+    assert type(factory.create_document("a", ".RTF")) is RtfDocument
+    assert factory.filetype_of(HtmlDocument()) == ".html"
+    assert set(factory.extensions()) >= {".txt", ".md", ".rtf", ".html"}
+
+
+def test_custom_format_is_loaded_lazily():
+    custom = FormatRegistry()
+    custom.register(FormatHandler("txt", [".txt"], document="text_editor.document.document_factory:TxtDocument"))
+    handler = custom.register(FormatHandler(
+        "log", [".log"], signatures=[b"#log"],
+        document="text_editor.document.document_factory:TxtDocument",
+        renderer="text_editor.document.formatters:PlainTextFormatter",
+    ))
+    assert not handler.loaded("renderer")
+    factory = DocumentFactory(custom)
+    assert type(factory.create_document("x", ".log")) is TxtDocument
+    assert handler.create("renderer").format("abc") == "abc"
+    assert handler.loaded("renderer")
+    assert factory.detect_filetype(None, b"#log v1\n") == ".log"
+    with pytest.raises(ValueError):
+        custom.register(FormatHandler("other", [".log"]))
+    custom.unregister("log")
+    with pytest.raises(ValueError):
+        factory.create_document("x", ".log")
+
+
+def test_detect_prefers_signature_then_extension_then_heuristics():
+    assert registry.detect("notes.txt", b"{\\rtf1\\ansi hello}").name == "rtf"
+    assert registry.detect("page.txt", b"\xef\xbb\xbf  <!DOCTYPE html><p>x</p>").name == "html"
+    assert registry.detect("notes.md", b"plain words").name == "md"
+    assert registry.detect(None, b"# Title\n\ntext\n").name == "md"
+    assert registry.detect(None, b"just some text").name == "txt"
+    assert registry.sniff(b"just some text") is None
+    assert looks_like_markdown(b"intro\n- one\n- two\n")
+
+
+@pytest.mark.parametrize("data, filetype, document_class", [
+    (b"{\\rtf1\\ansi hello}", ".rtf", RtfDocument),
+    (b"<!doctype html><p>hello</p>", ".html", HtmlDocument),
+    (b"plain log line\n", ".txt", TxtDocument),
+])
+def test_open_picks_document_type_by_content(tmp_path, data, filetype, document_class):
+    from text_editor.facade.editor_facade import EditorFacade
+    path = tmp_path / "server.log"
+    path.write_bytes(data)
+    facade = EditorFacade()
+    assert facade.detect_filetype(str(path)) == filetype
+    assert type(facade.factory.create_document("", filetype=filetype)) is document_class
+
+
+def test_rtf_handler_parses_text_and_codepage():
+    rtf = (r"{\rtf1\ansi\ansicpg1251\deff0{\fonttbl{\f0 Arial;}}{\*\generator Test;}"
+           r"\f0 \'cf\'f0\'e8\'e2\'b3\'f2 \b world\b0\par Line\tab two \u8364?\par}")
+    assert detect_encoding(rtf.encode("ascii")) == "cp1251"
+    assert detect_encoding(b"{\\rtf1\\ansi hello}") is None
+    assert detect_encoding("Привіт \\ansicpg1251".encode("utf-8")) is None
+    assert rtf_to_text(rtf) == "Привіт world\nLine\ttwo €\n"
+    assert registry.get("rtf").create("renderer").format(rtf) == rtf_to_text(rtf)
+
+
+def test_html_handler_detects_charset_and_renders_text():
+    handler = registry.get("html")
+    assert handler.detect_encoding(b'<html><head><meta charset="windows-1251">') == "cp1251"
+    assert handler.detect_encoding(b"<html><body>") is None
+    html = "<html><style>p{}</style><h1>Title</h1><p>Some &amp; <b>bold</b></p><script>x()</script></html>"
+    assert HtmlTextFormatter().format(html) == "Title\nSome & bold"
@@ -0,0 +1,65 @@
+import os
+import pytest
+from text_editor.services.full_text_index import FullTextIndex, tokenize
+
+@pytest.fixture(autouse=True)
+def cache_home(tmp_path_factory, monkeypatch):
+    cache = tmp_path_factory.mktemp("cache")
+    monkeypatch.delenv("LOCALAPPDATA", raising=False)
+    monkeypatch.setenv("XDG_CACHE_HOME", str(cache))
+    return cache
+
+def write(path, text):
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(text)
+
+def make_files(tmp_path):
+    write(tmp_path / "a.txt", "The quick brown fox")
+    write(tmp_path / "b.md", "# Brown bears\nquick thinking")
+    write(tmp_path / "c.html", "<p>lazy dog</p>")
+    write(tmp_path / "skip.rtf", "quick brown")
+
+def test_tokenize_lowercases_words():
+    assert tokenize("Hello, World!") == ["hello", "world"]
+
+def test_search_words_and_phrases(tmp_path):
+    make_files(tmp_path)
+    index = FullTextIndex(str(tmp_path), exclude=None)
+    assert index.update() == 3
+    assert [os.path.basename(p) for p in index.search("quick")] == ["a.txt", "b.md"]
+    assert [os.path.basename(p) for p in index.search("quick brown")] == ["a.txt"]
+    assert index.search("brown quick") == []
+    assert index.search("missing") == []
+
+def test_index_persists_and_updates_incrementally(tmp_path):
+    make_files(tmp_path)
+    FullTextIndex(str(tmp_path), exclude=None).update()
+    index = FullTextIndex(str(tmp_path), exclude=None)
+    assert len(index) == 3
+    assert index.update() == 0
+    write(tmp_path / "c.html", "<p>quick cat</p>")
+    os.utime(tmp_path / "c.html", ns=(1, 1))
+    os.remove(tmp_path / "a.txt")
+    assert index.update() == 2
+    assert [os.path.basename(p) for p in index.search("quick")] == ["b.md", "c.html"]
+
+def test_index_is_kept_in_cache_directory(tmp_path, cache_home):
+    make_files(tmp_path)
+    index = FullTextIndex(str(tmp_path), exclude=None)
+    index.update()
+    assert os.path.commonpath([index.index_path, str(cache_home)]) == str(cache_home)
+    assert os.path.exists(index.index_path)
+    assert sorted(os.listdir(tmp_path)) == ["a.txt", "b.md", "c.html", "skip.rtf"]
+
+def test_encrypted_documents_are_excluded(tmp_path):
+    make_files(tmp_path)
+    index = FullTextIndex(str(tmp_path), exclude=lambda path: path.endswith("a.txt"))
+    index.update()
+    assert [os.path.basename(p) for p in index.search("quick")] == ["b.md"]
+
+def test_first_build_uses_process_pool(tmp_path):
+    for i in range(20):
+        write(tmp_path / f"f{i}.txt", f"word{i} shared")
+    index = FullTextIndex(str(tmp_path), exclude=None, workers=2, pool_threshold=5)
+    assert index.update() == 20
+    assert len(index.search("shared")) == 20
@@ -0,0 +1,70 @@
+import pytest
+from text_editor.document.document import Document
+from text_editor.document.decorators import (
+    EncryptionDecorator, create_decorator_chain, collect_decorators_metadata
+)
+from text_editor.document.key_derivation import KeyCache, check_key, make_key_check
+
+
+def test_key_check_roundtrip():
+    cache = KeyCache()
+    record = make_key_check("secret", iterations=1000, cache=cache)
+    assert set(record) == {"salt", "iterations", "verifier"}
+    assert "secret" not in record["verifier"]
+    assert check_key("secret", record, cache)
+    assert not check_key("wrong", record, cache)
+    with pytest.raises(ValueError):
+        check_key("secret", {"salt": "zz"}, cache)
+
+
+def test_key_cache_derives_once(monkeypatch):
+    import text_editor.document.key_derivation as kd
+    calls = []
+    original = kd.derive_key
+    monkeypatch.setattr(kd, "derive_key", lambda *args: calls.append(args) or original(*args))
+    cache = KeyCache(max_size=2)
+    record = make_key_check("pw", iterations=1000, cache=cache)
+    for _ in range(3):
+        assert check_key("pw", record, cache)
+    assert len(calls) == 1
+    cache.derive("a", b"s", 10)
+    cache.derive("b", b"s", 10)
+    check_key("pw", record, cache)
+    assert len(calls) == 4
+
+
+def test_key_cache_remembers_password_per_document(tmp_path):
+    cache = KeyCache()
+    path = str(tmp_path / "doc.txt")
+    assert cache.password_for(path) is None
+    cache.remember(path, "pw")
+    assert cache.password_for(str(tmp_path / "." / "doc.txt")) == "pw"
+    cache.forget(path)
+    assert cache.password_for(path) is None
+
+
+def test_wrong_key_rejected_before_reading_content():
+    cache = KeyCache()
+    base = Document()
+    doc = EncryptionDecorator(base, "secret", key_cache=cache)
+    doc.content = "x" * 100000
+    metadata = collect_decorators_metadata(doc)
+
+    class Unreadable(Document):
+        @property
+        def content(self):
+            raise AssertionError("content must not be read")
+
+    with pytest.raises(ValueError, match="Неправильний пароль"):
+        create_decorator_chain(Unreadable(), metadata, encryption_key="wrong", key_cache=cache)
+    restored = create_decorator_chain(Document(base.content), metadata, encryption_key="secret", key_cache=cache)
+    assert restored.content == "x" * 100000
+
+
+def test_legacy_metadata_without_key_check():
+    base = Document()
+    EncryptionDecorator(base, "secret").content = "text"
+    metadata = [{"type": "Encryption", "enabled": True, "key": "secret"}]
+    doc = create_decorator_chain(Document(base.content), metadata, encryption_key="wrong")
+    with pytest.raises(ValueError):
+        doc.content
@@ -0,0 +1,126 @@
+from text_editor.document.lexers import HtmlLexer, LineStateCache, MarkdownLexer, lexer_for_filetype
+from text_editor.ui.highlighter import SyntaxHighlighter
+
+def full_states(lexer, lines):
+    states = [lexer.initial_state]
+    for line in lines[:-1]:
+        _, state = lexer.tokenize(line, states[-1])
+        states.append(state)
+    return states
+
+def test_lexer_for_filetype():
+    assert isinstance(lexer_for_filetype(".md"), MarkdownLexer)
+    assert isinstance(lexer_for_filetype(".html"), HtmlLexer)
+    assert lexer_for_filetype(".txt") is None
+
+def test_markdown_lexer_tokens():
+    lexer = MarkdownLexer()
+    tokens, state = lexer.tokenize("- a **b** `c`", None)
+    assert (0, 1, "list") in tokens
+    assert (4, 9, "bold") in tokens
+    assert (10, 13, "code") in tokens
+    assert state is None
+    _, state = lexer.tokenize("```python", None)
+    assert state == "```"
+    tokens, state = lexer.tokenize("# not heading", state)
+    assert tokens == [(0, 13, "code")] and state == "```"
+
+def test_html_lexer_multiline_comment_and_tag():
+    lexer = HtmlLexer()
+    tokens, state = lexer.tokenize('<a href="x">&amp; <!-- start', None)
+    tags = [tag for _, _, tag in tokens]
+    assert tags == ["tag", "attribute", "string", "tag", "entity", "comment"]
+    assert state == "comment"
+    tokens, state = lexer.tokenize("end --> <div", state)
+    assert tokens[0] == (0, 7, "comment") and state == "tag"
+
+def test_relex_stops_when_state_converges():
+    lines = ["<p>text</p>"] * 1000
+    lexer = HtmlLexer()
+    cache = LineStateCache(lexer, len(lines))
+    assert cache.relex(lines.__getitem__)
+    calls = []
+    def get_line(index):
+        calls.append(index)
+        return lines[index]
+    lines[500] = "<p>changed</p>"
+    cache.edit(500, 0, 0)
+    assert cache.relex(get_line)
+    assert len(calls) <= 2
+
+def test_relex_after_comment_opened_matches_full_lex():
+    lines = ["<b>x</b>"] * 200
+    lexer = HtmlLexer()
+    cache = LineStateCache(lexer, len(lines))
+    cache.relex(lines.__getitem__)
+    lines[10:11] = ["<!-- open", "still"]
+    cache.edit(10, 0, 1)
+    assert cache.relex(lines.__getitem__)
+    assert [cache.state_at(i) for i in range(len(lines))] == full_states(lexer, lines)
+    lines[10] = "<!-- closed -->"
+    cache.edit(10, 0, 0)
+    assert cache.relex(lines.__getitem__)
+    assert [cache.state_at(i) for i in range(len(lines))] == full_states(lexer, lines)
+
+def test_relex_respects_budget():
+    lines = ["```"] + ["code"] * 100
+    cache = LineStateCache(MarkdownLexer(), len(lines))
+    assert not cache.relex(lines.__getitem__, budget=10)
+    assert not cache.done
+    assert cache.relex(lines.__getitem__)
+    assert cache.state_at(100) == "```"
+
+class FakeText:
+    def __init__(self, lines, visible):
+        self.lines = lines
+        self.visible = visible
+        self.tagged = []
+        self.scheduled = []
+        self.options = {}
+        self.tk = self
+        self.evaluated = []
+    def cget(self, option):
+        return self.options.get(option, "")
+    def configure(self, **options):
+        self.options.update(options)
+    def eval(self, script):
+        self.evaluated.append(script)
+    def tag_configure(self, tag, **style):
+        pass
+    def bind(self, *args, **kwargs):
+        pass
+    def tag_remove(self, *args):
+        pass
+    def tag_add(self, tag, start, end):
+        self.tagged.append(int(start.split(".")[0]) - 1)
+    def get(self, start, end):
+        return self.lines[int(start.split(".")[0]) - 1]
+    def index(self, spec):
+        return "1.0" if spec == "@0,0" else f"{self.visible}.0"
+    def winfo_height(self):
+        return 100
+    def after(self, ms, callback):
+        self.scheduled.append(callback)
+        return len(self.scheduled)
+
+def test_highlighter_tags_only_visible_lines():
+    lines = ["<p>x</p>"] * 5000
+    text = FakeText(lines, visible=20)
+    highlighter = SyntaxHighlighter(text, HtmlLexer(), budget=100)
+    highlighter.reset("\n".join(lines))
+    assert max(text.tagged) < 20
+    assert text.scheduled
+    while text.scheduled:
+        text.scheduled.pop()()
+    assert highlighter.cache.done
+
+def test_highlighter_retags_on_any_scroll_and_keeps_scrollbar():
+    lines = ["<p>x</p>"] * 100
+    text = FakeText(lines, visible=20)
+    text.options["yscrollcommand"] = ".scrollbar set"
+    highlighter = SyntaxHighlighter(text, HtmlLexer())
+    highlighter.reset("\n".join(lines))
+    text.scheduled.clear()
+    text.options["yscrollcommand"]("0.5", "0.7")
+    assert text.evaluated == [".scrollbar set 0.5 0.7"]
+    assert len(text.scheduled) == 1
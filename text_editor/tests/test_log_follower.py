@@ -0,0 +1,108 @@
+import codecs
+import os
+import pytest
+from text_editor.facade.editor_facade import EditorFacade
+from text_editor.services.log_follower import LogFollower, last_lines
+
+
+def _log(path, count, encoding="utf-8", newline="\n", bom=b""):
+    data = "".join(f"line {i}{newline}" for i in range(count)).encode(encoding)
+    path.write_bytes(bom + data)
+
+
+def _append(path, text, encoding="utf-8"):
+    with open(path, 'ab') as f:
+        f.write(text.encode(encoding))
+
+
+def test_last_lines():
+    assert last_lines("a\nb\nc\n", 2) == "b\nc\n"
+    assert last_lines("a\nb\nc", 2) == "b\nc"
+    assert last_lines("a\nb\n", 5) == "a\nb\n"
+
+
+@pytest.mark.parametrize("encoding, newline, bom", [
+    ("utf-8", "\n", b""),
+    ("utf-8", "\r\n", codecs.BOM_UTF8),
+    ("utf-16-le", "\n", codecs.BOM_UTF16_LE),
+    ("utf-16-be", "\r\n", codecs.BOM_UTF16_BE),
+])
+def test_start_reads_only_the_last_lines(tmp_path, encoding, newline, bom):
+    path = tmp_path / "app.log"
+    _log(path, 50000, encoding, newline, bom)
+    follower = LogFollower(str(path))
+    text = follower.start(3)
+    assert text == "line 49997\nline 49998\nline 49999\n"
+    assert follower.offset == os.path.getsize(path)
+    follower.close()
+
+
+def test_start_on_short_and_unterminated_files(tmp_path):
+    path = tmp_path / "app.log"
+    path.write_bytes(b"one\ntwo")
+    follower = LogFollower(str(path))
+    assert follower.start(5) == "one\ntwo"
+    follower.close()
+    path.write_bytes(b"")
+    assert LogFollower(str(path)).start(5) == ""
+
+
+def test_read_new_returns_only_appended_text(tmp_path):
+    path = tmp_path / "app.log"
+    _log(path, 10)
+    follower = LogFollower(str(path))
+    follower.start(1)
+    assert follower.read_new() == ""
+    _append(path, "new 1\nnew ")
+    assert follower.read_new() == "new 1\nnew "
+    # Символ, розірваний між записами, дочитується наступного разу
+    data = "2 ї\n".encode("utf-8")
+    with open(path, 'ab') as f:
+        f.write(data[:-2])
+    assert follower.read_new() == "2 "
+    with open(path, 'ab') as f:
+        f.write(data[-2:])
+    assert follower.read_new() == "ї\n"
+    follower.close()
+
+
+def test_batches_are_bounded(tmp_path):
+    path = tmp_path / "app.log"
+    path.write_bytes(b"")
+    follower = LogFollower(str(path), max_batch=100)
+    follower.start()
+    _append(path, "x" * 99 + "\n" + "tail\n")
+    assert follower.read_new() == "x" * 99 + "\n"
+    assert follower.pending == 5
+    assert follower.read_new() == "tail\n"
+    _append(path, "".join(f"{i}\n" for i in range(20)))
+    assert follower.read_new(max_lines=2) == "18\n19\n"
+    follower.close()
+
+
+def test_truncated_or_rotated_log_is_read_from_start(tmp_path):
+    path = tmp_path / "app.log"
+    _log(path, 100)
+    follower = LogFollower(str(path))
+    follower.start(1)
+    os.replace(path, tmp_path / "app.log.1")
+    assert follower.read_new() == ""
+    path.write_bytes(b"fresh\n")
+    assert follower.read_new() == "fresh\n"
+    path.write_bytes(b"")
+    _append(path, "again\n")
+    assert follower.read_new() == "again\n"
+    follower.close()
+
+
+def test_facade_follow_leaves_document_untouched(tmp_path):
+    path = tmp_path / "app.log"
+    _log(path, 100)
+    facade = EditorFacade()
+    facade.set_content("draft")
+    assert facade.follow(str(path), 2) == "line 98\nline 99\n"
+    _append(path, "line 100\n")
+    assert facade.follower.read_new() == "line 100\n"
+    assert facade.get_content() == "draft"
+    facade.stop_following()
+    assert facade.follower is None
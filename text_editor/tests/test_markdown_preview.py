@@ -0,0 +1,90 @@
+import random
+from text_editor.document.document_factory import MdDocument
+from text_editor.document.formatters import MarkdownFormatter, PlainTextFormatter, iter_markdown_blocks
+from text_editor.document.markdown_preview import MarkdownPreview
+from text_editor.document.text_diff import common_prefix_length, common_suffix_length
+
+SAMPLE = "# Title\n\nSome **bold** text\nand more.\n\n- one\n- two\n  continued\n\n```python\nx = 1 < 2\n```\n"
+
+def test_plain_formatter_returns_text():
+    assert PlainTextFormatter().format("**a**") == "**a**"
+
+def test_markdown_formatter_renders_blocks():
+    html = MarkdownFormatter().format(SAMPLE)
+    assert "<h1>Title</h1>" in html
+    assert "<p>Some <b>bold</b> text\nand more.</p>" in html
+    assert "<li>two continued</li>" in html
+    assert '<pre><code class="language-python">x = 1 &lt; 2</code></pre>' in html
+
+def test_blocks_cover_whole_text():
+    blocks = list(iter_markdown_blocks(SAMPLE))
+    assert "".join(block for _, _, block in blocks) == SAMPLE
+    assert [kind for _, kind, _ in blocks] == [
+        "heading", "blank", "paragraph", "blank", "list", "blank", "code"
+    ]
+
+def test_unterminated_fence_runs_to_end():
+    blocks = list(iter_markdown_blocks("```\ncode\n\n# not heading\n"))
+    assert len(blocks) == 1 and blocks[0][1] == "code"
+
+def test_common_prefix_and_suffix():
+    a = "x" * 10000 + "abc" + "y" * 5000
+    b = "x" * 10000 + "aXc" + "y" * 5000
+    assert common_prefix_length(a, b) == 10001
+    assert common_suffix_length(a, b, len(a) - 10001) == 5001
+
+def test_preview_as_observer():
+    doc = MdDocument()
+    preview = MarkdownPreview()
+    doc.attach(preview)
+    doc.content = "# Hi\n"
+    assert preview.html == "<h1>Hi</h1>\n"
+
+def test_preview_rerenders_only_touched_blocks():
+    paragraphs = "".join(f"Paragraph {i}\n\n" for i in range(1000))
+    preview = MarkdownPreview()
+    preview.render(paragraphs)
+    assert preview.rendered_blocks == 1001
+    edited = paragraphs.replace("Paragraph 500\n", "Paragraph **500**\n")
+    preview.render(edited)
+    assert preview.rendered_blocks == 1
+    assert preview.html == MarkdownFormatter().format(edited)
+
+def test_preview_lru_cache_is_bounded():
+    preview = MarkdownPreview(cache_size=10)
+    preview.render("".join(f"p{i}\n\n" for i in range(50)))
+    assert len(preview._cache) <= 10
+
+def test_preview_matches_full_render_after_random_edits():
+    # Інкрементальний результат завжди має збігатися з повним рендерингом
+    rng = random.Random(42)
+    pieces = ["# h\n", "\n", "text\n", "- item\n", "```\n", "  indent\n", "1. first\n", "**b**"]
+    text = "".join(rng.choice(pieces) for _ in range(40))
+    preview = MarkdownPreview()
+    formatter = MarkdownFormatter()
+    for _ in range(300):
+        start = rng.randint(0, len(text))
+        end = min(len(text), start + rng.randint(0, 10))
+        insert = "".join(rng.choice(pieces) for _ in range(rng.randint(0, 2)))
+        text = text[:start] + insert + text[end:]
+        assert preview.render(text) == formatter.format(text)
+        assert preview.blocks == [(k, b) for _, k, b in iter_markdown_blocks(text)]
+
+def test_preview_patches_reproduce_full_render():
+    # Віджет, що латає лише змінені блоки, показує те саме, що й повний рендеринг
+    rng = random.Random(7)
+    pieces = ["# h\n", "\n", "text\n", "- item\n", "```\n", "**b**"]
+    text = "".join(rng.choice(pieces) for _ in range(40))
+    preview = MarkdownPreview()
+    shown = ""
+    for _ in range(200):
+        change = preview.patch(text)
+        if change is not None:
+            offset, removed, html = change
+            shown = shown[:offset] + html + shown[offset + removed:]
+        assert shown == MarkdownFormatter().format(text)
+        start = rng.randint(0, len(text))
+        end = min(len(text), start + rng.randint(0, 10))
+        text = text[:start] + rng.choice(pieces) + text[end:]
+    assert preview.patch(text) is not None
+    assert preview.patch(text) is None
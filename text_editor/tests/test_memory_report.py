@@ -0,0 +1,54 @@
+import sys
+from text_editor.document.document import Document
+from text_editor.document.decorators import StatisticsDecorator, EncryptionDecorator
+from text_editor.document.markdown_preview import MarkdownPreview
+from text_editor.commands.command import SetTextCommand
+from text_editor.facade.editor_facade import EditorFacade
+from text_editor.services.memory_report import (
+    MemoryProfiler, collect_footprint, deep_sizeof, format_report
+)
+
+
+def test_deep_sizeof_counts_shared_objects_once():
+    text = "x" * 10000
+    assert deep_sizeof([text, text]) < 2 * sys.getsizeof(text)
+    seen = set()
+    assert deep_sizeof(text, seen) >= 10000
+    assert deep_sizeof({"a": text}, seen) < 1000
+    assert deep_sizeof(len) == 0
+
+
+def test_footprint_sections():
+    facade = EditorFacade()
+    facade.document = StatisticsDecorator(EncryptionDecorator(Document(), "k", mode="block", block_size=64))
+    preview = MarkdownPreview()
+    facade.document._document._document.attach(preview)
+    for i in range(5):
+        facade.undo_redo.execute(SetTextCommand(facade.document, f"# version {i}\n" * 1000))
+    facade.undo()
+
+    footprint = collect_footprint(facade, {"extra": ["y" * 5000]})
+    assert footprint["document"] > 10000
+    assert footprint["undo_stack"] > 4 * 10000
+    assert footprint["redo_stack"] >= 0
+    assert footprint["decorators"]["EncryptionDecorator"] > footprint["decorators"]["StatisticsDecorator"]
+    assert footprint["observers"]["MarkdownPreview#0"] > 10000
+    assert footprint["extra"] >= 5000
+
+
+def test_profiler_diff_reports_growth():
+    profiler = MemoryProfiler()
+    facade = EditorFacade()
+    try:
+        first = profiler.take(facade)
+        for i in range(20):
+            facade.undo_redo.execute(SetTextCommand(facade.document, str(i) * 10000))
+        second = profiler.take(facade)
+        diff = profiler.diff(first, second)
+        assert diff["sections"]["undo_stack"] > 20 * 10000 * 0.9
+        assert list(diff["sections"])[0] in ("undo_stack", "document")
+        assert diff["top"]
+        report = format_report(second, diff)
+        assert "undo_stack" in report and "Top allocations" in report
+    finally:
+        profiler.stop()
@@ -0,0 +1,32 @@
+from text_editor.document.merge import LOCAL_MARKER, REMOTE_MARKER, merge3
+
+BASE = "one\ntwo\nthree\nfour\n"
+
+
+def test_one_sided_changes_are_taken():
+    assert merge3(BASE, BASE, BASE + "five\n") == (BASE + "five\n", 0)
+    assert merge3(BASE, "zero\n" + BASE, BASE) == ("zero\n" + BASE, 0)
+
+
+def test_non_overlapping_changes_are_combined():
+    local = "one\nTWO\nthree\nfour\n"
+    remote = "one\ntwo\nthree\nFOUR\nfive\n"
+    assert merge3(BASE, local, remote) == ("one\nTWO\nthree\nFOUR\nfive\n", 0)
+
+
+def test_identical_changes_do_not_conflict():
+    changed = "one\n2\nthree\nfour\n"
+    assert merge3(BASE, changed, changed) == (changed, 0)
+    assert merge3(BASE, changed + "x\n", changed + "y\n")[1] == 1
+
+
+def test_overlapping_changes_are_marked():
+    text, conflicts = merge3(BASE, "one\nmine\nthree\nfour\n", "one\ntheirs\nthree\nfour\n")
+    assert conflicts == 1
+    assert text == f"one\n{LOCAL_MARKER}mine\n=======\ntheirs\n{REMOTE_MARKER}three\nfour\n"
+
+
+def test_insertions_at_same_point_conflict():
+    text, conflicts = merge3("a\nb\n", "a\nx\nb\n", "a\ny\nb\n")
+    assert conflicts == 1
+    assert text.startswith("a\n" + LOCAL_MARKER + "x\n")
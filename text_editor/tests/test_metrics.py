@@ -0,0 +1,92 @@
+import json
+import pytest
+from text_editor.document.document import Document
+from text_editor.document.decorators import EncryptionDecorator, ValidationDecorator
+from text_editor.commands.command import SetTextCommand
+from text_editor.facade.editor_facade import EditorFacade
+from text_editor.services.metrics import MetricsRegistry
+
+
+@pytest.fixture
+def registry():
+    registry = MetricsRegistry()
+    yield registry
+    registry.stop_dump()
+    registry.disable()
+
+
+def test_disabled_registry_leaves_methods_untouched(registry):
+    original = Document.notify
+    registry.enable()
+    assert Document.notify is not original
+    registry.disable()
+    assert Document.notify is original
+    Document("x").notify()
+    assert registry.snapshot() == {}
+
+
+def test_records_decorators_commands_and_io(registry, tmp_path):
+    registry.enable()
+    facade = EditorFacade()
+    facade.document = ValidationDecorator(EncryptionDecorator(Document(), "k"), 100)
+    facade.set_content("")
+    facade.undo_redo.execute(SetTextCommand(facade.document, "hello"))
+    facade.undo()
+    facade.redo()
+    assert facade.get_content() == "hello"
+    path = str(tmp_path / "doc.txt")
+    facade.save_to_file(path)
+    facade.open_from_file(path)
+
+    snapshot = registry.snapshot()
+    assert snapshot["UndoRedoManager.execute"]["count"] == 1
+    assert snapshot["UndoRedoManager.undo"]["count"] == 1
+    assert snapshot["EncryptionDecorator.content.set"]["bytes"] >= len("hello") * 3
+    assert snapshot["ValidationDecorator.content.get"]["count"] >= 1
+    assert snapshot["EditorFacade.save_to_file"]["bytes"] == 5
+    assert snapshot["Document.notify"]["count"] >= 4
+    stats = snapshot["EditorFacade.open_from_file"]
+    assert set(stats) == {"count", "total_ms", "p50_ms", "p99_ms", "bytes"}
+    assert 0 <= stats["p50_ms"] <= stats["p99_ms"]
+
+
+def test_records_gui_style_edits_and_io(registry, tmp_path):
+    from text_editor.commands.command import EditCommand
+    from text_editor.document.decorators import StatisticsDecorator
+    path = str(tmp_path / "doc.txt")
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write("hello")
+    registry.enable()
+    facade = EditorFacade()
+    document = StatisticsDecorator(ValidationDecorator(Document(), 100))
+    facade.adopt_document(path, document, facade.load_file(path, document))
+    facade.undo_redo.execute(EditCommand(facade.document, 5, 5, " world"))
+    facade.write_file(path, facade.get_content())
+
+    snapshot = registry.snapshot()
+    assert snapshot["EditorFacade.load_file"]["bytes"] == 5
+    assert snapshot["StatisticsDecorator.apply_edit"]["bytes"] == len(" world")
+    assert snapshot["ValidationDecorator.apply_edit"]["count"] == 1
+    assert snapshot["EditorFacade.write_file"]["bytes"] == len("hello world")
+
+
+def test_percentiles_and_reset(registry):
+    for ms in range(1, 101):
+        registry.record("call", ms / 1000, 10)
+    stats = registry.snapshot()["call"]
+    assert stats["count"] == 100
+    assert stats["bytes"] == 1000
+    assert stats["p50_ms"] == pytest.approx(51)
+    assert stats["p99_ms"] == pytest.approx(100)
+    registry.reset()
+    assert registry.snapshot() == {}
+
+
+def test_periodic_dump(registry, tmp_path):
+    path = str(tmp_path / "metrics.json")
+    registry.record("call", 0.001)
+    registry.start_dump(path, interval=0.01)
+    registry.stop_dump()
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    assert data["metrics"]["call"]["count"] == 1
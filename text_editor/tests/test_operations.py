@@ -0,0 +1,68 @@
+import random
+import pytest
+from text_editor.document.operations import apply, apply_all, diff, split, transform, transform_ops
+
+
+def test_diff_produces_minimal_operations():
+    assert diff("hello world", "hello world") == []
+    assert diff("hello world", "hello brave world") == [(6, 6, "brave ")]
+    assert diff("hello world", "hello") == [(5, 11, "")]
+    assert diff("abc", "axc") == [(1, 2, ""), (1, 1, "x")]
+    assert apply_all("abc", diff("abc", "axc")) == "axc"
+
+
+def test_split_drops_empty_parts():
+    assert split((2, 2, "")) == []
+    assert split((1, 3, "")) == [(1, 3, "")]
+    assert split((1, 3, "z")) == [(1, 3, ""), (1, 1, "z")]
+
+
+def test_apply_rejects_out_of_range():
+    with pytest.raises(ValueError):
+        apply("abc", (2, 5, ""))
+
+
+def test_concurrent_inserts_at_same_position_use_priority():
+    text = "ab"
+    mine, theirs = (1, 1, "X"), (1, 1, "Y")
+    assert transform(mine, theirs, True) == [mine]
+    assert transform(theirs, mine, False) == [(2, 2, "Y")]
+    assert apply(apply(text, mine), (2, 2, "Y")) == "aXYb"
+
+
+def test_delete_around_insert_splits_and_keeps_insert():
+    text = "0123456789"
+    delete, insert = (2, 8, ""), (5, 5, "new")
+    left, right = transform_ops([delete], [insert], True)
+    assert left == [(2, 5, ""), (5, 8, "")]
+    assert apply_all(apply(text, insert), left) == apply_all(apply(text, delete), right) == "01new89"
+
+
+def test_overlapping_deletes_do_not_delete_twice():
+    text = "0123456789"
+    left, right = transform_ops([(2, 6, "")], [(4, 8, "")], False)
+    assert apply_all(apply(text, (2, 6, "")), right) == apply_all(apply(text, (4, 8, "")), left) == "0189"
+
+
+def _random_ops(text, rng, count):
+    ops = []
+    for _ in range(count):
+        start = rng.randint(0, len(text))
+        end = rng.randint(start, min(len(text), start + 5))
+        for op in split((start, end, rng.choice(("", "a", "bc", "xyz")))):
+            ops.append(op)
+            text = apply(text, op)
+    return ops
+
+
+def test_transform_ops_converges_on_random_sequences():
+    rng = random.Random(7)
+    for _ in range(3000):
+        text = "".join(rng.choice("0123456789") for _ in range(rng.randint(0, 15)))
+        left, right = _random_ops(text, rng, rng.randint(1, 4)), _random_ops(text, rng, rng.randint(1, 4))
+        left_first = rng.random() < 0.5
+        left_after, right_after = transform_ops(left, right, left_first)
+        merged = apply_all(apply_all(text, left), right_after)
+        assert merged == apply_all(apply_all(text, right), left_after)
+        # Текст ніколи не дублюється: довжина не більша за вихідну плюс усі вставки
+        assert len(merged) <= len(text) + sum(len(op[2]) for op in left + right)
@@ -0,0 +1,90 @@
+from text_editor.ui.paste import ChunkedInsert
+
+
+class FakeText:
+    """Мінімальний tk.Text: цілі індекси й позначки з напрямком прив'язки."""
+
+    def __init__(self, content=""):
+        self.content = content
+        self.marks = {}
+        self.state = "normal"
+        self.callbacks = {}
+        self.next_id = 0
+
+    def after(self, ms, callback):
+        self.next_id += 1
+        self.callbacks[self.next_id] = callback
+        return self.next_id
+
+    def after_cancel(self, after_id):
+        self.callbacks.pop(after_id, None)
+
+    def run_once(self):
+        after_id = min(self.callbacks)
+        self.callbacks.pop(after_id)()
+
+    def config(self, state):
+        self.state = state
+
+    def _index(self, index):
+        return self.marks[index][0] if index in self.marks else index
+
+    def mark_set(self, name, index):
+        self.marks[name] = [self._index(index), "right"]
+
+    def mark_gravity(self, name, gravity):
+        self.marks[name][1] = gravity
+
+    def mark_unset(self, *names):
+        for name in names:
+            del self.marks[name]
+
+    def insert(self, index, text):
+        assert self.state == "normal"
+        at = self._index(index)
+        self.content = self.content[:at] + text + self.content[at:]
+        for mark in self.marks.values():
+            if mark[0] > at or (mark[0] == at and mark[1] == "right"):
+                mark[0] += len(text)
+
+    def delete(self, first, last):
+        start, end = self._index(first), self._index(last)
+        self.content = self.content[:start] + self.content[end:]
+        for mark in self.marks.values():
+            if mark[0] > start:
+                mark[0] = max(start, mark[0] - (end - start))
+
+
+def test_text_is_inserted_in_time_sliced_chunks():
+    widget = FakeText("<>")
+    done = []
+    paste = ChunkedInsert(widget, 1, "abcdefghij", on_done=lambda: done.append(True),
+                          chunk_size=3, budget_ms=0, progress=False)
+    paste.start()
+    assert widget.state == "disabled"
+    steps = 0
+    while widget.callbacks:
+        widget.run_once()
+        steps += 1
+    assert widget.content == "<abcdefghij>"
+    assert steps == 4
+    assert done == [True]
+    assert widget.state == "normal" and widget.marks == {}
+
+
+def test_cancel_removes_the_inserted_part():
+    widget = FakeText("<>")
+    cancelled = []
+    paste = ChunkedInsert(widget, 1, "abcdefghij", on_cancel=lambda: cancelled.append(True),
+                          chunk_size=3, budget_ms=0, progress=False)
+    paste.start()
+    widget.run_once()
+    widget.run_once()
+    assert widget.content == "<abcdef>"
+    paste.cancel()
+    assert widget.content == "<>"
+    assert cancelled == [True]
+    assert widget.callbacks == {} and widget.state == "normal"
+    # Повторне скасування нічого не робить
+    paste.cancel()
+    assert cancelled == [True]
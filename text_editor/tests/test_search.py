@@ -0,0 +1,74 @@
+import random
+import pytest
+from text_editor.commands.command import ReplaceAllCommand
+from text_editor.commands.undo_redo import UndoRedoManager
+from text_editor.document.document import Document
+from text_editor.document.search import MatchTracker, SearchQuery, find_iter
+from text_editor.facade.editor_facade import EditorFacade
+
+def test_literal_find_is_lazy_and_non_overlapping():
+    matches = find_iter("aaaa", "aa")
+    assert next(matches) == (0, 2)
+    assert list(matches) == [(2, 4)]
+
+def test_ignore_case_and_regex_find():
+    assert list(find_iter("Foo foo FOO", "foo", ignore_case=True)) == [(0, 3), (4, 7), (8, 11)]
+    assert list(find_iter("a1 b22", r"\d+", regex=True)) == [(1, 2), (4, 6)]
+
+def test_literal_pattern_is_not_a_regex():
+    assert list(find_iter("a.c abc", "a.c", ignore_case=True)) == [(0, 3)]
+
+def test_invalid_patterns_raise_value_error():
+    with pytest.raises(ValueError):
+        SearchQuery("")
+    with pytest.raises(ValueError, match="Invalid search pattern"):
+        SearchQuery("(", regex=True)
+
+def test_replace_all_is_single_undo_unit():
+    doc = Document("cat cat dog cat")
+    manager = UndoRedoManager()
+    updates = []
+    doc.attach(type("Obs", (), {"update": lambda self, content: updates.append(content)})())
+    command = ReplaceAllCommand(doc, SearchQuery("cat"), "bird")
+    manager.execute(command)
+    assert command.count == 3
+    assert doc.content == "bird bird dog bird"
+    assert len(updates) == 1
+    manager.undo()
+    assert doc.content == "cat cat dog cat"
+
+def test_regex_replace_supports_groups():
+    text, count = SearchQuery(r"(\w+)@(\w+)", regex=True).replace("a@b c@d", r"\2@\1")
+    assert (text, count) == ("b@a d@c", 2)
+
+def test_facade_find_and_replace_all():
+    facade = EditorFacade()
+    facade.set_content("one two one")
+    assert list(facade.find("one")) == [(0, 3), (8, 11)]
+    assert facade.replace_all("one", "1") == 2
+    assert facade.get_content() == "1 two 1"
+    assert facade.replace_all("missing", "x") == 0
+    facade.undo()
+    assert facade.get_content() == "one two one"
+
+def test_match_tracker_follows_document_edits():
+    doc = Document("ab ab ab")
+    tracker = MatchTracker(SearchQuery("ab"), doc.content)
+    doc.attach(tracker)
+    doc.content = "xx ab ab ab"
+    assert list(tracker) == [(3, 5), (6, 8), (9, 11)]
+    assert tracker.next_after(4) == (6, 8)
+    doc.content = "xx ab a ab"
+    assert list(tracker) == [(3, 5), (8, 10)]
+
+@pytest.mark.parametrize("query", [SearchQuery("ab"), SearchQuery("a+b", regex=True), SearchQuery("AB", ignore_case=True)])
+def test_match_tracker_matches_full_scan_after_random_edits(query):
+    rng = random.Random(7)
+    text = "".join(rng.choice("ab ") for _ in range(300))
+    tracker = MatchTracker(query, text)
+    for _ in range(300):
+        start = rng.randint(0, len(text))
+        end = min(len(text), start + rng.randint(0, 5))
+        text = text[:start] + "".join(rng.choice("ab ") for _ in range(rng.randint(0, 5))) + text[end:]
+        tracker.update(text)
+        assert list(tracker) == list(query.finditer(text))
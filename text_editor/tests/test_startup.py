@@ -0,0 +1,16 @@
+import pytest
+from text_editor.benchmarks.bench_startup import (
+    HEADLESS_MODULES, deferred_violations, measure_import
+)
+
+
+@pytest.mark.parametrize("module", HEADLESS_MODULES)
+def test_headless_import_defers_gui_and_rare_modules(module):
+    cumulative, loaded = measure_import(module)
+    assert cumulative is not None
+    assert module in loaded
+    assert deferred_violations(loaded) == []
+
+
+def test_deferred_violations():
+    assert deferred_violations({"tkinter", "os", "json"}) == ["json", "tkinter"]
@@ -62,6 +62,7 @@ def test_new_file_creates_file_and_autosaves(monkeypatch):
             self.title = lambda *a, **k: None
             self.destroy = lambda: None
             self.config = lambda *a, **k: None
+            self.after = lambda *a, **k: None
     
     with patch("text_editor.ui.editor_window.tk.Text", MagicMock()), \
          patch("text_editor.ui.editor_window.tk.Menu", MagicMock()):
@@ -72,5 +73,6 @@ def test_new_file_creates_file_and_autosaves(monkeypatch):
             win.current_file_path = fname
             win.facade.document = AutoSaveDecorator(win.facade.factory.create_document("", filetype=".txt"), win.auto_save_callback)
             win.facade.document.content = "Hello autosave!"
+            win.io.wait_idle()
             with open(fname, 'r', encoding='utf-8') as f:
                 assert f.read() == "Hello autosave!" 
\ No newline at end of file
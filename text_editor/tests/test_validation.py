@@ -0,0 +1,102 @@
+import pytest
+from text_editor.commands.command import EditCommand
+from text_editor.commands.undo_redo import UndoRedoManager
+from text_editor.document.decorators import (
+    AutoSaveDecorator, StatisticsDecorator, ValidationDecorator, create_decorator_chain, collect_decorators_metadata
+)
+from text_editor.document.document import Document
+from text_editor.document.validation import (
+    AllowedCharactersRule, MaxLineLengthRule, RegexDenylistRule, ForbiddenWordsRule,
+    changed_lines, check_lines, rules_from_metadata
+)
+
+class CountingDocument(Document):
+    def __init__(self, content=""):
+        super().__init__(content)
+        self.reads = 0
+    @property
+    def content(self):
+        self.reads += 1
+        return self._content
+    @content.setter
+    def content(self, value):
+        self._content = value
+        self.notify()
+
+def test_changed_lines_covers_only_touched_lines():
+    content = "first\nsecond line\nthird"
+    assert changed_lines(content, 9, 9, "X") == "secXond line"
+    assert changed_lines(content, 3, 8, "\nnew") == "fir\nnewcond line"
+
+def test_rules_report_errors():
+    assert MaxLineLengthRule(3).check_text("abc\nabcd") == "line longer than 3 characters"
+    assert AllowedCharactersRule(r"a-z").check_text("abc\nab1") == "character '1' is not allowed"
+    assert RegexDenylistRule([r"\d{3}"]).check_text("call 555") == "forbidden text '555'"
+    assert ForbiddenWordsRule(["bad"]).check_text("Bad idea")
+    assert ForbiddenWordsRule(["bad"]).check_text("badge") is None
+    assert check_lines([MaxLineLengthRule(10)], "short\nlines") is None
+
+def test_apply_edit_rejects_oversize_without_reading_content():
+    doc = CountingDocument("x" * 10)
+    deco = ValidationDecorator(doc, max_length=12)
+    deco.apply_edit(10, 10, "yy")
+    reads = doc.reads
+    with pytest.raises(ValueError, match="Content validation failed"):
+        deco.apply_edit(0, 0, "zz")
+    assert doc.reads == reads
+    assert doc._content == "x" * 10 + "yy"
+
+def test_outer_layers_forward_edits_to_validation():
+    doc = CountingDocument()
+    saved = []
+    chain = AutoSaveDecorator(ValidationDecorator(doc, max_length=12), saved.append)
+    chain.content = "x" * 10
+    chain.apply_edit(10, 10, "y")
+    assert saved[-1] == "x" * 10 + "y"
+    reads = doc.reads
+    with pytest.raises(ValueError, match="Content validation failed"):
+        StatisticsDecorator(chain).apply_edit(0, 0, "zz")
+    assert doc.reads == reads
+    assert len(saved) == 2
+
+def test_apply_edit_checks_only_changed_lines():
+    doc = Document("this line is far too long\nok\n")
+    deco = ValidationDecorator(doc, rules=[MaxLineLengthRule(5)])
+    deco.apply_edit(27, 28, "k!")
+    assert doc.content == "this line is far too long\nok!\n"
+    with pytest.raises(ValueError, match="line longer than 5"):
+        deco.apply_edit(27, 27, "123456")
+
+def test_edit_command_undo_redo():
+    doc = Document("hello world")
+    deco = ValidationDecorator(doc, max_length=20, forbidden_words=["bad"])
+    manager = UndoRedoManager()
+    manager.execute(EditCommand(deco, 6, 11, "there"))
+    assert doc.content == "hello there"
+    with pytest.raises(ValueError):
+        manager.execute(EditCommand(deco, 0, 5, "bad"))
+    manager.undo()
+    assert doc.content == "hello world"
+    manager.redo()
+    assert doc.content == "hello there"
+
+def test_streaming_rules_check_complete_lines():
+    deco = ValidationDecorator(Document(), rules=[MaxLineLengthRule(4)])
+    deco.write_from(["ab", "cd\nef", "gh"])
+    assert deco.content == "abcd\nefgh"
+    with pytest.raises(ValueError, match="line longer"):
+        deco.write_from(["abc", "de\n"])
+
+def test_rules_round_trip_through_metadata():
+    deco = ValidationDecorator(Document(), 50, ["bad"], [MaxLineLengthRule(10), AllowedCharactersRule("a-z ")])
+    metadata = collect_decorators_metadata(deco)
+    assert metadata[0]["max_line_length"] == 10
+    assert [rule.name for rule in rules_from_metadata(metadata[0])] == [
+        "max_line_length", "allowed_characters", "forbidden_words"
+    ]
+    restored = create_decorator_chain(Document(), metadata)
+    with pytest.raises(ValueError, match="not allowed"):
+        restored.content = "Upper"
+    with pytest.raises(ValueError, match="forbidden"):
+        restored.content = "so bad"
+    restored.content = "fine text"
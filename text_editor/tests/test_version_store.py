@@ -0,0 +1,111 @@
+import os
+import random
+import pytest
+from text_editor.facade.editor_facade import EditorFacade
+from text_editor.services.version_store import VersionStore, content_chunks
+
+
+def _text(lines=4000, seed=0):
+    rng = random.Random(seed)
+    words = ["alpha", "beta", "gamma", "delta", "return", "value", "self", "x"]
+    return "".join(" ".join(rng.choice(words) for _ in range(rng.randint(0, 10))) + "\n" for _ in range(lines))
+
+
+def test_chunks_cover_data_and_respect_max_size():
+    data = _text().encode() + b"y" * 200000
+    chunks = list(content_chunks(data, 256, 1024, 4096))
+    assert b"".join(chunks) == data
+    assert max(len(chunk) for chunk in chunks) <= 4096
+    assert list(content_chunks(b"")) == []
+
+
+def test_insertion_changes_only_nearby_chunks():
+    data = _text().encode()
+    edited = data[:50000] + b"inserted text\n" + data[50000:]
+    before = set(content_chunks(data, 256, 1024, 4096))
+    after = list(content_chunks(edited, 256, 1024, 4096))
+    assert sum(chunk not in before for chunk in after) <= 2
+
+
+def test_record_and_checkout_versions(tmp_path):
+    store = VersionStore(str(tmp_path / "store"), 256, 1024, 4096)
+    path = str(tmp_path / "doc.txt")
+    first = _text()
+    second = first.replace("gamma", "ГАММА", 3)
+    assert store.record(path, first)["version"] == 1
+    assert store.record(path, second)["version"] == 2
+    # Незмінений вміст не створює нової версії
+    assert store.record(path, second)["version"] == 2
+    assert [v["version"] for v in store.versions(path)] == [1, 2]
+    assert store.checkout(path, 1) == first
+    assert store.checkout(path) == second
+    with pytest.raises(ValueError):
+        store.checkout(path, 3)
+    with pytest.raises(ValueError):
+        store.checkout(str(tmp_path / "other.txt"))
+
+
+def test_chunks_are_deduplicated_across_versions_and_documents(tmp_path):
+    store = VersionStore(str(tmp_path / "store"), 256, 1024, 4096)
+    text = _text()
+    store.record(str(tmp_path / "a.txt"), text)
+    single = store.stats()
+    store.record(str(tmp_path / "b.txt"), text)
+    assert store.stats() == single
+    store.record(str(tmp_path / "a.txt"), text[:1000] + "edit\n" + text[1000:])
+    assert store.stats()["bytes"] < single["bytes"] + 3 * 4096
+
+
+def test_prune_and_gc_remove_unreferenced_chunks(tmp_path):
+    store = VersionStore(str(tmp_path / "store"), 256, 1024, 4096)
+    path = str(tmp_path / "doc.txt")
+    store.record(path, _text(seed=1))
+    store.record(path, _text(seed=2))
+    assert store.gc() == {"chunks": 0, "bytes": 0}
+    assert store.prune(path, keep=1) == 1
+    freed = store.gc()
+    assert freed["chunks"] > 0
+    assert store.checkout(path) == _text(seed=2)
+    with pytest.raises(ValueError):
+        store.checkout(path, 1)
+    # Нове сховище над тим самим каталогом читає журнали з диска
+    assert [v["version"] for v in VersionStore(store.root, 256, 1024, 4096).versions(path)] == [2]
+
+
+def test_checkout_detects_corruption(tmp_path):
+    store = VersionStore(str(tmp_path / "store"))
+    path = str(tmp_path / "doc.txt")
+    entry = store.record(path, "hello")
+    with open(store._chunk_path(entry["chunks"][0]), "wb") as f:
+        f.write(b"HELLO")
+    with pytest.raises(ValueError):
+        store.checkout(path)
+
+
+def test_facade_records_versions_on_save(tmp_path):
+    facade = EditorFacade()
+    facade.version_store = VersionStore(str(tmp_path / "store"))
+    path = str(tmp_path / "doc.txt")
+    facade.set_content("first")
+    facade.save_to_file(path)
+    facade.set_content("second")
+    facade.save_to_file(path)
+    assert os.path.exists(path)
+    facade.checkout_version(path, 1)
+    assert facade.get_content() == "first"
+    facade.undo()
+    assert facade.get_content() == "second"
+
+
+def test_async_save_records_versions_but_autosave_does_not(tmp_path):
+    import asyncio
+    from text_editor.facade.async_facade import AsyncEditorFacade
+    facade = EditorFacade()
+    facade.version_store = VersionStore(str(tmp_path / "store"))
+    async_facade = AsyncEditorFacade(facade)
+    path = str(tmp_path / "doc.txt")
+    facade.set_content("saved")
+    asyncio.run(async_facade.save(path))
+    asyncio.run(async_facade.autosave(path, "autosaved"))
+    assert [v["version"] for v in facade.version_store.versions(path)] == [1]
+    assert facade.version_store.checkout(path) == "saved"
@@ -0,0 +1,151 @@
+import os
+import threading
+import pytest
+from text_editor.commands.command import SetTextCommand, EditCommand
+from text_editor.facade.editor_facade import EditorFacade
+from text_editor.facade.workspace import AutoSaveWriter, Workspace
+
+
+@pytest.fixture
+def workspace(tmp_path):
+    workspace = Workspace(EditorFacade(), spill_dir=str(tmp_path / "spill"))
+    yield workspace
+    workspace.shutdown()
+
+
+def test_sessions_keep_separate_history(workspace, tmp_path):
+    first = workspace.new(str(tmp_path / "a.txt"), "alpha")
+    workspace.facade.undo_redo.execute(SetTextCommand(workspace.facade.document, "alpha 2"))
+    second = workspace.new(str(tmp_path / "b.md"), "beta")
+    assert workspace.active is second
+    assert workspace.facade.get_content() == "beta"
+    workspace.facade.undo()
+    assert workspace.facade.get_content() == "beta"
+
+    workspace.activate(first.path)
+    assert workspace.facade.get_content() == "alpha 2"
+    workspace.facade.undo()
+    assert workspace.facade.get_content() == "alpha"
+    with pytest.raises(ValueError):
+        workspace.new(first.path)
+
+
+def test_shared_autosave_writer_and_metadata(workspace, tmp_path):
+    path = str(tmp_path / "auto.txt")
+    metadata = [{"type": "AutoSave", "enabled": True}, {"type": "Statistics", "enabled": True}]
+    workspace.new(path, "one", metadata)
+    for text in ("two", "three", "four"):
+        workspace.facade.set_content(text)
+    workspace.writer.flush()
+    with open(path, encoding="utf-8") as f:
+        assert f.read() == "four"
+    assert workspace.metadata.load(os.path.abspath(path)) == metadata
+
+    workspace.close(path)
+    reopened = workspace.open(path)
+    assert reopened.document.get_statistics()["word_count"] == 1
+    assert workspace.facade.get_content() == "four"
+
+
+def test_eviction_under_budget_and_reload(workspace, tmp_path):
+    workspace.memory_budget = 300_000
+    paths = [str(tmp_path / f"doc{i}.txt") for i in range(5)]
+    for i, path in enumerate(paths):
+        workspace.new(path, str(i) * 100_000)
+        workspace.facade.undo_redo.execute(EditCommand(workspace.facade.document, 0, 1, "X"))
+    assert sum(workspace.memory_usage().values()) <= 300_000
+    evicted = [path for path in paths if workspace.get(path).evicted]
+    assert os.path.abspath(paths[0]) in [os.path.abspath(p) for p in evicted]
+    assert not workspace.get(paths[-1]).evicted
+    assert len(os.listdir(tmp_path / "spill")) == len(evicted)
+
+    session = workspace.activate(paths[0])
+    assert not session.evicted
+    assert workspace.facade.get_content() == "X" + "0" * 99_999
+    workspace.facade.undo()
+    assert workspace.facade.get_content() == "0" * 100_000
+    assert workspace.get(paths[-1]).evicted or sum(workspace.memory_usage().values()) <= 300_000
+
+
+def test_evicted_document_keeps_its_snapshot(workspace, tmp_path):
+    path = str(tmp_path / "plain.txt")
+    session = workspace.new(path, "hello world")
+    before = session.document.snapshot()
+    workspace.new(str(tmp_path / "other.txt"))
+    workspace.evict(path)
+    assert session.evicted
+    snapshot = session.document.snapshot()
+    assert (snapshot.version, snapshot.content) == (before.version, "hello world")
+    workspace.activate(path)
+    assert snapshot.content == "hello world"
+
+
+@pytest.mark.parametrize("mode", ["xor", "block"])
+def test_evicting_encrypted_document_spills_no_plain_text(workspace, tmp_path, mode):
+    marker = "TOP SECRET MARKER"
+    path = str(tmp_path / "secret.txt")
+    metadata = [{"type": "Encryption", "enabled": True, "mode": mode}]
+    session = workspace.new(path, "", metadata, encryption_key="k")
+    workspace.facade.undo_redo.execute(SetTextCommand(workspace.facade.document, marker))
+    workspace.facade.undo_redo.execute(EditCommand(workspace.facade.document, 0, 0, marker + " "))
+    workspace.new(str(tmp_path / "other.txt"))
+    workspace.evict(path)
+    assert session.evicted
+    with open(session.spill_path, 'rb') as f:
+        spilled = f.read()
+    assert marker.encode("utf-8") not in spilled
+    assert session.document.snapshot().content == marker + " " + marker
+
+    workspace.activate(path)
+    assert workspace.facade.get_content() == marker + " " + marker
+    workspace.facade.undo()
+    workspace.facade.undo()
+    assert workspace.facade.get_content() == ""
+
+
+def test_observers_run_on_shared_executor(workspace, tmp_path):
+    path = str(tmp_path / "obs.txt")
+    workspace.new(path, "")
+    seen = []
+    done = threading.Event()
+
+    class Observer:
+        def update(self, content):
+            seen.append((content, threading.current_thread().name))
+            done.set()
+
+    workspace.attach(path, Observer())
+    workspace.facade.set_content("hello")
+    assert done.wait(5)
+    assert seen[0][0] == "hello"
+    assert seen[0][1].startswith("observers")
+
+
+def test_close_active_switches_to_previous(workspace, tmp_path):
+    a = workspace.new(str(tmp_path / "a.txt"), "a")
+    b = workspace.new(str(tmp_path / "b.txt"), "b")
+    workspace.close(b.path)
+    assert workspace.active is a
+    workspace.close(a.path)
+    assert workspace.active is None
+    assert workspace.facade.get_content() == ""
+
+
+def test_autosave_writer_coalesces(tmp_path):
+    writer = AutoSaveWriter()
+    path = str(tmp_path / "x.txt")
+    for i in range(100):
+        writer.submit(path, str(i))
+    writer.flush()
+    writer.close()
+    with open(path, encoding="utf-8") as f:
+        assert f.read() == "99"
+    with pytest.raises(ValueError):
+        writer.submit(path, "late")
+
+
+def test_facade_workspace_is_lazy():
+    facade = EditorFacade()
+    assert facade._workspace is None
+    assert facade.workspace is facade.workspace
+    facade.workspace.shutdown()
@@ -0,0 +1,92 @@
+import asyncio
+import concurrent.futures
+import threading
+from queue import Empty, Queue
+
+
+class TkAsyncRunner:
+    """Виконує корутини у власному циклі asyncio у фоновому потоці.
+
+    Результати повертаються в потік Tk через after(): on_done(result) або
+    on_error(exception) викликаються з опитування черги, тому колбеки можуть
+    вільно працювати з віджетами. Скасовані (витіснені) задачі мовчки
+    пропускаються.
+    """
+
+    def __init__(self, root, poll_ms: int = 20):
+        self.root = root
+        self.poll_ms = poll_ms
+        self._loop = None
+        self._thread = None
+        self._results = Queue()
+        self._pending = set()
+        self._lock = threading.Lock()
+        self._polling = False
+
+    def _ensure_loop(self):
+        with self._lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+                self._thread.start()
+            return self._loop
+
+    def submit(self, coroutine, on_done=None, on_error=None) -> concurrent.futures.Future:
+        future = asyncio.run_coroutine_threadsafe(coroutine, self._ensure_loop())
+        with self._lock:
+            self._pending.add(future)
+        future.add_done_callback(lambda f: self._results.put((f, on_done, on_error)))
+        # after() можна викликати лише з потоку Tk; задачі з інших потоків
+        # підхопить уже запущене опитування
+        if threading.current_thread() is threading.main_thread():
+            self._schedule_poll()
+        return future
+
+    def call(self, func, *args, on_done=None, on_error=None) -> concurrent.futures.Future:
+        """Як submit, але для блокувальної функції: вона виконується у виконавці циклу."""
+        async def run():
+            return await asyncio.get_running_loop().run_in_executor(None, func, *args)
+        return self.submit(run(), on_done, on_error)
+
+    def _schedule_poll(self):
+        if not self._polling:
+            self._polling = True
+            self.root.after(self.poll_ms, self._poll)
+
+    def _poll(self):
+        while True:
+            try:
+                future, on_done, on_error = self._results.get_nowait()
+            except Empty:
+                break
+            with self._lock:
+                self._pending.discard(future)
+            if future.cancelled():
+                continue
+            error = future.exception()
+            if isinstance(error, asyncio.CancelledError):
+                continue
+            if error is not None:
+                if on_error:
+                    on_error(error)
+            elif on_done:
+                on_done(future.result())
+        self._polling = False
+        with self._lock:
+            busy = bool(self._pending) or not self._results.empty()
+        if busy:
+            self._schedule_poll()
+
+    def wait_idle(self, timeout: float = None):
+        """Блокує, доки не завершаться всі надіслані задачі (для тестів і виходу)."""
+        with self._lock:
+            pending = list(self._pending)
+        concurrent.futures.wait(pending, timeout=timeout)
+
+    def close(self):
+        if self._loop is not None:
+            self.wait_idle()
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join()
+            self._loop.close()
+            self._loop = None
@@ -1,25 +1,58 @@
 import tkinter as tk
 from text_editor.facade.editor_facade import EditorFacade
 from tkinter import messagebox
-from text_editor.commands.command import SetTextCommand
+from text_editor.commands.command import EditCommand
+from text_editor.document.text_diff import edit_span
 import os
-from text_editor.document.decorators import (
-    AutoSaveDecorator, ValidationDecorator, 
-    EncryptionDecorator, StatisticsDecorator,
-    save_decorators_metadata, load_decorators_metadata, 
-    create_decorator_chain, collect_decorators_metadata,
-    cleanup_orphaned_metadata
-)
+import threading
+from text_editor.document.decorators import cleanup_orphaned_metadata
+from text_editor.document.markdown_preview import MarkdownPreview
+from text_editor.document.lexers import lexer_for_filetype
+from text_editor.ui.highlighter import SyntaxHighlighter
+from text_editor.services.dir_listing import DirectoryListing
+from text_editor.ui.file_list import FileListLoader
+from text_editor.ui.async_tk import TkAsyncRunner
+from text_editor.facade.async_facade import AsyncEditorFacade
+from text_editor.services.file_watcher import FileWatcher
+from text_editor.ui.paste import ChunkedInsert, TkClipboard
 
 class EditorWindow:
+    # Як часто перевіряти, чи не змінила відкритий файл інша програма
+    WATCH_INTERVAL_MS = 1000
+    # Режим стеження за журналом: скільки рядків показати одразу, скільки
+    # тримати у віджеті щонайбільше і як часто дочитувати нове
+    FOLLOW_LINES = 1000
+    FOLLOW_MAX_LINES = 10000
+    FOLLOW_INTERVAL_MS = 250
+    # Довші вставки подаються у віджет частинами з індикатором прогресу
+    PASTE_CHUNK_CHARS = 256 * 1024
+
     def __init__(self, root):
         self.root = root
         self.root.title("Text Editor")
         self.current_file_path = None
         self.last_text = ""
         self.facade = EditorFacade(self.auto_save_callback)
+        # Дискові операції йдуть у фоні, результати повертаються через after()
+        self.io = TkAsyncRunner(root)
+        self.async_facade = AsyncEditorFacade(self.facade)
+        self.facade.file_watcher = FileWatcher()
+        self.facade.clipboard = TkClipboard(root)
+        self.preview = None
+        self.preview_text = None
+        self.highlighter = None
+        self.text_indexes = {}
+        # Каталоги, індекс яких саме оновлюється у фоні
+        self._indexing = set()
+        self.dir_listing = DirectoryListing()
+        self.memory_profiler = None
+        self._follow_job = None
+        self._paste = None
+        # Поки файл читається у фоні, поточний документ не змінюється і не зберігається
+        self._loading = False
 
-        cleanup_orphaned_metadata()
+        # Прибирання метаданих читає диск, тому не затримує показ вікна
+        threading.Thread(target=cleanup_orphaned_metadata, daemon=True).start()
 
         self.text = tk.Text(root, wrap="word")
         self.text.pack(expand=1, fill="both")
@@ -41,59 +74,288 @@ class EditorWindow:
         file_menu.add_command(label="Open", command=self.open_file)
         file_menu.add_command(label="Save", command=self.save_file)
         file_menu.add_command(label="New", command=self.new_file)
+        view_menu = tk.Menu(menu, tearoff=0)
+        menu.add_cascade(label="View", menu=view_menu)
+        view_menu.add_command(label="Markdown Preview", command=self.show_preview)
+        view_menu.add_command(label="Metrics", command=self.show_metrics)
+        view_menu.add_command(label="Memory Report", command=self.show_memory_report)
+        view_menu.add_command(label="Follow Log...", command=self.follow_log)
+        view_menu.add_command(label="Stop Following", command=self.stop_follow)
 
         self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+        self.root.after(self.WATCH_INTERVAL_MS, self.watch_files)
 
     def on_text_change(self, event=None):
+        if self.facade.follower is not None or self._paste is not None or self._loading:
+            return
         content = self.text.get("1.0", tk.END)[:-1]
         if content != self.last_text:
-            cmd = SetTextCommand(self.facade.document, content)
+            start, old_end, new_end = edit_span(self.last_text, content)
+            cmd = EditCommand(
+                self.facade.document, start, old_end,
+                content[start:new_end], self.last_text[start:old_end]
+            )
             try:
                 self.facade.undo_redo.execute(cmd)
+                if self.highlighter:
+                    self.highlighter.on_edit(self.last_text, content)
                 self.last_text = content
+                self.refresh_preview(content)
             except ValueError as e:
                 messagebox.showerror("Validation Error", str(e))
-                self.text.delete("1.0", tk.END)
-                self.text.insert("1.0", self.last_text)
+                # Повертаємо лише змінену ділянку, а не весь текст
+                self.text.delete(f"1.0+{start}c", f"1.0+{new_end}c")
+                self.text.insert(f"1.0+{start}c", self.last_text[start:old_end])
 
     def copy(self):
         try:
             selected = self.text.get(tk.SEL_FIRST, tk.SEL_LAST)
-            self.root.clipboard_clear()
-            self.root.clipboard_append(selected)
-            self.root.update()
         except tk.TclError:
-            pass
+            return
+        self.facade.copy(selected)
 
     def paste(self):
+        """Вставка йде в документ однією правкою; великий текст подається у віджет частинами."""
+        if self.facade.follower is not None or self._paste is not None or self._loading:
+            return
+        # Ще не синхронізований ввід спершу потрапляє в документ
+        self.on_text_change()
         try:
-            clipboard_text = self.root.clipboard_get()
-            self.text.insert(tk.INSERT, clipboard_text)
-            self.on_text_change()
+            first, last = self.text.index(tk.SEL_FIRST), self.text.index(tk.SEL_LAST)
         except tk.TclError:
-            pass
+            first = last = self.text.index(tk.INSERT)
+        start, end = self.text_offset(first), self.text_offset(last)
+        removed = self.last_text[start:end]
+        try:
+            text = self.facade.paste(start, end)
+        except ValueError as e:
+            messagebox.showerror("Validation Error", str(e))
+            return
+        self.text.delete(first, last)
+        if len(text) <= self.PASTE_CHUNK_CHARS:
+            self.text.insert(first, text)
+            self.pasted()
+            return
+        self._paste = ChunkedInsert(
+            self.text, first, text, on_done=self.pasted,
+            on_cancel=lambda: self.paste_cancelled(first, removed),
+            chunk_size=self.PASTE_CHUNK_CHARS,
+        )
+        self._paste.start()
+
+    def text_offset(self, index) -> int:
+        """Зсув індексу віджета в символах від початку тексту."""
+        count = self.text.count("1.0", index, "chars")
+        return count[0] if count else 0
+
+    def pasted(self):
+        self._paste = None
+        content = self.facade.get_content()
+        if self.highlighter:
+            self.highlighter.on_edit(self.last_text, content)
+        self.last_text = content
+        self.refresh_preview(content)
+
+    def paste_cancelled(self, index, removed):
+        """Скасована вставка зникає з історії правок, виділення повертається."""
+        self._paste = None
+        self.facade.cancel_paste()
+        self.text.insert(index, removed)
+        self.last_text = self.facade.get_content()
+        if self.highlighter:
+            self.highlighter.reset(self.last_text)
 
     def undo(self):
+        if self.facade.follower is not None or self._paste is not None or self._loading:
+            return
         self.facade.undo()
         self.text.delete("1.0", tk.END)
         self.text.insert("1.0", self.facade.get_content())
         self.last_text = self.facade.get_content()
+        if self.highlighter:
+            self.highlighter.reset(self.last_text)
+        self.refresh_preview(self.last_text)
 
     def redo(self):
+        if self.facade.follower is not None or self._paste is not None or self._loading:
+            return
         self.facade.redo()
         self.text.delete("1.0", tk.END)
         self.text.insert("1.0", self.facade.get_content())
         self.last_text = self.facade.get_content()
+        if self.highlighter:
+            self.highlighter.reset(self.last_text)
+        self.refresh_preview(self.last_text)
+
+    def set_highlighter(self, filetype, content=""):
+        lexer = lexer_for_filetype(filetype)
+        if self.highlighter is None:
+            if lexer is None:
+                return
+            self.highlighter = SyntaxHighlighter(self.text, lexer)
+        self.highlighter.set_lexer(lexer, content)
+
+    def show_preview(self):
+        if self.preview is not None:
+            return
+        preview_win = tk.Toplevel(self.root)
+        preview_win.title("Markdown Preview")
+        self.preview_text = tk.Text(preview_win, wrap="word")
+        self.preview_text.pack(expand=1, fill="both")
+        self.preview = MarkdownPreview()
+        def close_preview():
+            self.preview = None
+            self.preview_text = None
+            preview_win.destroy()
+        preview_win.protocol("WM_DELETE_WINDOW", close_preview)
+        self.refresh_preview(self.last_text)
+
+    def refresh_preview(self, content):
+        if self.preview is None:
+            return
+        # Замінюється лише HTML змінених блоків, а не весь перегляд
+        change = self.preview.patch(content)
+        if change is None:
+            return
+        offset, removed, html = change
+        self.preview_text.delete(f"1.0+{offset}c", f"1.0+{offset + removed}c")
+        self.preview_text.insert(f"1.0+{offset}c", html)
+
+    def show_metrics(self):
+        from text_editor.services.metrics import metrics
+        metrics_win = tk.Toplevel(self.root)
+        metrics_win.title("Metrics")
+        metrics_text = tk.Text(metrics_win, wrap="none", width=90, height=20)
+        status_var = tk.StringVar()
+
+        def refresh():
+            status_var.set("Disable" if metrics.enabled else "Enable")
+            metrics_text.delete("1.0", tk.END)
+            metrics_text.insert("1.0", f"{'call':<36} {'count':>7} {'total ms':>10} {'p50 ms':>8} {'p99 ms':>8} {'bytes':>12}\n")
+            for name, values in metrics.snapshot().items():
+                metrics_text.insert(tk.END, f"{name:<36} {values['count']:>7} {values['total_ms']:>10.2f} "
+                                            f"{values['p50_ms']:>8.3f} {values['p99_ms']:>8.3f} {values['bytes']:>12}\n")
+
+        def toggle():
+            if metrics.enabled:
+                metrics.disable()
+            else:
+                metrics.enable()
+            refresh()
+
+        buttons = tk.Frame(metrics_win)
+        buttons.pack(fill='x')
+        tk.Button(buttons, textvariable=status_var, command=toggle).pack(side='left', padx=5, pady=5)
+        tk.Button(buttons, text="Refresh", command=refresh).pack(side='left', padx=5, pady=5)
+        tk.Button(buttons, text="Reset", command=lambda: (metrics.reset(), refresh())).pack(side='left', padx=5, pady=5)
+        metrics_text.pack(expand=1, fill="both")
+        refresh()
+
+    def show_memory_report(self):
+        """Робить знімок пам'яті й показує його разом з різницею від попереднього."""
+        from text_editor.document.key_derivation import session_keys
+        from text_editor.services.memory_report import MemoryProfiler, format_report
+        if self.memory_profiler is None:
+            self.memory_profiler = MemoryProfiler()
+        extra = {
+            "editor_text_mirror": self.last_text,
+            "markdown_preview": self.preview,
+            "highlighter_cache": self.highlighter.cache if self.highlighter else None,
+            "full_text_indexes": self.text_indexes,
+            "dir_listing_cache": self.dir_listing,
+            "session_keys": session_keys,
+        }
+        snapshots = self.memory_profiler.snapshots
+        previous = snapshots[-1] if snapshots else None
+        snapshot = self.memory_profiler.take(self.facade, extra)
+        del snapshots[:-1]
+        diff = self.memory_profiler.diff(previous, snapshot) if previous else None
+
+        report_win = tk.Toplevel(self.root)
+        report_win.title("Memory Report")
+        report_text = tk.Text(report_win, wrap="none", width=100, height=30)
+        report_text.pack(expand=1, fill="both")
+        report_text.insert("1.0", format_report(snapshot, diff))
+        if diff is None:
+            report_text.insert(tk.END, "\n\nOpen the report again later to see what changed.")
+        tk.Button(report_win, text="Stop tracing", command=self.memory_profiler.stop).pack(pady=5)
+
+    def begin_loading(self):
+        self._loading = True
+        self.text.config(state="disabled")
+
+    def end_loading(self):
+        self._loading = False
+        self.text.config(state="normal")
 
     def auto_save_callback(self, content):
-        if self.current_file_path:
-            try:
-                with open(self.current_file_path, 'w', encoding='utf-8') as f:
-                    f.write(content)
-            except Exception as e:
-                messagebox.showerror("Error", f"Could not auto-save file: {e}")
+        if self.current_file_path and not self._loading:
+            self.io.submit(
+                self.async_facade.autosave(self.current_file_path, str(content)),
+                on_error=self.auto_save_failed,
+            )
+
+    def auto_save_failed(self, error):
+        # Файл змінила інша програма: спершу приймаємо зміну, наступна правка збереже результат
+        if not self.check_external_changes():
+            messagebox.showerror("Error", f"Could not auto-save file: {error}")
+
+    def watch_files(self):
+        if self._paste is None and not self._loading:
+            self.check_external_changes()
+        self.root.after(self.WATCH_INTERVAL_MS, self.watch_files)
+
+    def check_external_changes(self) -> bool:
+        """Приймає зміни відкритого файлу іншими програмами; True, якщо такі були."""
+        handled = False
+        current = os.path.abspath(self.current_file_path) if self.current_file_path else None
+        for change in self.facade.file_watcher.poll():
+            if change.path != current:
+                self.facade.file_watcher.unwatch(change.path)
+                continue
+            handled = True
+            # Ще не синхронізований ввід спершу потрапляє в документ
+            self.on_text_change()
+            if change.kind == "appended":
+                self.show_edits(self.facade.apply_external_change(change))
+            elif change.kind == "deleted":
+                messagebox.showwarning("File deleted", f"{change.path} was deleted by another program.")
+            else:
+                self.resolve_external_change(change)
+        return handled
+
+    def resolve_external_change(self, change):
+        merged, conflicts = self.facade.merge_external_change(change)
+        if self.facade.get_content() != change.base:
+            answer = messagebox.askyesnocancel(
+                "File changed on disk",
+                f"{os.path.basename(change.path)} was changed by another program.\n\n"
+                f"Yes - merge with your changes ({conflicts} conflict(s) marked)\n"
+                "No - reload the version from disk\n"
+                "Cancel - keep your version",
+            )
+            if answer is None:
+                return
+            merged = merged if answer else change.text
+        self.facade.accept_external_change(change, merged)
+        content = self.facade.get_content()
+        start, old_end, new_end = edit_span(self.last_text, content)
+        self.show_edits([(start, old_end, content[start:new_end])])
+
+    def show_edits(self, ops):
+        """Переносить правки документа у віджет, не перезавантажуючи весь текст."""
+        content = self.facade.get_content()
+        for start, end, text in ops:
+            self.text.delete(f"1.0+{start}c", f"1.0+{end}c")
+            self.text.insert(f"1.0+{start}c", text)
+        if self.highlighter:
+            self.highlighter.on_edit(self.last_text, content)
+        self.last_text = content
+        self.refresh_preview(content)
 
     def open_file(self):
+        from text_editor.document.decorators import create_decorator_chain, load_decorators_metadata
+        from text_editor.document.key_derivation import session_keys
         open_win = tk.Toplevel(self.root)
         open_win.title("Open File")
         tk.Label(open_win, text="Directory:").pack(padx=10, pady=(10, 0))
@@ -121,19 +383,53 @@ class EditorWindow:
             tk.Radiobutton(open_win, text=label, variable=filetype_var, value=ext).pack(anchor='w', padx=20)
         tk.Label(open_win, text="Files:").pack(padx=10, pady=(10, 0))
         file_listbox = tk.Listbox(open_win, width=40, height=8)
+        file_loader = FileListLoader(open_win, file_listbox, self.dir_listing)
         def update_file_list(*_):
-            file_listbox.delete(0, tk.END)
             ext = filetype_var.get()
-            directory = dir_var.get()
-            if not os.path.isdir(directory):
-                return
-            for f in os.listdir(directory):
-                if ext == 'all' or f.endswith(ext):
-                    file_listbox.insert(tk.END, f)
+            file_loader.request(dir_var.get(), lambda f: ext == 'all' or f.endswith(ext))
         filetype_var.trace_add('write', update_file_list)
         dir_var.trace_add('write', update_file_list)
         update_file_list()
         file_listbox.pack(padx=10, pady=5)
+        search_frame = tk.Frame(open_win)
+        search_frame.pack(padx=10, pady=2, fill='x')
+        search_var = tk.StringVar()
+        tk.Entry(search_frame, textvariable=search_var, width=30).pack(side='left', fill='x', expand=True)
+        def search_files():
+            phrase = search_var.get().strip()
+            directory = dir_var.get()
+            if not phrase:
+                update_file_list()
+                return
+            if not os.path.isdir(directory) or directory in self._indexing:
+                return
+
+            def refresh_index():
+                index = self.text_indexes.get(directory)
+                if index is None:
+                    from text_editor.services.full_text_index import FullTextIndex
+                    index = FullTextIndex(directory)
+                index.update()
+                return index
+
+            def show_results(index):
+                self._indexing.discard(directory)
+                self.text_indexes[directory] = index
+                if not open_win.winfo_exists():
+                    return
+                file_loader.cancel()
+                file_listbox.delete(0, tk.END)
+                for path in index.search(phrase):
+                    file_listbox.insert(tk.END, os.path.relpath(path, directory))
+
+            def failed(error):
+                self._indexing.discard(directory)
+                messagebox.showerror("Error", f"Could not index files: {error}")
+
+            # Обхід каталогу й індексування не блокують цикл подій Tk
+            self._indexing.add(directory)
+            self.io.call(refresh_index, on_done=show_results, on_error=failed)
+        tk.Button(search_frame, text="Find in files", command=search_files).pack(side='left', padx=5)
         filename_var = tk.StringVar()
         def on_select(event):
             sel = file_listbox.curselection()
@@ -144,6 +440,8 @@ class EditorWindow:
         entry = tk.Entry(open_win, textvariable=filename_var, width=30)
         entry.pack(padx=10, pady=5)
         def openf():
+            if self._loading:
+                return
             name = filename_var.get().strip()
             ext = filetype_var.get()
             directory = dir_var.get()
@@ -154,25 +452,28 @@ class EditorWindow:
                 messagebox.showerror("Error", "Invalid directory.")
                 return
             fname = os.path.join(directory, name)
-            if ext == 'all':
+            if ext == 'all' and os.path.isfile(fname):
+                # Тип документа визначає вміст (сигнатура, евристика), а не лише розширення
+                try:
+                    ext = self.facade.detect_filetype(fname)
+                except OSError as e:
+                    messagebox.showerror("Error", f"Could not open file: {e}")
+                    return
+            elif ext == 'all':
                 ext = os.path.splitext(fname)[1].lower()
-                if ext not in ['.txt', '.md', '.rtf', '.html']:
+                if ext not in self.facade.factory.extensions():
                     ext = '.txt'
-            if not fname.endswith(ext):
+            if not fname.endswith(ext) and not os.path.isfile(fname):
                 fname += ext
             try:
-                self.current_file_path = fname
-
                 decorators_metadata = load_decorators_metadata(fname)
-                print(f"Loaded decorators metadata: {decorators_metadata}")
-                print(f"Metadata stored in: D:\\Documents\\Data")
                 
                 encryption_key = None
                 has_encryption = any(d.get("type") == "Encryption" for d in decorators_metadata)
-                print(f"Has encryption: {has_encryption}")
                 
                 if has_encryption:
-                    print("Showing password dialog...")
+                    encryption_key = session_keys.password_for(fname)
+                if has_encryption and encryption_key is None:
                     password_win = tk.Toplevel(open_win)
                     password_win.title("Enter Encryption Key")
                     password_win.geometry("300x150")
@@ -201,29 +502,52 @@ class EditorWindow:
                     
                     if encryption_key is None:
                         return
-                else:
-                    print("No encryption detected, skipping password dialog")
                 
                 doc = self.facade.factory.create_document("", filetype=ext)
-                decorated_doc = create_decorator_chain(
-                    doc, decorators_metadata, 
-                    self.auto_save_callback, encryption_key
-                )
                 
                 try:
-                    self.facade.document = decorated_doc
-                    self.facade.open_from_file(fname)
-                    self.text.delete("1.0", tk.END)
-                    self.text.insert("1.0", self.facade.get_content())
-                    open_win.destroy()
+                    # Неправильний пароль відхиляється за верифікатором, до читання файлу
+                    decorated_doc = create_decorator_chain(
+                        doc, decorators_metadata, 
+                        self.auto_save_callback, encryption_key
+                    )
                 except ValueError as e:
+                    if has_encryption:
+                        session_keys.forget(fname)
                     messagebox.showerror("Error", str(e))
                     return
+
+                def opened(loaded):
+                    # Документ і шлях підміняються лише після успішного читання
+                    self.facade.adopt_document(fname, decorated_doc, loaded)
+                    self.current_file_path = fname
+                    content = self.facade.get_content()
+                    self.end_loading()
+                    self.text.delete("1.0", tk.END)
+                    self.text.insert("1.0", content)
+                    self.last_text = content
+                    self.set_highlighter(ext, content)
+                    self.refresh_preview(content)
+                    if has_encryption:
+                        session_keys.remember(fname, encryption_key)
+                    open_win.destroy()
+
+                def failed(error):
+                    self.end_loading()
+                    if has_encryption and isinstance(error, ValueError):
+                        session_keys.forget(fname)
+                    messagebox.showerror("Error", str(error) if isinstance(error, ValueError)
+                                         else f"Could not open file: {error}")
+
+                # Читання й розшифрування не блокують цикл подій Tk; ввід тим часом вимкнений
+                self.begin_loading()
+                self.io.submit(self.async_facade.load(fname, decorated_doc), on_done=opened, on_error=failed)
             except Exception as e:
                 messagebox.showerror("Error", f"Could not open file: {e}")
         tk.Button(open_win, text="Open", command=openf).pack(pady=10)
 
     def save_file(self):
+        from text_editor.document.decorators import collect_decorators_metadata, save_decorators_metadata
         save_win = tk.Toplevel(self.root)
         save_win.title("Save File")
         tk.Label(save_win, text="Directory:").pack(padx=10, pady=(10, 0))
@@ -248,15 +572,10 @@ class EditorWindow:
         for ext, label in types:
             tk.Radiobutton(save_win, text=label, variable=filetype_var, value=ext).pack(anchor='w', padx=20)
         file_listbox = tk.Listbox(save_win, width=40, height=8)
+        file_loader = FileListLoader(save_win, file_listbox, self.dir_listing)
         def update_file_list(*_):
-            file_listbox.delete(0, tk.END)
             ext = filetype_var.get()
-            directory = dir_var.get()
-            if not os.path.isdir(directory):
-                return
-            for f in os.listdir(directory):
-                if f.endswith(ext):
-                    file_listbox.insert(tk.END, f)
+            file_loader.request(dir_var.get(), lambda f: f.endswith(ext))
         filetype_var.trace_add('write', update_file_list)
         dir_var.trace_add('write', update_file_list)
         update_file_list()
@@ -286,13 +605,21 @@ class EditorWindow:
                     decorators_metadata = collect_decorators_metadata(self.facade.document)
                     save_decorators_metadata(fname, decorators_metadata)
                 
-                self.facade.save_to_file(fname)
+                self.io.submit(
+                    self.async_facade.save(fname),
+                    on_error=lambda e: messagebox.showerror("Error", f"Could not save file: {e}"),
+                )
                 save_win.destroy()
             except Exception as e:
                 messagebox.showerror("Error", f"Could not save file: {e}")
         tk.Button(save_win, text="Save", command=save).pack(pady=10)
 
     def new_file(self):
+        from text_editor.document.decorators import (
+            AutoSaveDecorator, EncryptionDecorator, StatisticsDecorator, ValidationDecorator,
+            collect_decorators_metadata, save_decorators_metadata
+        )
+        from text_editor.document.key_derivation import session_keys
         new_win = tk.Toplevel(self.root)
         new_win.title("New File")
         
@@ -345,6 +672,8 @@ class EditorWindow:
         encryption_label.pack(anchor='w')
         encryption_entry = tk.Entry(decorator_frame, textvariable=encryption_key_var, width=20)
         encryption_entry.pack(anchor='w', padx=20)
+        block_mode_var = tk.BooleanVar()
+        tk.Checkbutton(decorator_frame, text="Authenticated blocks", variable=block_mode_var).pack(anchor='w', padx=20)
         
         def create():
             name = filename_var.get().strip()
@@ -377,18 +706,20 @@ class EditorWindow:
                     decorated_doc = ValidationDecorator(decorated_doc, max_length)
                 
                 if encryption_var.get():
-                    decorated_doc = EncryptionDecorator(decorated_doc, encryption_key_var.get())
+                    mode = "block" if block_mode_var.get() else "xor"
+                    decorated_doc = EncryptionDecorator(decorated_doc, encryption_key_var.get(), mode)
+                    session_keys.remember(fname, encryption_key_var.get())
                 
                 if statistics_var.get():
                     decorated_doc = StatisticsDecorator(decorated_doc)
                 
                 self.facade.document = decorated_doc
+                self.facade.text_format = None
                 decorators_metadata = collect_decorators_metadata(decorated_doc)
                 save_decorators_metadata(fname, decorators_metadata)
-                print(f"Saved decorators metadata: {decorators_metadata}")
-                print(f"Metadata stored in: D:\\Documents\\Data")
                 self.text.delete("1.0", tk.END)
                 self.last_text = ""
+                self.set_highlighter(ext)
                 new_win.destroy()
                 
             except Exception as e:
@@ -396,5 +727,69 @@ class EditorWindow:
         
         tk.Button(new_win, text="Create", command=create).pack(pady=10)
 
+    def follow_log(self):
+        from tkinter import filedialog
+        path = filedialog.askopenfilename(parent=self.root, title="Follow Log")
+        if path:
+            self.start_follow(path)
+
+    def start_follow(self, path: str):
+        """Показує кінець журналу й далі лише дописує нові рядки; редагування вимкнене."""
+        self.stop_follow()
+        try:
+            content = self.facade.follow(path, self.FOLLOW_LINES)
+        except (OSError, ValueError) as e:
+            messagebox.showerror("Error", f"Could not follow file: {e}")
+            return
+        # Автозбереження не повинно писати в журнал, за яким стежимо
+        self.current_file_path = None
+        self.set_highlighter(".txt")
+        self.text.config(state="normal")
+        self.text.delete("1.0", tk.END)
+        self.text.insert("1.0", content)
+        self.text.config(state="disabled")
+        self.text.see(tk.END)
+        self.root.title(f"Following {path}")
+        self._follow_job = self.root.after(self.FOLLOW_INTERVAL_MS, self.follow_tick)
+
+    def follow_tick(self):
+        self._follow_job = None
+        try:
+            appended = self.facade.follower.read_new(self.FOLLOW_MAX_LINES)
+        except (OSError, ValueError) as e:
+            # Інакше виняток обірве колбек Tk, і стеження тихо зупиниться
+            self.stop_follow()
+            messagebox.showerror("Error", f"Could not read the followed file: {e}")
+            return
+        if appended:
+            # Прокручуємо за новими рядками, лише якщо користувач дивиться в кінець
+            at_end = self.text.yview()[1] >= 1.0
+            self.text.config(state="normal")
+            self.text.insert("end-1c", appended)
+            lines = int(self.text.index("end-1c").split(".")[0])
+            if lines > self.FOLLOW_MAX_LINES:
+                self.text.delete("1.0", f"{lines - self.FOLLOW_MAX_LINES + 1}.0")
+            self.text.config(state="disabled")
+            if at_end:
+                self.text.see(tk.END)
+        self._follow_job = self.root.after(self.FOLLOW_INTERVAL_MS, self.follow_tick)
+
+    def stop_follow(self):
+        """Вимикає стеження; показаний текст стає новим незбереженим документом."""
+        if self.facade.follower is None:
+            return
+        if self._follow_job is not None:
+            self.root.after_cancel(self._follow_job)
+            self._follow_job = None
+        self.facade.stop_following()
+        self.text.config(state="normal")
+        content = self.text.get("1.0", tk.END)[:-1]
+        self.facade.new_document(content)
+        self.last_text = content
+        self.root.title("Text Editor")
+
     def on_close(self):
+        # Незавершені збереження дописуються до виходу
+        self.stop_follow()
+        self.io.close()
         self.root.destroy() 
\ No newline at end of file
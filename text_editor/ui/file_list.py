@@ -0,0 +1,70 @@
+from queue import Empty, Queue
+import os
+import threading
+import tkinter as tk
+
+
+class FileListLoader:
+    """Заповнює Listbox вмістом каталогу у фоні.
+
+    Запити з поля каталогу відкладаються на debounce_ms; читання каталогу
+    йде у фоновому потоці, а імена додаються у Listbox порціями через after().
+    """
+
+    def __init__(self, root, listbox, listing, debounce_ms: int = 200, chunk_size: int = 500):
+        self.root = root
+        self.listbox = listbox
+        self.listing = listing
+        self.debounce_ms = debounce_ms
+        self.chunk_size = chunk_size
+        self._generation = 0
+        self._pending = None
+
+    def request(self, directory: str, matches):
+        self.cancel()
+        generation = self._generation
+        self._pending = self.root.after(
+            self.debounce_ms, lambda: self._start(generation, directory, matches)
+        )
+
+    def cancel(self):
+        self._generation += 1
+        if self._pending is not None:
+            self.root.after_cancel(self._pending)
+            self._pending = None
+
+    def _start(self, generation: int, directory: str, matches):
+        self._pending = None
+        self.listbox.delete(0, tk.END)
+        if not os.path.isdir(directory):
+            return
+        queue = Queue()
+        threading.Thread(
+            target=self._produce, args=(generation, directory, queue), daemon=True
+        ).start()
+        self._poll(generation, queue, matches)
+
+    def _produce(self, generation: int, directory: str, queue: Queue):
+        try:
+            for chunk in self.listing.iter_entries(directory, self.chunk_size):
+                if generation != self._generation:
+                    return
+                queue.put([entry.name for entry in chunk])
+        except OSError:
+            pass
+        queue.put(None)
+
+    def _poll(self, generation: int, queue: Queue, matches):
+        if generation != self._generation:
+            return
+        try:
+            names = queue.get_nowait()
+        except Empty:
+            self.root.after(20, lambda: self._poll(generation, queue, matches))
+            return
+        if names is None:
+            return
+        selected = [name for name in names if matches(name)]
+        if selected:
+            self.listbox.insert(tk.END, *selected)
+        self.root.after(1, lambda: self._poll(generation, queue, matches))
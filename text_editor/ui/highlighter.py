@@ -0,0 +1,93 @@
+from text_editor.document.lexers import LineStateCache
+from text_editor.document.text_diff import edit_span
+
+
+class SyntaxHighlighter:
+    """Підсвічує синтаксис у tk.Text тегами.
+
+    За одне натискання клавіші перелексовується не більше budget рядків,
+    а теги ставляться лише на видимі рядки; решта доробляється через after().
+    """
+    TAG_STYLES = {
+        "heading": {"foreground": "#005cc5"},
+        "code": {"foreground": "#6a737d", "background": "#f6f8fa"},
+        "bold": {"foreground": "#24292e"},
+        "italic": {"foreground": "#6f42c1"},
+        "list": {"foreground": "#e36209"},
+        "tag": {"foreground": "#22863a"},
+        "attribute": {"foreground": "#6f42c1"},
+        "string": {"foreground": "#032f62"},
+        "comment": {"foreground": "#6a737d"},
+        "entity": {"foreground": "#e36209"},
+    }
+
+    def __init__(self, text, lexer, budget: int = 2000):
+        self.text = text
+        self.cache = LineStateCache(lexer) if lexer else None
+        self.budget = budget
+        self._pending = None
+        for tag, style in self.TAG_STYLES.items():
+            self.text.tag_configure(tag, **style)
+        self.text.bind("<Configure>", self._schedule, add="+")
+        # yscrollcommand викликається за будь-якої зміни видимої області: колесо
+        # (зокрема Button-4/5 у X11), стрілки, PageUp/PageDown, смуга прокрутки
+        self._yscroll = str(self.text.cget("yscrollcommand"))
+        self.text.configure(yscrollcommand=self._on_yscroll)
+
+    def set_lexer(self, lexer, content: str = ""):
+        """Змінює лексер; None вимикає підсвічування."""
+        for tag in self.TAG_STYLES:
+            self.text.tag_remove(tag, "1.0", "end")
+        self.cache = LineStateCache(lexer) if lexer else None
+        self.reset(content)
+
+    def reset(self, content: str):
+        if self.cache is None:
+            return
+        self.cache.reset(content.count("\n") + 1)
+        self.refresh()
+
+    def on_edit(self, old: str, new: str):
+        if self.cache is None:
+            return
+        start, old_end, new_end = edit_span(old, new)
+        line = old.count("\n", 0, start)
+        self.cache.edit(line, old.count("\n", start, old_end), new.count("\n", start, new_end))
+        self.refresh()
+
+    def refresh(self):
+        if self.cache is None:
+            return
+        done = self.cache.relex(self._line, self.budget)
+        self._tag_visible_lines()
+        if not done:
+            self._schedule()
+
+    def _on_yscroll(self, first, last):
+        if self._yscroll:
+            self.text.tk.eval(f"{self._yscroll} {first} {last}")
+        self._schedule()
+
+    def _schedule(self, event=None):
+        if self._pending is None:
+            self._pending = self.text.after(1, self._continue)
+
+    def _continue(self):
+        self._pending = None
+        self.refresh()
+
+    def _line(self, index: int) -> str:
+        return self.text.get(f"{index + 1}.0", f"{index + 1}.end")
+
+    def _visible_lines(self):
+        first = int(self.text.index("@0,0").split(".")[0]) - 1
+        last = int(self.text.index(f"@0,{self.text.winfo_height()}").split(".")[0]) - 1
+        return first, min(last, self.cache.line_count - 1)
+
+    def _tag_visible_lines(self):
+        first, last = self._visible_lines()
+        for tag in self.TAG_STYLES:
+            self.text.tag_remove(tag, f"{first + 1}.0", f"{last + 1}.end")
+        for index in range(first, last + 1):
+            for start, end, tag in self.cache.tokens(index, self._line(index)):
+                self.text.tag_add(tag, f"{index + 1}.{start}", f"{index + 1}.{end}")
@@ -0,0 +1,130 @@
+import time
+import tkinter as tk
+
+
+class TkClipboard:
+    """Системний буфер обміну через Tk (інтерфейс як у services.clipboard.Clipboard)."""
+
+    def __init__(self, root):
+        self.root = root
+
+    def get(self) -> str:
+        try:
+            return self.root.clipboard_get()
+        except tk.TclError:
+            return ""
+
+    def set(self, text: str):
+        self.root.clipboard_clear()
+        self.root.clipboard_append(text)
+        self.root.update()
+
+
+class ChunkedInsert:
+    """Вставляє великий текст у tk.Text частинами через after().
+
+    За крок вставляється щонайменше одна частина з chunk_size символів
+    і далі стільки, скільки вміщується в budget_ms, тож цикл подій не зупиняється. Поки вставка
+    триває, віджет недоступний для введення; вікно прогресу має кнопку
+    Cancel, і cancel() прибирає вже вставлене.
+    """
+
+    _START = "chunked_insert_start"
+    _END = "chunked_insert_end"
+
+    def __init__(self, widget, index: str, text: str, on_done=None, on_cancel=None,
+                 chunk_size: int = 256 * 1024, budget_ms: int = 20, progress: bool = True):
+        self.widget = widget
+        self.index = index
+        self.text = text
+        self.on_done = on_done
+        self.on_cancel = on_cancel
+        self.chunk_size = chunk_size
+        self.budget_ms = budget_ms
+        self.position = 0
+        self._job = None
+        self._progress = None
+        self._show_progress = progress
+
+    @property
+    def done(self) -> bool:
+        return self.position >= len(self.text)
+
+    def start(self):
+        self.widget.mark_set(self._START, self.index)
+        self.widget.mark_gravity(self._START, "left")
+        self.widget.mark_set(self._END, self.index)
+        self.widget.mark_gravity(self._END, "right")
+        if self._show_progress:
+            self._open_progress()
+        self.widget.config(state="disabled")
+        self._job = self.widget.after(1, self._step)
+
+    def _open_progress(self):
+        from tkinter import ttk
+        window = tk.Toplevel(self.widget)
+        window.title("Pasting")
+        window.resizable(False, False)
+        self._label = tk.Label(window, text="")
+        self._label.pack(padx=10, pady=(10, 0))
+        self._bar = ttk.Progressbar(window, length=300, maximum=len(self.text))
+        self._bar.pack(padx=10, pady=10)
+        tk.Button(window, text="Cancel", command=self.cancel).pack(pady=(0, 10))
+        window.bind("<Escape>", lambda e: self.cancel())
+        window.protocol("WM_DELETE_WINDOW", self.cancel)
+        window.transient(self.widget.winfo_toplevel())
+        # Меню й інші вікна недоступні, поки вставка не завершиться
+        try:
+            window.wait_visibility()
+            window.grab_set()
+        except tk.TclError:
+            pass
+        self._progress = window
+        self._update_progress()
+
+    def _update_progress(self):
+        if self._progress is None:
+            return
+        self._bar["value"] = self.position
+        self._label["text"] = f"Pasting {self.position / 2 ** 20:.1f} of {len(self.text) / 2 ** 20:.1f} MB"
+
+    def _step(self):
+        self._job = None
+        deadline = time.perf_counter() + self.budget_ms / 1000
+        self.widget.config(state="normal")
+        try:
+            # Хоча б одна частина за крок, навіть якщо бюджет уже вичерпано
+            while True:
+                chunk = self.text[self.position:self.position + self.chunk_size]
+                self.widget.insert(self._END, chunk)
+                self.position += len(chunk)
+                if self.done or time.perf_counter() >= deadline:
+                    break
+        finally:
+            self.widget.config(state="disabled")
+        self._update_progress()
+        if self.done:
+            self._finish()
+            if self.on_done:
+                self.on_done()
+        else:
+            self._job = self.widget.after(1, self._step)
+
+    def cancel(self):
+        """Зупиняє вставку й видаляє вже вставлену частину."""
+        if self._job is None:
+            return
+        self.widget.after_cancel(self._job)
+        self._job = None
+        self.widget.config(state="normal")
+        self.widget.delete(self._START, self._END)
+        self._finish()
+        if self.on_cancel:
+            self.on_cancel()
+
+    def _finish(self):
+        self.widget.config(state="normal")
+        self.widget.mark_unset(self._START, self._END)
+        if self._progress is not None:
+            self._progress.destroy()
+            self._progress = None